@@ -0,0 +1,388 @@
+"""
+Columnar (Parquet) analytics export of answers, check-ins and telemetry.
+
+Rows are streamed from the database in id order through a server-side cursor and written in record batches to
+Hive-style partitions, `<out>/<dataset>/date=YYYY-MM-DD/group=<group>/part-<run>-<n>.parquet`, which pandas, polars,
+DuckDB and Spark all read as partition columns. Telemetry `payload` JSON is flattened into typed columns for the
+known event types (`question`, `tips`, `stt`, `latency`, `session_end`); the raw payload is kept alongside.
+
+`--incremental` only exports rows whose id is above the per-dataset watermark stored in `<out>/_watermarks.json`.
+Ids are assigned at insert time but become visible at commit, so with several writers a lower id can show up after a
+higher one was exported. Each run therefore stops before the first row created less than `--settle-seconds` ago
+(`EXPORT_SETTLE_S`, longer than the write-behind delay plus the slowest insert transaction): every id below that row
+has been committed, so advancing the watermark past them never skips one. Parts are written under a hidden temporary
+name and renamed once the dataset has been exported; a failed run deletes its files and leaves the watermark alone.
+
+A full (non-incremental) run refuses a dataset directory that already holds parts, since its rows would be written a
+second time; `--overwrite` deletes those datasets first.
+
+    python -m app.columnar --out exports/parquet
+    python -m app.columnar --out exports/parquet --incremental --dataset telemetry
+    python -m app.columnar --out exports/parquet --overwrite
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import func
+from sqlmodel import SQLModel, select
+
+from app.db import get_session
+from app.export import stream_rows
+from app.models import AnswerRecord, CheckInRecord, TelemetryRecord
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow as pa
+
+LOG = logging.getLogger("interview.columnar")
+
+PARQUET_BATCH_ROWS = int(os.getenv("PARQUET_BATCH_ROWS", "50000"))
+EXPORT_SETTLE_S = float(os.getenv("EXPORT_SETTLE_S", "300"))
+MAX_OPEN_WRITERS = 32
+WATERMARK_FILE = "_watermarks.json"
+
+Row = Dict[str, Any]
+
+
+def _schema(dataset: str) -> "pa.Schema":
+    import pyarrow as pa
+
+    ts = pa.timestamp("us")
+    common = [("id", pa.int64()), ("session_id", pa.string()), ("group_name", pa.string()), ("created_at", ts)]
+    if dataset == "answers":
+        fields = common + [
+            ("turn", pa.int32()),
+            ("style", pa.string()),
+            ("answer", pa.string()),
+            ("speaking_rate", pa.float64()),
+            ("pause_ratio", pa.float64()),
+            ("gaze", pa.float64()),
+            ("fillers", pa.int32()),
+        ]
+    elif dataset == "checkins":
+        fields = common + [("confidence", pa.int32()), ("stress", pa.int32())]
+    else:
+        fields = common + [
+            ("event_type", pa.string()),
+            ("latency_ms", pa.float64()),
+            ("turn", pa.int32()),
+            # question
+            ("question", pa.string()),
+            ("question_answer_turn", pa.int32()),
+            ("question_preface", pa.string()),
+            ("question_style", pa.string()),
+            ("question_pack", pa.string()),
+            ("question_difficulty", pa.string()),
+            ("question_source", pa.string()),
+            # tips
+            ("tips_count", pa.int32()),
+            ("tips_summaries", pa.list_(pa.string())),
+            # stt
+            ("stt_language", pa.string()),
+            ("stt_duration_s", pa.float64()),
+            ("stt_streaming", pa.bool_()),
+            ("stt_stream_ms", pa.float64()),
+            ("stt_decode_calls", pa.int32()),
+            # session_end
+            ("end_reason", pa.string()),
+            ("payload", pa.string()),
+        ]
+    return pa.schema(fields)
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def flatten_telemetry(row: Row) -> Row:
+    """Spread the JSON payload of known event types into typed columns."""
+    try:
+        data = json.loads(row.get("payload") or "{}")
+    except ValueError:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    event = row.get("event_type")
+    flat: Row = {**row, "turn": _as_int(data.get("turn"))}
+    if event == "question":
+        flat.update(
+            question=_as_str(data.get("question")),
+            question_answer_turn=_as_int(data.get("answer_turn")),
+            question_preface=_as_str(data.get("preface")),
+            question_style=_as_str(data.get("style")),
+            question_pack=_as_str(data.get("pack")),
+            question_difficulty=_as_str(data.get("difficulty")),
+            question_source=_as_str(data.get("source")),
+        )
+    elif event == "tips":
+        items = data.get("items") if isinstance(data.get("items"), list) else []
+        flat.update(
+            tips_count=len(items),
+            tips_summaries=[str(item.get("summary", "")) if isinstance(item, dict) else str(item) for item in items],
+        )
+    elif event == "stt":
+        flat.update(
+            stt_language=_as_str(data.get("language")),
+            stt_duration_s=_as_float(data.get("duration")),
+            stt_streaming=bool(data.get("streaming", False)),
+            stt_stream_ms=_as_float(data.get("stream_ms")),
+            stt_decode_calls=_as_int(data.get("decode_calls")),
+        )
+    elif event == "session_end":
+        flat["end_reason"] = _as_str(data.get("reason"))
+    # `latency` events carry only `turn` in the payload; the value itself is the latency_ms column.
+    return flat
+
+
+class Dataset:
+    def __init__(self, name: str, model: Type[SQLModel], transform: Optional[Callable[[Row], Row]] = None) -> None:
+        self.name = name
+        self.model = model
+        self.transform = transform
+
+
+DATASETS: Sequence[Dataset] = (
+    Dataset("answers", AnswerRecord),
+    Dataset("checkins", CheckInRecord),
+    Dataset("telemetry", TelemetryRecord, flatten_telemetry),
+)
+
+
+def partition_of(row: Row) -> Tuple[str, str]:
+    created_at = row.get("created_at")
+    day = created_at.date().isoformat() if isinstance(created_at, datetime) else "unknown"
+    return day, row.get("group_name") or "none"
+
+
+class PartitionedWriter:
+    """Buffers rows per (date, group) partition and appends them to Parquet files as record batches.
+
+    Files get their final `part-*.parquet` names only in `commit`; until then they are hidden (`.part-*.tmp`), so
+    readers skip them, and `abort` deletes them.
+    """
+
+    def __init__(self, root: Path, schema: "pa.Schema", run_id: str, batch_rows: int = PARQUET_BATCH_ROWS) -> None:
+        self.root = root
+        self.schema = schema
+        self.run_id = run_id
+        self.batch_rows = batch_rows
+        self.rows_written = 0
+        self.files: List[Path] = []
+        self._pending: List[Tuple[Path, Path]] = []  # (temporary, final) per part file
+        self._buffers: Dict[Tuple[str, str], List[Row]] = {}
+        self._writers: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._part = 0
+
+    def add(self, row: Row) -> None:
+        key = partition_of(row)
+        buffer = self._buffers.setdefault(key, [])
+        buffer.append(row)
+        if len(buffer) >= self.batch_rows:
+            self._flush(key)
+
+    def close(self) -> None:
+        for key in list(self._buffers):
+            self._flush(key)
+        self._close_writers()
+
+    def commit(self) -> None:
+        """Flush and close everything, then give every part its final name."""
+        self.close()
+        for tmp, path in self._pending:
+            tmp.replace(path)
+            self.files.append(path)
+        self._pending.clear()
+
+    def abort(self) -> None:
+        """Drop this run's buffered rows and delete its unfinished part files."""
+        self._buffers.clear()
+        self._close_writers()
+        for tmp, _ in self._pending:
+            tmp.unlink(missing_ok=True)
+        self._pending.clear()
+        self.rows_written = 0
+
+    def _close_writers(self) -> None:
+        for writer in self._writers.values():
+            try:
+                writer.close()
+            except Exception as exc:  # pragma: no cover - only reached while aborting
+                LOG.warning("Closing a Parquet writer failed: %s", exc)
+        self._writers.clear()
+
+    def _flush(self, key: Tuple[str, str]) -> None:
+        import pyarrow as pa
+
+        rows = self._buffers.pop(key, [])
+        if not rows:
+            return
+        batch = pa.RecordBatch.from_pylist(rows, schema=self.schema)
+        self._writer(key).write_batch(batch)
+        self.rows_written += len(rows)
+
+    def _writer(self, key: Tuple[str, str]) -> Any:
+        import pyarrow.parquet as pq
+
+        writer = self._writers.get(key)
+        if writer is not None:
+            self._writers.move_to_end(key)
+            return writer
+        if len(self._writers) >= MAX_OPEN_WRITERS:
+            # A long backfill touches many days; keep file handles bounded. A reopened partition gets a new part.
+            _, oldest = self._writers.popitem(last=False)
+            oldest.close()
+        day, group = key
+        directory = self.root / f"date={day}" / f"group={group}"
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"part-{self.run_id}-{self._part:04d}.parquet"
+        path, tmp = directory / name, directory / f".{name}.tmp"
+        self._part += 1
+        writer = pq.ParquetWriter(str(tmp), self.schema, compression="zstd")
+        self._writers[key] = writer
+        self._pending.append((tmp, path))
+        return writer
+
+
+def _has_parts(root: Path) -> bool:
+    return root.is_dir() and any(root.rglob("*.parquet"))
+
+
+def read_watermarks(out: Path) -> Dict[str, int]:
+    path = out / WATERMARK_FILE
+    if not path.exists():
+        return {}
+    return {name: int(value) for name, value in json.loads(path.read_text()).items()}
+
+
+def write_watermarks(out: Path, watermarks: Dict[str, int]) -> None:
+    path = out / WATERMARK_FILE
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(watermarks, indent=2, sort_keys=True))
+    tmp.replace(path)
+
+
+async def export_dataset(
+    dataset: Dataset,
+    out: Path,
+    after_id: int = 0,
+    run_id: Optional[str] = None,
+    settle_seconds: float = EXPORT_SETTLE_S,
+) -> Dict[str, Any]:
+    """Export settled rows with id > `after_id`; returns counts and the highest id written."""
+    table: Any = dataset.model.__table__  # type: ignore[attr-defined]
+    schema = _schema(dataset.name)
+    writer = PartitionedWriter(out / dataset.name, schema, run_id or uuid.uuid4().hex[:12])
+    last_id = after_id
+    try:
+        async with get_session() as session:
+            stmt = select(table).where(table.c.id > after_id).order_by(table.c.id)
+            if settle_seconds > 0:
+                # Rows below the first recent one are all committed; it and everything after wait for the next run.
+                cutoff = datetime.utcnow() - timedelta(seconds=settle_seconds)
+                first_recent = (
+                    await session.execute(
+                        select(func.min(table.c.id)).where(table.c.id > after_id, table.c.created_at >= cutoff)
+                    )
+                ).scalar()
+                if first_recent is not None:
+                    stmt = stmt.where(table.c.id < first_recent)
+            async for row in stream_rows(session, stmt):
+                if dataset.transform is not None:
+                    row = dataset.transform(row)
+                writer.add(row)
+                last_id = row["id"]
+    except BaseException:
+        writer.abort()
+        raise
+    writer.commit()
+    return {"rows": writer.rows_written, "files": len(writer.files), "last_id": last_id}
+
+
+async def export_parquet(
+    out: Path,
+    datasets: Optional[Sequence[str]] = None,
+    incremental: bool = False,
+    settle_seconds: float = EXPORT_SETTLE_S,
+    overwrite: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    out.mkdir(parents=True, exist_ok=True)
+    selected = [dataset for dataset in DATASETS if not datasets or dataset.name in datasets]
+    if not incremental:
+        # A full export starts from id 0, so parts already in the directory would duplicate every row.
+        existing = [dataset.name for dataset in selected if _has_parts(out / dataset.name)]
+        if existing and not overwrite:
+            raise FileExistsError(
+                f"{out} already has {', '.join(existing)} parts; run incrementally, overwrite, or use an empty dir"
+            )
+        for name in existing:
+            shutil.rmtree(out / name)
+    watermarks = read_watermarks(out)
+    run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%S") + "-" + uuid.uuid4().hex[:6]
+    results: Dict[str, Dict[str, Any]] = {}
+    for dataset in selected:
+        if not incremental:
+            watermarks.pop(dataset.name, None)
+        result = await export_dataset(dataset, out, watermarks.get(dataset.name, 0), run_id, settle_seconds)
+        results[dataset.name] = result
+        watermarks[dataset.name] = result["last_id"]
+        # Persist per dataset so a failure later in the run doesn't re-export what already landed.
+        write_watermarks(out, watermarks)
+        LOG.info("Exported %s: %s rows in %s files", dataset.name, result["rows"], result["files"])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export answers, check-ins and telemetry as partitioned Parquet.")
+    parser.add_argument("--out", default="exports/parquet", help="Output directory (one subdirectory per dataset).")
+    parser.add_argument(
+        "--dataset", action="append", choices=[d.name for d in DATASETS], help="Limit to a dataset (repeatable)."
+    )
+    parser.add_argument("--incremental", action="store_true", help="Only rows added since the last watermark.")
+    parser.add_argument(
+        "--overwrite", action="store_true", help="Without --incremental, first delete the datasets' existing parts."
+    )
+    parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=EXPORT_SETTLE_S,
+        help="Leave rows newer than this for the next run, so late commits aren't skipped (0 = export everything).",
+    )
+    args = parser.parse_args()
+
+    try:
+        results = asyncio.run(
+            export_parquet(Path(args.out), args.dataset, args.incremental, args.settle_seconds, args.overwrite)
+        )
+    except FileExistsError as exc:
+        parser.error(str(exc))
+    for name, result in results.items():
+        print(f"[parquet] {name}: {result['rows']} rows, {result['files']} files (watermark id {result['last_id']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,42 @@ from __future__ import annotations
 
 import os
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import AsyncIterator
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./data.db")
+# Run `alembic upgrade head` on startup; with 0 only missing tables are created (no indexes on old databases).
+DB_MIGRATE = os.getenv("DB_MIGRATE", "1").lower() in ("1", "true", "yes")
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
 
 engine: AsyncEngine = create_async_engine(DATABASE_URL, echo=False, future=True)
 async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
+def upgrade_schema(connection: Connection) -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["connection"] = connection
+    command.upgrade(config, "head")
+
+
 async def init_db() -> None:
     # Import models inside to avoid circular imports.
     from app import models  # noqa: F401
 
+    if DB_MIGRATE:
+        async with engine.connect() as conn:
+            await conn.run_sync(upgrade_schema)
+            await conn.commit()
+        return
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
@@ -0,0 +1,143 @@
+"""
+Streaming exports: `/export/session/{id}`, `/export/session/{id}.ndjson` and the bulk `/export/sessions.ndjson`.
+
+Rows are read through a server-side cursor (`AsyncSession.stream` with `yield_per`) as plain column mappings and
+encoded as they arrive. Encoded output is coalesced into ~64 KiB chunks for the `StreamingResponse`, so memory stays
+flat however many rows are exported.
+
+NDJSON lines are flat records tagged with `record` (`session`, `answer`, `checkin`, `telemetry`): all matching
+sessions first, then each child table in id order. Join on `session_id` to regroup them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlmodel import SQLModel, select
+
+from app.db import get_session
+from app.history import filter_sessions
+from app.models import AnswerRecord, CheckInRecord, SessionRecord, TelemetryRecord
+
+EXPORT_BATCH_ROWS = int(os.getenv("EXPORT_BATCH_ROWS", "1000"))
+CHUNK_BYTES = 64 * 1024
+
+# (record tag, document key, model) for the per-session child tables.
+CHILD_TABLES: Sequence[Tuple[str, str, Type[SQLModel]]] = (
+    ("answer", "answers", AnswerRecord),
+    ("checkin", "checkins", CheckInRecord),
+    ("telemetry", "telemetry", TelemetryRecord),
+)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def encode(row: Dict[str, Any]) -> str:
+    return json.dumps(row, default=_json_default, separators=(",", ":"))
+
+
+async def stream_rows(session: Any, stmt: Any) -> AsyncIterator[Dict[str, Any]]:
+    result = await session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_ROWS))
+    async for row in result.mappings():
+        yield dict(row)
+
+
+async def chunked(pieces: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Coalesce small encoded pieces into chunks of about `CHUNK_BYTES`."""
+    buffer: List[str] = []
+    size = 0
+    async for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= CHUNK_BYTES:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def _table(model: Type[SQLModel]) -> Any:
+    return model.__table__  # type: ignore[attr-defined]
+
+
+async def session_exists(session_id: str) -> bool:
+    async with get_session() as session:
+        return await session.get(SessionRecord, session_id) is not None
+
+
+async def session_document(session_id: str) -> AsyncIterator[bytes]:
+    """The classic export document (`{"session": ..., "answers": [...], ...}`), written incrementally."""
+
+    async def pieces() -> AsyncIterator[str]:
+        sessions = _table(SessionRecord)
+        async with get_session() as session:
+            row = (await session.execute(select(sessions).where(sessions.c.id == session_id))).mappings().first()
+            yield '{"session":' + encode(dict(row) if row else {})
+            for _, key, model in CHILD_TABLES:
+                table = _table(model)
+                yield f',"{key}":['
+                sep = ""
+                stmt = select(table).where(table.c.session_id == session_id).order_by(table.c.id)
+                async for child in stream_rows(session, stmt):
+                    yield sep + encode(child)
+                    sep = ","
+                yield "]"
+            yield "}"
+
+    async for chunk in chunked(pieces()):
+        yield chunk
+
+
+async def session_ndjson(session_id: str) -> AsyncIterator[bytes]:
+    async def pieces() -> AsyncIterator[str]:
+        sessions = _table(SessionRecord)
+        async with get_session() as session:
+            stmt = select(sessions).where(sessions.c.id == session_id)
+            async for row in stream_rows(session, stmt):
+                yield encode({"record": "session", **row}) + "\n"
+            for tag, _, model in CHILD_TABLES:
+                table = _table(model)
+                stmt = select(table).where(table.c.session_id == session_id).order_by(table.c.id)
+                async for row in stream_rows(session, stmt):
+                    yield encode({"record": tag, **row}) + "\n"
+
+    async for chunk in chunked(pieces()):
+        yield chunk
+
+
+async def sessions_ndjson(
+    group: Optional[str] = None,
+    style: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    include: Sequence[str] = ("answer", "checkin", "telemetry"),
+) -> AsyncIterator[bytes]:
+    """Bulk export of every session matching the `/sessions` filters, plus the chosen child records."""
+    sessions = _table(SessionRecord)
+    filtered = any(value is not None for value in (group, style, since, until))
+
+    async def pieces() -> AsyncIterator[str]:
+        async with get_session() as session:
+            stmt = filter_sessions(select(sessions), group=group, style=style, since=since, until=until)
+            async for row in stream_rows(session, stmt.order_by(sessions.c.created_at, sessions.c.id)):
+                yield encode({"record": "session", **row}) + "\n"
+            for tag, _, model in CHILD_TABLES:
+                if tag not in include:
+                    continue
+                table = _table(model)
+                stmt = select(table).order_by(table.c.id)
+                if filtered:
+                    ids = filter_sessions(select(sessions.c.id), group=group, style=style, since=since, until=until)
+                    stmt = stmt.where(table.c.session_id.in_(ids))
+                async for row in stream_rows(session, stmt):
+                    yield encode({"record": tag, **row}) + "\n"
+
+    async for chunk in chunked(pieces()):
+        yield chunk
@@ -0,0 +1,107 @@
+"""
+Session listing for `GET /sessions` (the history page).
+
+One query per page: the page of `SessionRecord` rows is picked first (keyset on `(created_at, id)`, so deep pages
+cost the same as the first one), then left-joined to `AnswerRecord` and aggregated in SQL. Cursors are opaque
+URL-safe tokens encoding the last row's `(created_at, id)`.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Float, and_, cast, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import AnswerRecord, SessionRecord
+
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, session_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), session_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, session_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(session_id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor(f"invalid cursor: {cursor!r}") from exc
+
+
+def filter_sessions(
+    stmt: Any,
+    group: Optional[str] = None,
+    style: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Any:
+    """Apply the `/sessions` filters (group, style, `since <= created_at < until`) to a select over sessions."""
+    sessions: Any = SessionRecord
+    if group:
+        stmt = stmt.where(sessions.group_name == group)
+    if style:
+        stmt = stmt.where(sessions.style == style)
+    if since:
+        stmt = stmt.where(sessions.created_at >= since)
+    if until:
+        stmt = stmt.where(sessions.created_at < until)
+    return stmt
+
+
+async def list_sessions_page(
+    session: AsyncSession,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    group: Optional[str] = None,
+    style: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Newest-first page of sessions with their per-session answer aggregates."""
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    sessions: Any = SessionRecord
+    answers: Any = AnswerRecord
+
+    page = select(sessions).order_by(sessions.created_at.desc(), sessions.id.desc()).limit(limit + 1)
+    if cursor:
+        after_at, after_id = decode_cursor(cursor)
+        page = page.where(
+            or_(sessions.created_at < after_at, and_(sessions.created_at == after_at, sessions.id < after_id))
+        )
+    page = filter_sessions(page, group=group, style=style, since=since, until=until)
+    page_cte = page.cte("page")
+
+    stmt = (
+        select(
+            page_cte,
+            func.count(answers.id).label("n_answers"),
+            func.coalesce(func.max(answers.turn), 0).label("last_turn"),
+            func.max(answers.created_at).label("last_answer_at"),
+            func.avg(answers.speaking_rate).label("avg_speaking_rate"),
+            func.avg(answers.pause_ratio).label("avg_pause_ratio"),
+            func.avg(answers.gaze).label("avg_gaze"),
+            func.avg(cast(answers.fillers, Float)).label("avg_fillers"),
+        )
+        .select_from(page_cte.outerjoin(answers, answers.session_id == page_cte.c.id))
+        .group_by(*page_cte.c)
+        .order_by(page_cte.c.created_at.desc(), page_cte.c.id.desc())
+    )
+    rows = (await session.execute(stmt)).mappings().all()
+
+    items: List[Dict[str, Any]] = [dict(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,318 @@
+"""
+Prometheus-style metrics for `GET /metrics`.
+
+Counters, gauges and fixed-bucket histograms live in this process and are rendered in the Prometheus text
+exposition format (0.0.4), so any Prometheus-compatible scraper can compute percentiles with
+`histogram_quantile()`. Each process exposes its own series; in a split deployment scrape the gateway and every
+worker. Recording is a dict lookup and a few additions under a lock, so it is safe from worker threads.
+
+Instrumented stages:
+- LLM calls: `interview_llm_request_seconds{kind, outcome}`. `kind` is coaching, question or clarification.
+  `outcome` is one of ok, timeout, non_200, parse_fail, error, fallback (no LLM configured), or cancelled
+  (e.g. a question prefetch that was no longer needed).
+- Whisper: decode seconds, audio seconds and real-time factor per replica.
+- TTS: synthesis seconds by output format, plus cache hits and misses.
+- Database: commit latency for every ORM session commit, including the flush it triggers.
+- WebSocket: `/ws/interview` handling time by message type.
+- Event loop: scheduling lag, sampled every `LOOP_LAG_INTERVAL_MS`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import math
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+LOG = logging.getLogger("interview.instrumentation")
+
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL_MS", "250")) / 1000.0
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+RTF_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 4.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[Sample]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for name, labels, value in self.samples():
+            if labels:
+                rendered = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}_total", dict(zip(self.labelnames, key)), value
+
+
+class Gauge(Metric):
+    """A settable gauge, or a callback gauge when `fn` is given (read at scrape time)."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        fn: Optional[Callable[[], float]] = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.fn = fn
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def samples(self) -> Iterator[Sample]:
+        if self.fn is not None:
+            try:
+                yield self.name, {}, float(self.fn())
+            except Exception as exc:  # pragma: no cover - a broken callback must not break the scrape
+                LOG.warning("Gauge %s callback failed: %s", self.name, exc)
+            return
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, dict(zip(self.labelnames, key)), value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (non-cumulative, last = +Inf)], sum, count.
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = ([0] * (len(self.buckets) + 1), [0.0, 0.0])
+                self._values[key] = entry
+            entry[0][index] += 1
+            entry[1][0] += value
+            entry[1][1] += 1
+
+    def time(self, **labels: Any) -> "_Timer":
+        return _Timer(self, labels)
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            items = sorted((key, (list(counts), list(totals))) for key, (counts, totals) in self._values.items())
+        for key, (counts, (total, count)) in items:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]) -> None:
+        self.histogram = histogram
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+REGISTRY: List[Metric] = []
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+LLM_SECONDS = Histogram(
+    "interview_llm_request_seconds", "LLM call duration by call kind and outcome.", ("kind", "outcome")
+)
+WHISPER_DECODE_SECONDS = Histogram(
+    "interview_whisper_decode_seconds", "Whisper transcription time including pool queueing.", ("replica",)
+)
+WHISPER_AUDIO_SECONDS = Histogram(
+    "interview_whisper_audio_seconds", "Duration of the audio sent to Whisper.", ("replica",)
+)
+WHISPER_RTF = Histogram(
+    "interview_whisper_rtf", "Whisper real-time factor (decode seconds / audio seconds).", ("replica",), RTF_BUCKETS
+)
+TTS_SYNTH_SECONDS = Histogram("interview_tts_synthesis_seconds", "XTTS synthesis time by output format.", ("format",))
+TTS_CACHE_REQUESTS = Counter("interview_tts_cache_requests", "TTS disk cache lookups by result.", ("result",))
+DB_COMMIT_SECONDS = Histogram("interview_db_commit_seconds", "ORM session commit latency (flush + COMMIT).")
+WS_MESSAGE_SECONDS = Histogram(
+    "interview_ws_message_seconds", "Time to handle one /ws/interview message by type.", ("msg_type",)
+)
+LOOP_LAG_SECONDS = Histogram(
+    "interview_event_loop_lag_seconds", "How late the event loop ran a timer scheduled for now.", (), LAG_BUCKETS
+)
+
+# Outcome of the LLM call running in the current task, set at each exit point of the `llm_generate_*` functions.
+_llm_outcome: "contextvars.ContextVar[Optional[List[str]]]" = contextvars.ContextVar("llm_outcome", default=None)
+
+T = TypeVar("T")
+
+
+def set_llm_outcome(outcome: str) -> None:
+    holder = _llm_outcome.get()
+    if holder is not None:
+        holder[0] = outcome
+
+
+def timed_llm(kind: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Record an `llm_generate_*` call in `interview_llm_request_seconds`.
+
+    A result of None with no outcome set counts as `parse_fail`; anything else counts as `ok`.
+    """
+
+    def decorate(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            holder: List[str] = [""]
+            token = _llm_outcome.set(holder)
+            started = time.perf_counter()
+            result: Optional[T] = None
+            try:
+                result = await fn(*args, **kwargs)
+            except asyncio.CancelledError:
+                holder[0] = holder[0] or "cancelled"
+                raise
+            except Exception:
+                holder[0] = holder[0] or "error"
+                raise
+            finally:
+                _llm_outcome.reset(token)
+                outcome = holder[0]
+                if not outcome:
+                    outcome = "ok" if result is not None else "parse_fail"
+                LLM_SECONDS.observe(time.perf_counter() - started, kind=kind, outcome=outcome)
+            return result  # type: ignore[return-value]
+
+        return wrapper
+
+    return decorate
+
+
+def llm_failure_outcome(exc: BaseException) -> str:
+    import httpx
+
+    return "timeout" if isinstance(exc, (httpx.TimeoutException, asyncio.TimeoutError)) else "error"
+
+
+def observe_whisper(replica: str, elapsed: float, duration: Optional[float]) -> None:
+    WHISPER_DECODE_SECONDS.observe(elapsed, replica=replica)
+    if duration:
+        WHISPER_AUDIO_SECONDS.observe(duration, replica=replica)
+        WHISPER_RTF.observe(elapsed / duration, replica=replica)
+
+
+def instrument_db_sessions() -> None:
+    """Time every ORM commit (sync sessions and the ones behind `AsyncSession`)."""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    if event.contains(Session, "before_commit", _before_commit):
+        return
+    event.listen(Session, "before_commit", _before_commit)
+    event.listen(Session, "after_commit", _after_commit)
+
+
+def _before_commit(session: Any) -> None:
+    session.info["commit_started"] = time.perf_counter()
+
+
+def _after_commit(session: Any) -> None:
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        DB_COMMIT_SECONDS.observe(time.perf_counter() - started)
+
+
+async def monitor_event_loop(interval: float = LOOP_LAG_INTERVAL) -> None:
+    """Sleep `interval` at a time and record how much later than scheduled the loop woke us."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        LOOP_LAG_SECONDS.observe(max(0.0, loop.time() - expected))
@@ -0,0 +1,648 @@
+"""
+Job queue between the WebSocket/REST gateway and the STT/TTS inference workers.
+
+In a split deployment the gateway (`SERVICE_ROLE=api`) holds the sockets and REST endpoints and hands each
+transcription or synthesis to a worker process (`SERVICE_ROLE=stt` / `tts`) over a swappable transport
+(`JOB_TRANSPORT`):
+
+- `inprocess`: calls a local `JobServer` directly (same code path as a split deployment, one process).
+- `unix`: the gateway connects to each worker's Unix socket, one request per connection. It probes every
+  worker's health in the background and only dispatches to healthy workers with spare capacity (each
+  worker advertises its concurrency). A worker that reports itself saturated spills the job to the next one.
+- `redis`: jobs are pushed onto a list per tier in any Redis-compatible server (Redis, Valkey, KeyDB,
+  Dragonfly). Each worker runs one consumer per unit of concurrency, so only live workers pull jobs.
+  Workers publish heartbeats; the gateway fails fast when a tier has none.
+
+Frames are `>II` (header length, blob length), a JSON header and an optional binary blob (audio).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.stt import SttSaturated
+
+LOG = logging.getLogger("interview.jobs")
+
+JOB_TRANSPORT = os.getenv("JOB_TRANSPORT", "").lower()
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT_S", "60"))
+JOB_HEALTH_INTERVAL = float(os.getenv("JOB_HEALTH_INTERVAL_S", "2"))
+JOB_CONCURRENCY = int(os.getenv("JOB_CONCURRENCY", "4"))
+JOB_REDIS_URL = os.getenv("JOB_REDIS_URL", "redis://localhost:6379/0")
+
+_FRAME = struct.Struct(">II")
+Frame = Tuple[Dict[str, Any], bytes]
+Handler = Callable[[Dict[str, Any], bytes], Awaitable[Frame]]
+
+
+class JobError(Exception):
+    def __init__(self, code: str, message: str = "", retry_after: int = 1) -> None:
+        super().__init__(f"{code}: {message}" if message else code)
+        self.code = code
+        self.retry_after = retry_after
+
+
+def pack(header: Dict[str, Any], blob: bytes = b"") -> bytes:
+    head = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return _FRAME.pack(len(head), len(blob)) + head + blob
+
+
+def unpack(data: bytes) -> Frame:
+    head_len, blob_len = _FRAME.unpack_from(data)
+    start = _FRAME.size
+    return json.loads(data[start : start + head_len]), bytes(data[start + head_len : start + head_len + blob_len])
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Frame:
+    head_len, blob_len = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    header = json.loads(await reader.readexactly(head_len))
+    blob = await reader.readexactly(blob_len) if blob_len else b""
+    return header, blob
+
+
+def encode_audio(audio: Any) -> Tuple[str, bytes]:
+    """Audio for the wire: float32 PCM arrays as-is, anything else (bytes / file) as the encoded container."""
+    if hasattr(audio, "shape"):
+        return "f32", np.asarray(audio, dtype="<f4").tobytes()
+    if hasattr(audio, "read"):
+        audio = audio.read()
+    return "encoded", bytes(audio)
+
+
+def decode_audio(kind: str, blob: bytes) -> Any:
+    return np.frombuffer(blob, dtype="<f4").copy() if kind == "f32" else blob
+
+
+def _raise_for(header: Dict[str, Any]) -> None:
+    error = header.get("error")
+    if error:
+        raise JobError(error, header.get("message", ""), int(header.get("retry_after", 1)))
+
+
+def _reply_to_of(data: bytes) -> Optional[str]:
+    """Best-effort `reply_to` of a frame whose blob (or length prefix) is broken, so the caller isn't left waiting."""
+    try:
+        head_len, _ = _FRAME.unpack_from(data)
+        reply_to = json.loads(data[_FRAME.size : _FRAME.size + head_len]).get("reply_to")
+    except (struct.error, ValueError, AttributeError):
+        return None
+    return reply_to if isinstance(reply_to, str) else None
+
+
+class JobServer:
+    """Worker side: runs jobs for one tier with bounded concurrency and reports health for dispatch."""
+
+    def __init__(
+        self,
+        tier: str,
+        handlers: Dict[str, Handler],
+        ready: Callable[[], bool],
+        capacity: int = JOB_CONCURRENCY,
+        info: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> None:
+        self.tier = tier
+        self.handlers = handlers
+        self.is_ready = ready
+        self.capacity = max(1, capacity)
+        self.info = info
+        self.worker_id = f"{tier}-{uuid.uuid4().hex[:8]}"
+        self.inflight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._avg_job: Optional[float] = None
+        self._slots = asyncio.Semaphore(self.capacity)
+        self._tasks: List["asyncio.Task[Any]"] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._redis: Any = None
+
+    async def handle(self, header: Dict[str, Any], blob: bytes) -> Frame:
+        op = header.get("op")
+        if op == "health":
+            return self.health(), b""
+        handler = self.handlers.get(str(op))
+        if handler is None:
+            return {"error": "unknown_op", "message": str(op)}, b""
+        if not self.is_ready():
+            self.rejected += 1
+            return {"error": "unavailable", "message": f"{self.tier} model not ready", "retry_after": 5}, b""
+        deadline = header.get("deadline")
+        if deadline is not None and time.time() > float(deadline):
+            self.rejected += 1
+            return {"error": "timeout", "message": "expired before it started"}, b""
+        async with self._slots:
+            self.inflight += 1
+            started = time.perf_counter()
+            try:
+                result = await handler(header, blob)
+            except SttSaturated as exc:
+                self.rejected += 1
+                return {"error": "saturated", "retry_after": exc.retry_after}, b""
+            except asyncio.TimeoutError:
+                self.failed += 1
+                return {"error": "timeout"}, b""
+            except Exception as exc:
+                self.failed += 1
+                LOG.exception("%s job %s failed", self.tier, op)
+                return {"error": "failed", "message": str(exc)}, b""
+            finally:
+                self.inflight -= 1
+            elapsed = time.perf_counter() - started
+            self._avg_job = elapsed if self._avg_job is None else 0.8 * self._avg_job + 0.2 * elapsed
+            self.completed += 1
+            return result
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "tier": self.tier,
+            "worker_id": self.worker_id,
+            "ready": self.is_ready(),
+            "capacity": self.capacity,
+            "inflight": self.inflight,
+            "utilization": round(self.inflight / self.capacity, 3),
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_job_ms": round(self._avg_job * 1000, 2) if self._avg_job is not None else None,
+            **(self.info() if self.info else {}),
+        }
+
+    async def serve_unix(self, path: str) -> None:
+        if os.path.exists(path):
+            os.unlink(path)  # stale socket from a previous run
+
+        async def on_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            try:
+                while True:
+                    try:
+                        header, blob = await read_frame(reader)
+                    except asyncio.IncompleteReadError:
+                        return
+                    reply, payload = await self.handle(header, blob)
+                    writer.write(pack(reply, payload))
+                    await writer.drain()
+            except (ConnectionError, asyncio.CancelledError):
+                return
+            finally:
+                writer.close()
+
+        self._server = await asyncio.start_unix_server(on_connection, path=path)
+        print(f"[jobs] {self.tier} worker {self.worker_id} listening on {path} (capacity {self.capacity})")
+
+    async def serve_redis(self, url: str) -> None:
+        import redis.asyncio as redis
+
+        client = self._redis = redis.from_url(url)
+        queue = f"jobs:{self.tier}"
+
+        async def reply(reply_to: Optional[str], header: Dict[str, Any], payload: bytes = b"") -> None:
+            if reply_to:
+                await client.lpush(reply_to, pack(header, payload))
+                await client.expire(reply_to, int(JOB_TIMEOUT) + 30)
+
+        async def consume() -> None:
+            # A broker restart or a bad item must not end the loop: the process would stay up but idle, with no
+            # heartbeat, and the gateway would answer 503 until someone restarted it.
+            while True:
+                try:
+                    item = await client.brpop(queue, timeout=1)
+                    if item is None:
+                        continue
+                    try:
+                        header, blob = unpack(item[1])
+                    except (struct.error, ValueError) as exc:
+                        LOG.warning("Dropping malformed %s job frame: %s", self.tier, exc)
+                        await reply(_reply_to_of(item[1]), {"error": "bad_frame", "message": str(exc)})
+                        continue
+                    result, payload = await self.handle(header, blob)
+                    await reply(header.get("reply_to"), result, payload)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    LOG.warning("%s worker %s: Redis consumer error: %s", self.tier, self.worker_id, exc)
+                    await asyncio.sleep(1.0)
+
+        async def heartbeat() -> None:
+            key = f"workers:{self.tier}:{self.worker_id}"
+            while True:
+                try:
+                    await client.set(key, json.dumps(self.health()), ex=max(3, int(JOB_HEALTH_INTERVAL * 3)))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    LOG.warning("%s worker %s: heartbeat failed: %s", self.tier, self.worker_id, exc)
+                await asyncio.sleep(JOB_HEALTH_INTERVAL)
+
+        self._tasks = [asyncio.create_task(consume()) for _ in range(self.capacity)]
+        self._tasks.append(asyncio.create_task(heartbeat()))
+        print(f"[jobs] {self.tier} worker {self.worker_id} consuming {queue} (capacity {self.capacity})")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+class InProcessTransport:
+    kind = "inprocess"
+
+    def __init__(self, server: JobServer) -> None:
+        self.server = server
+
+    @property
+    def ready(self) -> bool:
+        return self.server.is_ready()
+
+    async def start(self) -> None:
+        return None
+
+    async def call(self, header: Dict[str, Any], blob: bytes = b"", timeout: float = JOB_TIMEOUT) -> Frame:
+        reply, payload = await asyncio.wait_for(self.server.handle(header, blob), timeout)
+        _raise_for(reply)
+        return reply, payload
+
+    def stats(self) -> Dict[str, Any]:
+        health = self.server.health()
+        return {"transport": self.kind, "healthy": int(health["ready"]), "workers": [health], **_totals([health])}
+
+    async def stop(self) -> None:
+        return None
+
+
+class _Endpoint:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.healthy = False
+        self.capacity = 1
+        self.inflight = 0
+        self.health: Dict[str, Any] = {}
+        self.last_error: Optional[str] = None
+
+    @property
+    def load(self) -> float:
+        return self.inflight / self.capacity
+
+
+class UnixSocketTransport:
+    kind = "unix"
+
+    def __init__(self, paths: Sequence[str], health_interval: float = JOB_HEALTH_INTERVAL) -> None:
+        if not paths:
+            raise ValueError("unix job transport needs at least one worker socket")
+        self.endpoints = [_Endpoint(path) for path in paths]
+        self.health_interval = health_interval
+        self.waiting = 0
+        self._freed = asyncio.Condition()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def ready(self) -> bool:
+        return any(endpoint.healthy for endpoint in self.endpoints)
+
+    async def start(self) -> None:
+        await self._probe_all()
+        if self._task is None:
+            self._task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self._probe_all()
+
+    async def _probe_all(self) -> None:
+        await asyncio.gather(*(self._probe(endpoint) for endpoint in self.endpoints))
+        async with self._freed:
+            self._freed.notify_all()
+
+    async def _probe(self, endpoint: _Endpoint) -> None:
+        try:
+            health, _ = await asyncio.wait_for(self._roundtrip(endpoint, {"op": "health"}, b""), 2.0)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as exc:
+            if endpoint.healthy:
+                LOG.warning("Worker %s unhealthy: %s", endpoint.path, exc)
+            endpoint.healthy = False
+            endpoint.last_error = str(exc) or type(exc).__name__
+            return
+        endpoint.health = health
+        endpoint.capacity = max(1, int(health.get("capacity", 1)))
+        endpoint.healthy = bool(health.get("ready"))
+        endpoint.last_error = None
+
+    async def _roundtrip(self, endpoint: _Endpoint, header: Dict[str, Any], blob: bytes) -> Frame:
+        reader, writer = await asyncio.open_unix_connection(endpoint.path)
+        try:
+            writer.write(pack(header, blob))
+            await writer.drain()
+            return await read_frame(reader)
+        finally:
+            writer.close()
+
+    async def _acquire(self, deadline: float, exclude: Sequence[_Endpoint]) -> _Endpoint:
+        async with self._freed:
+            self.waiting += 1
+            try:
+                while True:
+                    candidates = [e for e in self.endpoints if e.healthy and e not in exclude]
+                    if not candidates:
+                        raise JobError("unavailable", "no healthy workers", retry_after=5)
+                    free = [e for e in candidates if e.inflight < e.capacity]
+                    if free:
+                        endpoint = min(free, key=lambda e: e.load)
+                        endpoint.inflight += 1
+                        return endpoint
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise JobError("saturated", "all workers busy", retry_after=2)
+                    try:
+                        await asyncio.wait_for(self._freed.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self.waiting -= 1
+
+    async def _release(self, endpoint: _Endpoint) -> None:
+        endpoint.inflight -= 1
+        async with self._freed:
+            self._freed.notify()
+
+    async def call(self, header: Dict[str, Any], blob: bytes = b"", timeout: float = JOB_TIMEOUT) -> Frame:
+        deadline = time.monotonic() + timeout
+        header = {**header, "deadline": time.time() + timeout}
+        tried: List[_Endpoint] = []
+        while True:
+            endpoint = await self._acquire(deadline, tried)
+            try:
+                reply, payload = await asyncio.wait_for(
+                    self._roundtrip(endpoint, header, blob), max(0.01, deadline - time.monotonic())
+                )
+            except (OSError, asyncio.IncompleteReadError) as exc:
+                # Worker died or restarted: take it out of rotation until the next health probe says otherwise.
+                endpoint.healthy = False
+                endpoint.last_error = str(exc) or type(exc).__name__
+                tried.append(endpoint)
+                continue
+            finally:
+                await self._release(endpoint)
+            if reply.get("error") in ("saturated", "unavailable"):
+                tried.append(endpoint)
+                if any(e.healthy and e not in tried for e in self.endpoints):
+                    continue
+            _raise_for(reply)
+            return reply, payload
+
+    def stats(self) -> Dict[str, Any]:
+        workers = [
+            {
+                "socket": e.path,
+                "healthy": e.healthy,
+                "capacity": e.capacity,
+                "inflight": e.inflight,
+                "last_error": e.last_error,
+                "worker": e.health,
+            }
+            for e in self.endpoints
+        ]
+        healthy = [w for w in workers if w["healthy"]]
+        return {
+            "transport": self.kind,
+            "healthy": len(healthy),
+            "waiting": self.waiting,
+            "workers": workers,
+            **_totals(healthy),
+        }
+
+
+class RedisTransport:
+    kind = "redis"
+
+    def __init__(self, tier: str, url: str = JOB_REDIS_URL, health_interval: float = JOB_HEALTH_INTERVAL) -> None:
+        self.tier = tier
+        self.url = url
+        self.health_interval = health_interval
+        self.queue = f"jobs:{tier}"
+        self.workers: List[Dict[str, Any]] = []
+        self.queue_depth = 0
+        self.inflight = 0
+        self._client: Any = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def ready(self) -> bool:
+        return any(worker.get("ready") for worker in self.workers)
+
+    async def start(self) -> None:
+        import redis.asyncio as redis
+
+        if self._client is None:
+            self._client = redis.from_url(self.url)
+        await self._refresh()
+        if self._task is None:
+            self._task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self._refresh()
+            except Exception as exc:  # pragma: no cover - broker outage
+                LOG.warning("Job broker health check failed: %s", exc)
+                self.workers = []
+
+    async def _refresh(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=f"workers:{self.tier}:*")]
+        values = await self._client.mget(keys) if keys else []
+        self.workers = [json.loads(value) for value in values if value]
+        self.queue_depth = int(await self._client.llen(self.queue))
+
+    async def call(self, header: Dict[str, Any], blob: bytes = b"", timeout: float = JOB_TIMEOUT) -> Frame:
+        if not self.ready:
+            raise JobError("unavailable", "no live workers", retry_after=5)
+        reply_to = f"jobs:reply:{uuid.uuid4().hex}"
+        header = {**header, "reply_to": reply_to, "deadline": time.time() + timeout}
+        self.inflight += 1
+        try:
+            await self._client.lpush(self.queue, pack(header, blob))
+            item = await self._client.blpop(reply_to, timeout=max(1, int(timeout)))
+        finally:
+            self.inflight -= 1
+        if item is None:
+            raise asyncio.TimeoutError()
+        reply, payload = unpack(item[1])
+        _raise_for(reply)
+        return reply, payload
+
+    def stats(self) -> Dict[str, Any]:
+        healthy = [worker for worker in self.workers if worker.get("ready")]
+        return {
+            "transport": self.kind,
+            "healthy": len(healthy),
+            "queue_depth": self.queue_depth,
+            "waiting": self.inflight,
+            "workers": self.workers,
+            **_totals(healthy),
+        }
+
+
+def _totals(healthy: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    capacity = sum(int(w.get("capacity", 0)) for w in healthy)
+    inflight = sum(int(w.get("inflight", 0)) for w in healthy)
+    return {
+        "capacity": capacity,
+        "inflight": inflight,
+        # The per-tier autoscaling signal: busy share of the healthy workers' advertised concurrency.
+        "utilization": round(inflight / capacity, 3) if capacity else None,
+    }
+
+
+def build_transport(kind: str, tier: str, sockets: Sequence[str] = (), server: Optional[JobServer] = None) -> Any:
+    if kind == "unix":
+        return UnixSocketTransport(sockets)
+    if kind == "redis":
+        return RedisTransport(tier)
+    if server is None:
+        raise ValueError("the inprocess job transport needs a local JobServer")
+    return InProcessTransport(server)
+
+
+def _stt_error(exc: JobError) -> Exception:
+    if exc.code in ("saturated", "unavailable"):
+        return SttSaturated(exc.retry_after)
+    if exc.code == "timeout":
+        return asyncio.TimeoutError()
+    return RuntimeError(str(exc))
+
+
+class RemoteStt:
+    """Gateway-side stand-in for `SttRouter`: same calls, executed by STT workers."""
+
+    mode = "remote"
+
+    def __init__(self, transport: Any, timeout: float = JOB_TIMEOUT) -> None:
+        self.transport = transport
+        self.timeout = timeout
+
+    @property
+    def ready(self) -> bool:
+        return self.transport.ready
+
+    async def _call(self, op: str, audio: Any, language: Optional[str], options: Optional[Dict[str, Any]]) -> Frame:
+        kind, blob = encode_audio(audio)
+        header = {"op": op, "audio": kind, "language": language, "options": options}
+        try:
+            return await self.transport.call(header, blob, self.timeout)
+        except JobError as exc:
+            raise _stt_error(exc) from exc
+
+    async def transcribe(
+        self, audio: Any, language: Optional[str], options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        reply, _ = await self._call("stt.transcribe", audio, language, options)
+        return reply["text"], reply["info"]
+
+    async def transcribe_segments(
+        self, audio: Any, language: Optional[str], options: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[float, float, str]]:
+        reply, _ = await self._call("stt.segments", audio, language, options)
+        return [(float(start), float(end), str(text)) for start, end, text in reply["segments"]]
+
+    def stats(self) -> Dict[str, Any]:
+        return self.transport.stats()
+
+    def replica_stats(self) -> Dict[str, Any]:
+        return {"routing": {"remote": self.transport.kind}, "replicas": self.transport.stats().get("workers", [])}
+
+    def shutdown(self) -> None:
+        return None
+
+
+class RemoteTts:
+    """Gateway-side stand-in for `TtsRunner`; identical requests in flight share one worker job."""
+
+    def __init__(self, transport: Any, timeout: float = JOB_TIMEOUT) -> None:
+        self.transport = transport
+        self.timeout = timeout
+        self._reply_sample_rate: Optional[int] = None
+        self.synthesized = 0
+        self.coalesced = 0
+        self.failed = 0
+        self._inflight: Dict[Hashable, "asyncio.Task[bytes]"] = {}
+
+    @property
+    def sample_rate(self) -> Optional[int]:
+        """Output rate from the last job reply, else from any worker's health (workers publish it in `info`)."""
+        if self._reply_sample_rate:
+            return self._reply_sample_rate
+        for worker in self.transport.stats().get("workers", []):
+            health = worker.get("worker", worker)  # the unix transport nests each worker's health
+            if health.get("sample_rate"):
+                return int(health["sample_rate"])
+        return None
+
+    async def synthesize(self, key: Hashable, text: str, speaker: Optional[str], language: str, speed: float) -> bytes:
+        return await self._single_flight(("wav", key), "tts.wav", text, speaker, language, speed)
+
+    async def synthesize_pcm(
+        self, key: Hashable, text: str, speaker: Optional[str], language: str, speed: float
+    ) -> bytes:
+        return await self._single_flight(("pcm", key), "tts.pcm", text, speaker, language, speed)
+
+    async def _single_flight(
+        self, key: Hashable, op: str, text: str, speaker: Optional[str], language: str, speed: float
+    ) -> bytes:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.create_task(self._run(op, text, speaker, language, speed))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _run(self, op: str, text: str, speaker: Optional[str], language: str, speed: float) -> bytes:
+        header = {"op": op, "text": text, "speaker": speaker, "language": language, "speed": speed}
+        try:
+            reply, audio = await self.transport.call(header, b"", self.timeout)
+        except JobError:
+            self.failed += 1
+            raise
+        self._reply_sample_rate = reply.get("sample_rate") or self._reply_sample_rate
+        self.synthesized += 1
+        return audio
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "remote": self.transport.kind,
+            "in_flight": len(self._inflight),
+            "synthesized": self.synthesized,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+            **self.transport.stats(),
+        }
+
+    def shutdown(self) -> None:
+        return None
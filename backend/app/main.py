@@ -6,43 +6,76 @@ Exposes a WebSocket endpoint for the interview loop and a simple health check.
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import hmac
 import json
 import os
 import random
 import re
+import threading
 import time
 import uuid
 from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
-from io import BytesIO
-from fastapi import FastAPI, File, Form, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, File, Form, Request, UploadFile, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select
-from sqlmodel import SQLModel
-from tempfile import NamedTemporaryFile
-from collections import OrderedDict
+from sqlmodel import SQLModel, select
+from starlette.formparsers import MultiPartParser
 
 import httpx
 from app.db import get_session, init_db
-from app.models import AnswerRecord, CheckInRecord, SessionRecord, TelemetryRecord
+from app.export import session_document, session_exists, session_ndjson, sessions_ndjson
+from app.history import InvalidCursor, list_sessions_page
+from app.instrumentation import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    WS_MESSAGE_SECONDS,
+    Gauge,
+    instrument_db_sessions,
+    llm_failure_outcome,
+    monitor_event_loop,
+    render_metrics,
+    set_llm_outcome,
+    timed_llm,
+)
+from app.metrics import METRICS_ROLLUP, apply_rollup, ensure_rollup, metrics_summary_data
+from app.models import AnswerRecord, CheckInRecord, InterviewerStyle, SessionRecord, TelemetryRecord
+from app.jobs import (
+    JOB_CONCURRENCY,
+    JOB_REDIS_URL,
+    JOB_TRANSPORT,
+    InProcessTransport,
+    JobError,
+    JobServer,
+    RemoteStt,
+    RemoteTts,
+    build_transport,
+)
+from app.jobs import decode_audio as decode_job_audio
+from app.profiling import LOOP_BLOCK_DETECT, PROFILE_MAX_SECONDS, detector as loop_detector, sample_profile
+from app.readiness import ModelSlot, RemoteSlot
+from app.session_store import SESSION_STORE_TTL_HOURS, build_session_store
+from app.stt import SttPool, SttSaturated
+from app.stt_router import SttReplica, SttRouter, parse_replicas
+from app.stt_stream import StreamingTranscriber
+from app.tracing import Span, child_span, current_span, span, traced
+from app.tracing import exporter as span_exporter
+from app.tts import TtsRunner, output_sample_rate, split_sentences
+from app.tts_cache import DiskTtsCache
+from app.writer import record_writer
 import logging
 import traceback
 
 os.environ.setdefault("NUMBA_CACHE_DIR", "/tmp/numba")
 
-from faster_whisper import WhisperModel
-from TTS.api import TTS
-import soundfile as sf
+if TYPE_CHECKING:
+    # Imported lazily by the loaders: an API-only replica never pays for torch / CTranslate2.
+    from faster_whisper import WhisperModel
+    from TTS.api import TTS
 
-
-class InterviewerStyle(str, Enum):
-    SUPPORTIVE = "supportive"
-    NEUTRAL = "neutral"
-    COLD = "cold"
+DeltaCallback = Callable[[str], Awaitable[None]]
 
 
 class SessionState:
@@ -77,6 +110,122 @@ class SessionState:
         self.custom_questions: List[str] = []
         self.custom_queue: List[str] = []
         self.ended: bool = False
+        # Speculative next-question candidates generated while the candidate answers a follow-up.
+        self.prefetch: List["asyncio.Task[Optional[str]]"] = []
+        self.prefetch_context: Optional[Tuple[int, InterviewerStyle, str, str]] = None
+        self.prefetch_hits: int = 0
+        self.prefetch_misses: int = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Compact, worker-independent form for the session store; monotonic deadlines become epoch seconds."""
+        to_wall = time.time() - time.monotonic()
+        return {
+            "v": 1,
+            "id": self.session_id,
+            "st": self.style.value,
+            "g": self.group,
+            "c": self.consented,
+            "a": self.accent,
+            "n": self.notes,
+            "p": self.pack,
+            "d": self.difficulty,
+            "t": self.turn,
+            "q": self.last_question,
+            "h": [list(pair) for pair in self.history],
+            "f": self.awaiting_followup,
+            "mq": self.max_questions,
+            "ds": self.duration_seconds,
+            "sa": self.session_started_at + to_wall if self.session_started_at is not None else None,
+            "ea": self.session_ends_at + to_wall if self.session_ends_at is not None else None,
+            "cq": self.custom_questions,
+            "cu": self.custom_queue,
+            "e": self.ended,
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        to_monotonic = time.monotonic() - time.time()
+        self.session_id = data["id"]
+        self.style = InterviewerStyle(data["st"])
+        self.group = data["g"]
+        self.consented = bool(data["c"])
+        self.accent = data["a"]
+        self.notes = data["n"]
+        self.pack = data["p"]
+        self.difficulty = data["d"]
+        self.turn = int(data["t"])
+        self.last_question = data["q"]
+        self.history = [(q, a) for q, a in data["h"]]
+        self.awaiting_followup = bool(data["f"])
+        self.max_questions = data["mq"]
+        self.duration_seconds = data["ds"]
+        self.session_started_at = data["sa"] + to_monotonic if data["sa"] is not None else None
+        self.session_ends_at = data["ea"] + to_monotonic if data["ea"] is not None else None
+        self.custom_questions = list(data["cq"])
+        self.custom_queue = list(data["cu"])
+        self.ended = bool(data["e"])
+        self.prefetch = []
+        self.prefetch_context = None
+
+
+session_store = build_session_store()
+# Messages after which the stored snapshot must be refreshed. The snapshot is only written once the message has been
+# fully handled: a socket that drops mid-turn leaves the previous turn's snapshot, so a resume re-asks that question.
+STATEFUL_MESSAGES = ("start_session", "switch_style", "user_answer")
+# Messages whose per-stage timing is persisted with the session as a `trace` telemetry row.
+TRACED_MESSAGES = ("start_session", "switch_style", "user_answer", "user_clarification")
+TRACE_SESSIONS = os.getenv("TRACE_SESSIONS", "1").lower() in ("1", "true", "yes")
+# Known /ws/interview message types; anything else is counted as "other" so clients can't mint new series.
+WS_MESSAGE_TYPES = frozenset(
+    STATEFUL_MESSAGES + ("resume_session", "user_clarification", "ping", "checkin", "telemetry")
+)
+
+
+async def record_trace(
+    session_id: str, group: Optional[str], root: Span, kind: str, turn: Optional[int] = None
+) -> None:
+    """Persist a finished root span's per-stage breakdown; it shows up under `telemetry` in the session export."""
+    if not TRACE_SESSIONS:
+        return
+    summary = root.summary()
+    await record_writer.put(
+        TelemetryRecord(
+            session_id=session_id,
+            event_type="trace",
+            latency_ms=summary["total_ms"],
+            group_name=group,
+            payload=json.dumps({"turn": turn, "kind": kind, **summary}),
+        )
+    )
+
+
+async def save_session_state(state: SessionState) -> None:
+    if state.session_started_at is None:
+        return  # nothing to resume before start_session
+    try:
+        with child_span("session_store.save", store=session_store.kind):
+            await session_store.save(state.session_id, state.snapshot())
+    except Exception:
+        # Losing resumability must not break the live interview.
+        LOG.exception("Saving session state for %s failed", state.session_id)
+
+
+async def discard_session_state(state: SessionState) -> None:
+    try:
+        await session_store.delete(state.session_id)
+    except Exception:
+        LOG.exception("Deleting session state for %s failed", state.session_id)
+
+
+async def prune_session_states(max_age_hours: float = SESSION_STORE_TTL_HOURS) -> None:
+    """Hourly, drop the snapshots of sessions that were abandoned without ending."""
+    while True:
+        try:
+            removed = await session_store.prune(max_age_hours * 3600)
+            if removed:
+                LOG.info("Pruned %s stale session snapshots", removed)
+        except Exception:
+            LOG.exception("Pruning session snapshots failed")
+        await asyncio.sleep(3600)
 
 
 QUESTION_BANK: Dict[InterviewerStyle, List[str]] = {
@@ -462,24 +611,26 @@ def _non_answer_reframe_preface(style: InterviewerStyle) -> str:
     }[style]
 
 
+ANSWER_ACK_PREFACES: Dict[InterviewerStyle, List[str]] = {
+    InterviewerStyle.SUPPORTIVE: [
+        "Thanks — got it.",
+        "Got it — thank you.",
+        "Okay, thanks.",
+    ],
+    InterviewerStyle.NEUTRAL: [
+        "Got it.",
+        "Okay.",
+        "Understood.",
+    ],
+    InterviewerStyle.COLD: [
+        "Okay.",
+        "Alright.",
+    ],
+}
+
+
 def _answer_ack_preface(style: InterviewerStyle) -> str:
-    options: Dict[InterviewerStyle, List[str]] = {
-        InterviewerStyle.SUPPORTIVE: [
-            "Thanks — got it.",
-            "Got it — thank you.",
-            "Okay, thanks.",
-        ],
-        InterviewerStyle.NEUTRAL: [
-            "Got it.",
-            "Okay.",
-            "Understood.",
-        ],
-        InterviewerStyle.COLD: [
-            "Okay.",
-            "Alright.",
-        ],
-    }
-    return random.choice(options[style])
+    return random.choice(ANSWER_ACK_PREFACES[style])
 
 
 def _question_starts_with_ack(question: str) -> bool:
@@ -555,10 +706,46 @@ def _session_end_message(style: InterviewerStyle, reason: str) -> str:
     }[style]
 
 
+def static_interviewer_lines() -> List[Tuple[str, InterviewerStyle]]:
+    """Every fixed line the interviewer can speak, paired with the style it is spoken in (for TTS pre-warming)."""
+    lines: List[Tuple[str, InterviewerStyle]] = []
+    seen: set[Tuple[str, InterviewerStyle]] = set()
+
+    def add(text: str, style: InterviewerStyle) -> None:
+        text = text.strip()
+        if text and (text, style) not in seen:
+            seen.add((text, style))
+            lines.append((text, style))
+
+    pack_questions = [q for levels in QUESTION_PACKS.values() for items in levels.values() for q in items]
+    for style in InterviewerStyle:
+        # Static questions are only spoken on the LLM fallback path, but that is exactly when latency hurts most.
+        for question in QUESTION_BANK.get(style, []) + pack_questions:
+            add(question, style)
+            add(refusal_clarification_response(style, question), style)
+        for follow_up in FOLLOW_UPS.get(style, []):
+            add(follow_up, style)
+        for by_style in FOLLOW_UP_INTENTS.values():
+            for follow_up in by_style.get(style, []):
+                add(follow_up, style)
+        for by_style_line in NON_ANSWER_FOLLOW_UPS.values():
+            add(by_style_line[style], style)
+        for reason in ("time_limit", "max_questions", "ended"):
+            add(_session_end_message(style, reason), style)
+        add(_non_answer_ack_prefix(style), style)
+        add(_non_answer_reframe_preface(style), style)
+        for preface in ANSWER_ACK_PREFACES[style]:
+            add(preface, style)
+    return lines
+
+
 async def end_session(ws: WebSocket, state: SessionState, reason: str) -> None:
     if state.ended:
         return
     state.ended = True
+    cancel_question_prefetch(state)
+    # An ended session can't be resumed; drop its snapshot so the store doesn't grow with every interview.
+    await asyncio.shield(discard_session_state(state))
     message = _session_end_message(state.style, reason)
     try:
         await ws.send_json(
@@ -573,25 +760,34 @@ async def end_session(ws: WebSocket, state: SessionState, reason: str) -> None:
     except Exception:
         # Best-effort: client may already be gone.
         return
-    try:
-        async with get_session() as session:
-            session.add(
-                TelemetryRecord(
-                    session_id=state.session_id,
-                    event_type="session_end",
-                    group_name=state.group,
-                    payload=json.dumps({"turn": state.turn, "reason": reason}),
-                )
-            )
-            await session.commit()
-    except Exception as exc:
-        LOG.warning("Failed to log session end telemetry (session=%s): %s", state.session_id, exc)
+    await record_writer.put(
+        TelemetryRecord(
+            session_id=state.session_id,
+            event_type="session_end",
+            group_name=state.group,
+            payload=json.dumps({"turn": state.turn, "reason": reason}),
+        )
+    )
     try:
         await ws.close()
     except Exception:
         return
 
 
+NON_ANSWER_FOLLOW_UPS: Dict[str, Dict[InterviewerStyle, str]] = {
+    "behavioral": {
+        InterviewerStyle.SUPPORTIVE: "That’s okay — pick a different (even small) example and walk me through what you did and what changed?",
+        InterviewerStyle.NEUTRAL: "Okay — pick a different example and tell me what you did and what changed?",
+        InterviewerStyle.COLD: "Pick another example. What did you do, and what was the result?",
+    },
+    "approach": {
+        InterviewerStyle.SUPPORTIVE: "That’s okay — if you’re unsure, talk me through how you’d approach figuring it out. What would you check first?",
+        InterviewerStyle.NEUTRAL: "Okay — how would you approach figuring it out? What’s your first step?",
+        InterviewerStyle.COLD: "Fine. What’s your approach? What’s the first step?",
+    },
+}
+
+
 def pick_follow_up(
     style: InterviewerStyle,
     answer: str,
@@ -605,17 +801,7 @@ def pick_follow_up(
     if _is_non_answer(raw):
         pack_hint = (pack or "").lower()
         is_behavioral = "behavior" in pack_hint or "leadership" in pack_hint
-        if is_behavioral:
-            return {
-                InterviewerStyle.SUPPORTIVE: "That’s okay — pick a different (even small) example and walk me through what you did and what changed?",
-                InterviewerStyle.NEUTRAL: "Okay — pick a different example and tell me what you did and what changed?",
-                InterviewerStyle.COLD: "Pick another example. What did you do, and what was the result?",
-            }[style]
-        return {
-            InterviewerStyle.SUPPORTIVE: "That’s okay — if you’re unsure, talk me through how you’d approach figuring it out. What would you check first?",
-            InterviewerStyle.NEUTRAL: "Okay — how would you approach figuring it out? What’s your first step?",
-            InterviewerStyle.COLD: "Fine. What’s your approach? What’s the first step?",
-        }[style]
+        return NON_ANSWER_FOLLOW_UPS["behavioral" if is_behavioral else "approach"][style]
 
     # Prefer a summarization follow-up when the answer is very long or delivered at high pace.
     speaking_rate = _coerce_float(metrics.get("speakingRate"))
@@ -810,6 +996,38 @@ def _extract_json_block(text: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+# JSON fields whose text is forwarded to the client while a streamed completion is still arriving.
+COACHING_STREAM_KEYS: Tuple[str, ...] = ("follow_up", "followup", "followUp")
+QUESTION_STREAM_KEYS: Tuple[str, ...] = ("question", "prompt", "text")
+
+
+def _extract_partial_json_string(text: str, keys: Tuple[str, ...]) -> Optional[str]:
+    """Decode the (possibly unterminated) string value of the first matching key in a streaming JSON payload."""
+    for key in keys:
+        match = re.search(r'"%s"\s*:\s*"' % re.escape(key), text)
+        if not match:
+            continue
+        start = match.end()
+        idx = start
+        while idx < len(text):
+            ch = text[idx]
+            if ch == '"':
+                break
+            if ch == "\\":
+                # Stop before an escape sequence that hasn't fully arrived yet.
+                width = 6 if text[idx + 1 : idx + 2] == "u" else 2
+                if idx + width > len(text):
+                    break
+                idx += width
+                continue
+            idx += 1
+        try:
+            return json.loads(f'"{text[start:idx]}"')
+        except json.JSONDecodeError:
+            return None
+    return None
+
+
 def parse_coaching_response(text: str) -> Optional[Tuple[Optional[str], List[Dict[str, str]]]]:
     data = _extract_json_block(text)
     if not data:
@@ -863,12 +1081,19 @@ def parse_clarification_response(text: str) -> Optional[str]:
     return cleaned or None
 
 
+@timed_llm("coaching")
 async def llm_generate_coaching(
-    style: InterviewerStyle, question: str, answer: str, turn: int, metrics: Optional[Dict[str, Any]] = None
+    style: InterviewerStyle,
+    question: str,
+    answer: str,
+    turn: int,
+    metrics: Optional[Dict[str, Any]] = None,
+    on_delta: Optional[DeltaCallback] = None,
 ) -> Optional[Tuple[Optional[str], List[Dict[str, str]]]]:
     api_key = NVIDIA_API_KEY or os.getenv("NVIDIA_API_KEY")
     if not api_key:
         LOG.warning("NVIDIA_API_KEY missing; coaching fallback engaged (style=%s turn=%s)", style, turn)
+        set_llm_outcome("fallback")
         return None
     system_prompt = (
         "You are an interview coach speaking as the interviewer. "
@@ -904,8 +1129,11 @@ async def llm_generate_coaching(
         "top_p": 1.0,
         "stream": False,
     }
-    try:
-        async with httpx.AsyncClient(timeout=NVIDIA_LLM_TIMEOUT) as client:
+    if on_delta is not None and NVIDIA_LLM_STREAM:
+        LOG.info("Calling NVIDIA LLM (coaching, stream): style=%s turn=%s", style, turn)
+        content = await llm_stream_content(headers, payload, "coaching", COACHING_STREAM_KEYS, on_delta)
+    else:
+        try:
             LOG.info(
                 "Calling NVIDIA LLM (coaching): style=%s turn=%s question_len=%s answer_len=%s",
                 style,
@@ -913,21 +1141,23 @@ async def llm_generate_coaching(
                 len(question),
                 len(answer),
             )
-            resp = await client.post(NVIDIA_LLM_URL, headers=headers, json=payload)
-    except Exception as exc:  # pragma: no cover - network/runtime safety
-        LOG.warning("NVIDIA LLM coaching request failed: %s", exc)
-        return None
+            resp = await llm_post(headers, payload)
+        except Exception as exc:  # pragma: no cover - network/runtime safety
+            LOG.warning("NVIDIA LLM coaching request failed: %s", exc)
+            set_llm_outcome(llm_failure_outcome(exc))
+            return None
 
-    if resp.status_code != 200:
-        LOG.warning("NVIDIA LLM responded with %s (coaching): %s", resp.status_code, resp.text[:200])
-        return None
+        if resp.status_code != 200:
+            LOG.warning("NVIDIA LLM responded with %s (coaching): %s", resp.status_code, resp.text[:200])
+            set_llm_outcome("non_200")
+            return None
 
-    try:
-        data = resp.json()
-        choices = data.get("choices") or []
-        content = choices[0].get("message", {}).get("content", "").strip() if choices else ""
-    except Exception:
-        content = ""
+        try:
+            data = resp.json()
+            choices = data.get("choices") or []
+            content = choices[0].get("message", {}).get("content", "").strip() if choices else ""
+        except Exception:
+            content = ""
     if not content:
         LOG.warning("NVIDIA LLM coaching returned empty content")
         return None
@@ -937,6 +1167,7 @@ async def llm_generate_coaching(
     return parsed
 
 
+@timed_llm("question")
 async def llm_generate_question(
     style: InterviewerStyle,
     turn: int,
@@ -944,10 +1175,12 @@ async def llm_generate_question(
     history: Optional[List[Tuple[str, str]]] = None,
     pack: Optional[str] = None,
     difficulty: Optional[str] = None,
+    on_delta: Optional[DeltaCallback] = None,
 ) -> Optional[str]:
     api_key = NVIDIA_API_KEY or os.getenv("NVIDIA_API_KEY")
     if not api_key:
         LOG.warning("NVIDIA_API_KEY missing; question fallback engaged (style=%s turn=%s)", style, turn)
+        set_llm_outcome("fallback")
         return None
     system_prompt = (
         "You are an interviewer generating the next question. Respond with JSON only: {\"question\":\"string\"}. "
@@ -981,8 +1214,11 @@ async def llm_generate_question(
         "top_p": 1.0,
         "stream": False,
     }
-    try:
-        async with httpx.AsyncClient(timeout=NVIDIA_LLM_TIMEOUT) as client:
+    if on_delta is not None and NVIDIA_LLM_STREAM:
+        LOG.info("Calling NVIDIA LLM (question, stream): style=%s turn=%s", style, turn)
+        content = await llm_stream_content(headers, payload, "question", QUESTION_STREAM_KEYS, on_delta)
+    else:
+        try:
             LOG.info(
                 "Calling NVIDIA LLM (question): style=%s turn=%s prev_len=%s history_pairs=%s",
                 style,
@@ -990,21 +1226,23 @@ async def llm_generate_question(
                 len(previous_question or ""),
                 len(recent_pairs),
             )
-            resp = await client.post(NVIDIA_LLM_URL, headers=headers, json=payload)
-    except Exception as exc:  # pragma: no cover - network/runtime safety
-        LOG.warning("NVIDIA LLM question request failed: %s", exc)
-        return None
+            resp = await llm_post(headers, payload)
+        except Exception as exc:  # pragma: no cover - network/runtime safety
+            LOG.warning("NVIDIA LLM question request failed: %s", exc)
+            set_llm_outcome(llm_failure_outcome(exc))
+            return None
 
-    if resp.status_code != 200:
-        LOG.warning("NVIDIA LLM question responded with %s: %s", resp.status_code, resp.text[:200])
-        return None
+        if resp.status_code != 200:
+            LOG.warning("NVIDIA LLM question responded with %s: %s", resp.status_code, resp.text[:200])
+            set_llm_outcome("non_200")
+            return None
 
-    try:
-        data = resp.json()
-        choices = data.get("choices") or []
-        content = choices[0].get("message", {}).get("content", "").strip() if choices else ""
-    except Exception:
-        content = ""
+        try:
+            data = resp.json()
+            choices = data.get("choices") or []
+            content = choices[0].get("message", {}).get("content", "").strip() if choices else ""
+        except Exception:
+            content = ""
     if not content:
         LOG.warning("NVIDIA LLM question returned empty content")
         return None
@@ -1014,6 +1252,7 @@ async def llm_generate_question(
     return parsed
 
 
+@timed_llm("clarification")
 async def llm_generate_clarification(
     style: InterviewerStyle,
     prompt_question: str,
@@ -1026,6 +1265,7 @@ async def llm_generate_clarification(
     api_key = NVIDIA_API_KEY or os.getenv("NVIDIA_API_KEY")
     if not api_key:
         LOG.warning("NVIDIA_API_KEY missing; clarification fallback engaged (style=%s turn=%s)", style, turn)
+        set_llm_outcome("fallback")
         return None
 
     system_prompt = (
@@ -1063,21 +1303,22 @@ async def llm_generate_clarification(
         "stream": False,
     }
     try:
-        async with httpx.AsyncClient(timeout=NVIDIA_LLM_TIMEOUT) as client:
-            LOG.info(
-                "Calling NVIDIA LLM (clarification): style=%s turn=%s prompt_len=%s clarification_len=%s",
-                style,
-                turn,
-                len(prompt_question),
-                len(clarification_question),
-            )
-            resp = await client.post(NVIDIA_LLM_URL, headers=headers, json=payload)
+        LOG.info(
+            "Calling NVIDIA LLM (clarification): style=%s turn=%s prompt_len=%s clarification_len=%s",
+            style,
+            turn,
+            len(prompt_question),
+            len(clarification_question),
+        )
+        resp = await llm_post(headers, payload)
     except Exception as exc:  # pragma: no cover - network/runtime safety
         LOG.warning("NVIDIA LLM clarification request failed: %s", exc)
+        set_llm_outcome(llm_failure_outcome(exc))
         return None
 
     if resp.status_code != 200:
         LOG.warning("NVIDIA LLM responded with %s (clarification): %s", resp.status_code, resp.text[:200])
+        set_llm_outcome("non_200")
         return None
 
     try:
@@ -1098,37 +1339,331 @@ async def llm_generate_clarification(
 
 app = FastAPI(title="AI Interview Trainer", version="0.1.0")
 whisper_model: Optional[WhisperModel] = None
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "medium")
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "cpu")
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE") or (
+    "float16" if WHISPER_DEVICE not in ("cpu", "auto-cpu") else "int8"
+)
+
+
+def _build_stt_router() -> SttRouter:
+    """One SttPool per Whisper replica (`WHISPER_REPLICAS`, default a single `WHISPER_MODEL`)."""
+    specs = parse_replicas(os.getenv("WHISPER_REPLICAS", ""), WHISPER_COMPUTE_TYPE) or [
+        (WHISPER_MODEL, WHISPER_COMPUTE_TYPE)
+    ]
+    replicas = [
+        SttReplica(
+            f"{size}-{idx}",
+            size,
+            compute_type,
+            SttPool(
+                workers=int(os.getenv("STT_WORKERS", "1")),
+                max_queue=int(os.getenv("STT_MAX_QUEUE", "8")),
+                timeout=float(os.getenv("STT_TIMEOUT", "120")),
+                mode=os.getenv("STT_EXECUTOR", "thread"),
+                batch_size=int(os.getenv("STT_BATCH_SIZE", "1")),
+                batch_wait=float(os.getenv("STT_BATCH_WAIT_MS", "30")) / 1000,
+            ),
+        )
+        for idx, (size, compute_type) in enumerate(specs)
+    ]
+    return SttRouter(
+        replicas,
+        short_clip=float(os.getenv("STT_ROUTE_SHORT_CLIP_S", "20")),
+        max_wait=float(os.getenv("STT_ROUTE_MAX_WAIT_MS", "3000")) / 1000,
+        min_avg_logprob=float(os.getenv("STT_ESCALATE_MIN_LOGPROB", "-0.8")),
+    )
+
+
+stt_router = _build_stt_router()
+STT_MAX_UPLOAD_BYTES = int(float(os.getenv("STT_MAX_UPLOAD_MB", "25")) * 1024 * 1024)
+STT_STREAM_PARTIAL_MS = float(os.getenv("STT_STREAM_PARTIAL_MS", "600"))
+STT_STREAM_SILENCE_MS = float(os.getenv("STT_STREAM_SILENCE_MS", "500"))
+STT_STREAM_MAX_WINDOW_S = float(os.getenv("STT_STREAM_MAX_WINDOW_S", "20"))
 tts_model: Optional[TTS] = None
+tts_runner = TtsRunner(concurrency_per_device=int(os.getenv("TTS_MAX_CONCURRENCY_PER_DEVICE", "1")))
 TTS_SPEAKER = os.getenv("TTS_SPEAKER")
 TTS_LANGUAGE = os.getenv("TTS_LANGUAGE", "en")
 DEFAULT_TTS_SPEAKER: Optional[str] = None
 FALLBACK_TTS_SPEAKER = os.getenv("TTS_FALLBACK_SPEAKER", "Claribel Dervla")
-TTS_CACHE_MAX = 32  # simple in-memory LRU for duplicate TTS requests
-TTS_CACHE: "OrderedDict[tuple, bytes]" = OrderedDict()
+TTS_STYLE_SPEEDS: Dict[str, float] = {"supportive": 1.06, "neutral": 1.0, "cold": 0.94}
+TTS_PREWARM_ON_STARTUP = os.getenv("TTS_PREWARM_ON_STARTUP", "0").lower() in ("1", "true", "yes")
+tts_prewarm_task: Optional["asyncio.Task[Dict[str, int]]"] = None
+TTS_MODEL_NAME = os.getenv("TTS_MODEL", "tts_models/multilingual/multi-dataset/xtts_v2")
+# Shared on-disk cache so repeated interviewer lines survive restarts and are shared by all workers.
+TTS_CACHE = DiskTtsCache(
+    root=os.getenv("TTS_CACHE_DIR", "./tts_cache"),
+    max_bytes=int(float(os.getenv("TTS_CACHE_MAX_MB", "2048")) * 1024 * 1024),
+)
 NVIDIA_API_KEY = os.getenv("NVIDIA_API_KEY")
 NVIDIA_LLM_MODEL = os.getenv("NVIDIA_LLM_MODEL", "meta/llama-4-maverick-17b-128e-instruct")
 NVIDIA_LLM_URL = os.getenv("NVIDIA_LLM_URL", "https://integrate.api.nvidia.com/v1/chat/completions")
 NVIDIA_LLM_TIMEOUT = float(os.getenv("NVIDIA_LLM_TIMEOUT", "12"))
+NVIDIA_LLM_STREAM = os.getenv("NVIDIA_LLM_STREAM", "1").lower() not in ("0", "false", "no")
+NVIDIA_LLM_HTTP2 = os.getenv("NVIDIA_LLM_HTTP2", "1").lower() not in ("0", "false", "no")
+NVIDIA_LLM_MAX_CONNECTIONS = int(os.getenv("NVIDIA_LLM_MAX_CONNECTIONS", "64"))
+NVIDIA_LLM_MAX_KEEPALIVE = int(os.getenv("NVIDIA_LLM_MAX_KEEPALIVE", "32"))
+NVIDIA_LLM_KEEPALIVE_EXPIRY = float(os.getenv("NVIDIA_LLM_KEEPALIVE_EXPIRY", "60"))
+NVIDIA_LLM_MAX_CONCURRENCY_PER_HOST = int(os.getenv("NVIDIA_LLM_MAX_CONCURRENCY_PER_HOST", "32"))
+QUESTION_PREFETCH_CANDIDATES = _coerce_bounded_int(os.getenv("QUESTION_PREFETCH_CANDIDATES", "1"), 0, 2) or 0
 LOG = logging.getLogger("interview")
 
+# One pooled client for the app lifetime so interview turns reuse warm TCP/TLS (and HTTP/2) connections.
+llm_client: Optional[httpx.AsyncClient] = None
+LLM_HOST_LIMITS: Dict[str, asyncio.Semaphore] = {}
+
+
+def _build_llm_client() -> httpx.AsyncClient:
+    http2 = NVIDIA_LLM_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            LOG.warning("NVIDIA_LLM_HTTP2 requested but the 'h2' package is missing; using HTTP/1.1")
+            http2 = False
+    limits = httpx.Limits(
+        max_connections=NVIDIA_LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=NVIDIA_LLM_MAX_KEEPALIVE,
+        keepalive_expiry=NVIDIA_LLM_KEEPALIVE_EXPIRY,
+    )
+    return httpx.AsyncClient(timeout=NVIDIA_LLM_TIMEOUT, limits=limits, http2=http2)
+
+
+def get_llm_client() -> httpx.AsyncClient:
+    """Return the shared LLM client, creating it on first use (e.g. when startup hooks did not run)."""
+    global llm_client
+    if llm_client is None or llm_client.is_closed:
+        llm_client = _build_llm_client()
+    return llm_client
+
+
+def _llm_host_limit(url: str) -> asyncio.Semaphore:
+    host = httpx.URL(url).host
+    limiter = LLM_HOST_LIMITS.get(host)
+    if limiter is None:
+        limiter = asyncio.Semaphore(max(1, NVIDIA_LLM_MAX_CONCURRENCY_PER_HOST))
+        LLM_HOST_LIMITS[host] = limiter
+    return limiter
+
+
+async def llm_post(headers: Dict[str, str], payload: Dict[str, Any]) -> httpx.Response:
+    async with _llm_host_limit(NVIDIA_LLM_URL):
+        return await get_llm_client().post(NVIDIA_LLM_URL, headers=headers, json=payload)
+
+
+async def llm_stream_content(
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    label: str,
+    field_keys: Tuple[str, ...],
+    on_delta: DeltaCallback,
+) -> str:
+    """Consume an SSE chat completion, forwarding new text of the JSON field in `field_keys` as it arrives.
+
+    Returns the full completion text ("" on failure) so callers can run the usual parse/fallback path.
+    """
+    payload = {**payload, "stream": True}
+    headers = {**headers, "Accept": "text/event-stream"}
+    parts: List[str] = []
+    emitted = 0
+    try:
+        async with _llm_host_limit(NVIDIA_LLM_URL):
+            async with get_llm_client().stream("POST", NVIDIA_LLM_URL, headers=headers, json=payload) as resp:
+                if resp.status_code != 200:
+                    body = await resp.aread()
+                    LOG.warning("NVIDIA LLM responded with %s (%s, stream): %s", resp.status_code, label, body[:200])
+                    set_llm_outcome("non_200")
+                    return ""
+                async for line in resp.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                        choices = chunk.get("choices") or []
+                        piece = (choices[0].get("delta") or {}).get("content") or "" if choices else ""
+                    except (json.JSONDecodeError, AttributeError, IndexError):
+                        continue
+                    if not piece:
+                        continue
+                    parts.append(piece)
+                    partial = _extract_partial_json_string("".join(parts), field_keys)
+                    if partial and len(partial) > emitted:
+                        try:
+                            await on_delta(partial[emitted:])
+                        except Exception as exc:
+                            LOG.warning("Failed to forward %s delta: %s", label, exc)
+                        emitted = len(partial)
+    except Exception as exc:  # pragma: no cover - network/runtime safety
+        LOG.warning("NVIDIA LLM %s stream failed: %s", label, exc)
+        set_llm_outcome(llm_failure_outcome(exc))
+        return ""
+    return "".join(parts).strip()
+
+
+def load_whisper_models() -> bool:
+    from faster_whisper import WhisperModel
+
+    global whisper_model
+    for replica in stt_router.replicas:
+        model_size, compute_type = replica.model_size, replica.compute_type
+        if replica.pool.mode == "process":
+            # Each worker process loads its own model; the API process stays light.
+            replica.pool.start(model_args=(model_size, WHISPER_DEVICE, compute_type))
+            print(
+                f"[whisper] starting {replica.pool.workers} worker process(es) for {replica.name} "
+                f"on {WHISPER_DEVICE} ({compute_type})"
+            )
+            continue
+        try:
+            model = WhisperModel(model_size, device=WHISPER_DEVICE, compute_type=compute_type)
+            print(f"[whisper] loaded {replica.name} on {WHISPER_DEVICE} ({compute_type})")
+        except Exception as exc:  # pragma: no cover - defensive
+            # Fall back to None so the app still boots even if model load fails.
+            model = None
+            print(f"[whisper] failed to load model {model_size}: {exc}")
+        whisper_model = whisper_model or model
+        replica.pool.start(model=model)
+    return stt_router.ready
+
+
+# all = API + both models; api = REST/WebSocket only (no torch import); stt / tts = one model each.
+SERVICE_ROLE = os.getenv("SERVICE_ROLE", "all").lower()
+# eager = block startup until loaded; background = load in parallel after startup; lazy = load on first use.
+MODEL_LOAD = os.getenv("MODEL_LOAD", "background").lower()
+
+# Split deployment: with SERVICE_ROLE=api and JOB_TRANSPORT=unix|redis this process is only the gateway, and every
+# transcription/synthesis runs on stt/tts worker processes (SERVICE_ROLE=stt|tts with the same JOB_TRANSPORT).
+# JOB_TRANSPORT=inprocess sends a single all-in-one process through the same job layer.
+STT_WORKER_SOCKETS = [s.strip() for s in os.getenv("STT_WORKER_SOCKETS", "").split(",") if s.strip()]
+TTS_WORKER_SOCKETS = [s.strip() for s in os.getenv("TTS_WORKER_SOCKETS", "").split(",") if s.strip()]
+JOB_SOCKET = os.getenv("JOB_SOCKET") or f"/tmp/interview-{SERVICE_ROLE}.sock"
+GATEWAY_ONLY = SERVICE_ROLE == "api" and JOB_TRANSPORT in ("unix", "redis")
+job_server: Optional[JobServer] = None
+active_interviews = 0
+
+
+async def _stt_job(header: Dict[str, Any], blob: bytes) -> Tuple[Dict[str, Any], bytes]:
+    audio = decode_job_audio(header.get("audio", "encoded"), blob)
+    if header.get("op") == "stt.segments":
+        segments = await stt_router.transcribe_segments(audio, header.get("language"), header.get("options"))
+        return {"segments": [list(segment) for segment in segments]}, b""
+    text, info = await stt_router.transcribe(audio, header.get("language"), header.get("options"))
+    return {"text": text, "info": info}, b""
+
+
+async def _tts_job(header: Dict[str, Any], blob: bytes) -> Tuple[Dict[str, Any], bytes]:
+    text, speaker, language, speed = header["text"], header.get("speaker"), header["language"], header["speed"]
+    key = (text, speaker, language, speed)
+    if header.get("op") == "tts.pcm":
+        audio = await tts_runner.synthesize_pcm(key, text, speaker, language, speed)
+    else:
+        audio = await tts_runner.synthesize(key, text=text, speaker=speaker, language=language, speed=speed)
+    return {"sample_rate": output_sample_rate(tts_model)}, audio
+
+
+def _job_server(tier: str) -> JobServer:
+    if tier == "stt":
+        return JobServer(
+            "stt", {"stt.transcribe": _stt_job, "stt.segments": _stt_job}, lambda: whisper_slot.ready, JOB_CONCURRENCY
+        )
+    return JobServer(
+        "tts",
+        {"tts.wav": _tts_job, "tts.pcm": _tts_job},
+        lambda: tts_slot.ready,
+        int(os.getenv("TTS_MAX_CONCURRENCY_PER_DEVICE", "1")),
+        info=lambda: {"sample_rate": output_sample_rate(tts_model)},
+    )
+
+
+stt_service: Any = stt_router
+tts_service: Any = tts_runner
+if GATEWAY_ONLY:
+    stt_service = RemoteStt(build_transport(JOB_TRANSPORT, "stt", STT_WORKER_SOCKETS))
+    tts_service = RemoteTts(build_transport(JOB_TRANSPORT, "tts", TTS_WORKER_SOCKETS))
+    whisper_slot = RemoteSlot("whisper", stt_service.transport)
+    tts_slot = RemoteSlot("tts", tts_service.transport)
+else:
+    whisper_slot = ModelSlot("whisper", load_whisper_models, enabled=SERVICE_ROLE in ("all", "stt"))
+    tts_slot = ModelSlot(
+        "tts", lambda: load_tts_model(os.getenv("TTS_DEVICE", WHISPER_DEVICE)), enabled=SERVICE_ROLE in ("all", "tts")
+    )
+    if JOB_TRANSPORT == "inprocess" and SERVICE_ROLE == "all":
+        stt_service = RemoteStt(InProcessTransport(_job_server("stt")))
+        tts_service = RemoteTts(InProcessTransport(_job_server("tts")))
+    elif SERVICE_ROLE in ("stt", "tts") and JOB_TRANSPORT in ("unix", "redis"):
+        job_server = _job_server(SERVICE_ROLE)
+MODEL_SLOTS = (whisper_slot, tts_slot)
+model_load_task: Optional["asyncio.Future[Any]"] = None
+loop_monitor_task: Optional["asyncio.Task[None]"] = None
+session_prune_task: Optional["asyncio.Task[None]"] = None
+instrument_db_sessions()
+Gauge("interview_ws_active_interviews", "Open /ws/interview connections.", fn=lambda: active_interviews)
+
+
+async def _load_tts_and_prewarm() -> None:
+    if await tts_slot.load() and TTS_PREWARM_ON_STARTUP:
+        from app.prewarm import prewarm_tts_cache
+
+        global tts_prewarm_task
+        tts_prewarm_task = asyncio.create_task(prewarm_tts_cache())
+
+
+def _model_unavailable(slot: ModelSlot) -> Optional[Response]:
+    """None when the model is usable; otherwise the error response (triggering a lazy load if needed)."""
+    if slot.ready:
+        return None
+    if slot.enabled and slot.state in ("pending", "loading", "unavailable"):
+        slot.start()
+        # "unavailable": a gateway whose inference workers for this model are all down or unreachable.
+        error = "workers_unavailable" if slot.state == "unavailable" else "model_loading"
+        return Response(
+            content=json.dumps({"error": error, "model": slot.name}),
+            media_type="application/json",
+            status_code=503,
+            headers={"Retry-After": "5"},
+        )
+    return Response(
+        content=json.dumps({"error": f"{slot.name}_not_loaded"}), media_type="application/json", status_code=500
+    )
+
 
 @app.on_event("startup")
 async def on_startup() -> None:
     await init_db()
-    model_size = os.getenv("WHISPER_MODEL", "medium")
-    device = os.getenv("WHISPER_DEVICE", "cpu")
-    compute_type = os.getenv("WHISPER_COMPUTE_TYPE") or ("float16" if device not in ("cpu", "auto-cpu") else "int8")
-    global whisper_model
-    try:
-        whisper_model = WhisperModel(model_size, device=device, compute_type=compute_type)
-        print(f"[whisper] loaded {model_size} on {device} ({compute_type})")
-    except Exception as exc:  # pragma: no cover - defensive
-        # Fall back to None so the app still boots even if model load fails.
-        whisper_model = None
-        print(f"[whisper] failed to load model {model_size}: {exc}")
-
-    tts_name = os.getenv("TTS_MODEL", "tts_models/multilingual/multi-dataset/xtts_v2")
-    tts_device = os.getenv("TTS_DEVICE", device)
+    if METRICS_ROLLUP:
+        await ensure_rollup()
+        record_writer.on_flush = apply_rollup
+    record_writer.start()
+    get_llm_client()
+    global loop_monitor_task, session_prune_task
+    loop_monitor_task = asyncio.create_task(monitor_event_loop())
+    if SESSION_STORE_TTL_HOURS > 0:
+        session_prune_task = asyncio.create_task(prune_session_states())
+    span_exporter.start()
+    loop_detector.attach(asyncio.get_running_loop())
+    if LOOP_BLOCK_DETECT:
+        loop_detector.start()
+    if job_server is not None:
+        if JOB_TRANSPORT == "unix":
+            await job_server.serve_unix(JOB_SOCKET)
+        else:
+            await job_server.serve_redis(JOB_REDIS_URL)
+    if MODEL_LOAD == "lazy":
+        return
+    # Whisper and XTTS load concurrently on worker threads instead of one after the other.
+    global model_load_task
+    model_load_task = asyncio.ensure_future(asyncio.gather(whisper_slot.load(), _load_tts_and_prewarm()))
+    if MODEL_LOAD == "eager":
+        await model_load_task
+
+
+def load_tts_model(tts_device: str) -> bool:
+    from TTS.api import TTS
+
+    tts_name = TTS_MODEL_NAME
     global tts_model, DEFAULT_TTS_SPEAKER, TTS_SPEAKER
     try:
         tts_model = TTS(model_name=tts_name).to(tts_device)
@@ -1143,10 +1678,40 @@ async def on_startup() -> None:
             DEFAULT_TTS_SPEAKER = FALLBACK_TTS_SPEAKER
         if TTS_SPEAKER is None and DEFAULT_TTS_SPEAKER:
             TTS_SPEAKER = DEFAULT_TTS_SPEAKER
+        tts_runner.start(tts_model, tts_device)
         print(f"[tts] loaded {tts_name} on {tts_device}; default speaker={DEFAULT_TTS_SPEAKER}")
     except Exception as exc:
         tts_model = None
         print(f"[tts] failed to load model {tts_name}: {exc}")
+    return tts_model is not None
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    if tts_prewarm_task is not None and not tts_prewarm_task.done():
+        tts_prewarm_task.cancel()
+    if loop_monitor_task is not None:
+        loop_monitor_task.cancel()
+    if session_prune_task is not None:
+        session_prune_task.cancel()
+    await span_exporter.stop()
+    loop_detector.stop()
+    await record_writer.stop()
+    if model_load_task is not None and not model_load_task.done():
+        # A gateway can still be waiting for inference workers that never came up.
+        model_load_task.cancel()
+        await asyncio.gather(model_load_task, return_exceptions=True)
+    if job_server is not None:
+        await job_server.stop()
+    for slot in MODEL_SLOTS:
+        if isinstance(slot, RemoteSlot):
+            await slot.transport.stop()
+    stt_router.shutdown()
+    tts_runner.shutdown()
+    global llm_client
+    if llm_client is not None:
+        await llm_client.aclose()
+        llm_client = None
 
 # CORS for local dev; adjust allowed origins for prod if needed.
 app.add_middleware(
@@ -1163,6 +1728,21 @@ async def health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/ready", response_model=None)
+async def ready() -> Response:
+    """Per-model load state; 503 until every model this role needs is loaded (lazy slots count as ready)."""
+    models = {slot.name: slot.status() for slot in MODEL_SLOTS}
+    is_ready = all(
+        slot.state in ("ready", "disabled") or (MODEL_LOAD == "lazy" and slot.state == "pending")
+        for slot in MODEL_SLOTS
+    )
+    return Response(
+        content=json.dumps({"ready": is_ready, "role": SERVICE_ROLE, "load": MODEL_LOAD, "models": models}),
+        media_type="application/json",
+        status_code=200 if is_ready else 503,
+    )
+
+
 class TtsRequest(BaseModel):
     text: str
     style: Optional[str] = None
@@ -1170,19 +1750,8 @@ class TtsRequest(BaseModel):
     language: Optional[str] = None
 
 
-@app.post("/tts")
-async def tts_endpoint(payload: TtsRequest) -> Response:
-    """Neural TTS via Coqui XTTS; returns WAV bytes."""
-    if tts_model is None:
-        return Response(content=json.dumps({"error": "tts_not_loaded"}), media_type="application/json", status_code=500)
-
-    text = payload.text.strip()
-    if not text:
-        return Response(content=json.dumps({"error": "empty_text"}), media_type="application/json", status_code=400)
-
-    style = payload.style or "neutral"
-    speed = {"supportive": 1.06, "neutral": 1.0, "cold": 0.94}.get(style, 1.0)
-    speaker = payload.speaker or TTS_SPEAKER or DEFAULT_TTS_SPEAKER or FALLBACK_TTS_SPEAKER
+def _default_tts_speaker() -> str:
+    speaker = TTS_SPEAKER or DEFAULT_TTS_SPEAKER or FALLBACK_TTS_SPEAKER
     if speaker is None:
         candidates: List[str] = []
         try:
@@ -1197,98 +1766,298 @@ async def tts_endpoint(payload: TtsRequest) -> Response:
         else:
             # Still nothing? use the hard-coded fallback to avoid hard 400s.
             speaker = FALLBACK_TTS_SPEAKER
-    cache_key = (text, style, speaker, payload.language or TTS_LANGUAGE, speed)
-    if cache_key in TTS_CACHE:
-        # Move to end to keep LRU ordering.
-        audio_bytes = TTS_CACHE.pop(cache_key)
-        TTS_CACHE[cache_key] = audio_bytes
-        return Response(content=audio_bytes, media_type="audio/wav")
+    return speaker
+
+
+def _resolve_tts_voice(payload: TtsRequest) -> Tuple[str, float, str, str]:
+    """Return (style, speed, speaker, language) for a TTS request."""
+    style = payload.style or "neutral"
+    speed = TTS_STYLE_SPEEDS.get(style, 1.0)
+    speaker = payload.speaker or _default_tts_speaker()
+    return style, speed, speaker, payload.language or TTS_LANGUAGE
+
+
+def _tts_sample_rate() -> int:
+    if isinstance(tts_service, RemoteTts):
+        # Learned from job replies, else the workers' health; XTTS renders at 24 kHz.
+        return tts_service.sample_rate or 24000
+    return output_sample_rate(tts_model)
+
+
+@app.post("/tts")
+async def tts_endpoint(payload: TtsRequest) -> Response:
+    """Neural TTS via Coqui XTTS; returns WAV bytes."""
+    with span("http.tts"):
+        return await _synthesize_tts(payload)
+
+
+async def _synthesize_tts(payload: TtsRequest) -> Response:
+    text = payload.text.strip()
+    if not text:
+        return Response(content=json.dumps({"error": "empty_text"}), media_type="application/json", status_code=400)
+
+    style, speed, speaker, language = _resolve_tts_voice(payload)
+    cache_key = (text, style, speaker, language, speed)
+    disk_key = DiskTtsCache.make_key(text, style, speaker, language, speed, TTS_MODEL_NAME)
+    with span("tts.cache_lookup") as lookup:
+        # Off the loop: the cache directory may be a slow shared volume.
+        cached = await asyncio.to_thread(TTS_CACHE.read, disk_key)
+        lookup.set_attribute("hit", cached is not None)
+    if cached is not None:
+        return Response(content=cached, media_type="audio/wav")
+    # Cache hits above don't need the model, so even a replica still loading XTTS can serve them.
+    unavailable = _model_unavailable(tts_slot)
+    if unavailable is not None:
+        return unavailable
     try:
-        wav = tts_model.tts(
-            text=text,
-            speaker=speaker,
-            language=payload.language or TTS_LANGUAGE,
-            speed=speed,
-        )
-        sample_rate = getattr(tts_model.synthesizer, "output_sample_rate", 24000)
-        buf = BytesIO()
-        sf.write(buf, wav, sample_rate, format="WAV")
-        audio_bytes = buf.getvalue()
-        TTS_CACHE[cache_key] = audio_bytes
-        if len(TTS_CACHE) > TTS_CACHE_MAX:
-            TTS_CACHE.popitem(last=False)
+        with span("tts.synthesize", chars=len(text)):
+            audio_bytes = await tts_service.synthesize(
+                cache_key, text=text, speaker=speaker, language=language, speed=speed
+            )
+        try:
+            with span("tts.cache_write"):
+                await asyncio.to_thread(TTS_CACHE.put, disk_key, audio_bytes)
+        except OSError as exc:
+            LOG.warning("Failed to write TTS cache entry: %s", exc)
         return Response(content=audio_bytes, media_type="audio/wav")
     except Exception as exc:  # pragma: no cover - runtime safeguard
-        logging.error("TTS synthesis failed: %s\n%s", exc, traceback.format_exc())
-        return Response(content=json.dumps({"error": f"tts_failed: {exc}"}), media_type="application/json", status_code=500)
+        return _tts_failure(exc)
+
+
+def _tts_failure(exc: BaseException) -> Response:
+    """Error response for a failed synthesis; a busy or slow TTS worker tier is reported like the STT pool."""
+    if isinstance(exc, JobError) and exc.code in ("saturated", "unavailable"):
+        LOG.warning("TTS workers busy: %s", exc)
+        return Response(
+            content=json.dumps({"error": "tts_busy"}),
+            media_type="application/json",
+            status_code=503,
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+    if isinstance(exc, asyncio.TimeoutError) or (isinstance(exc, JobError) and exc.code == "timeout"):
+        LOG.warning("TTS timed out: %s", exc)
+        return Response(content=json.dumps({"error": "tts_timeout"}), media_type="application/json", status_code=504)
+    logging.error("TTS synthesis failed: %s", exc, exc_info=exc)
+    return Response(content=json.dumps({"error": f"tts_failed: {exc}"}), media_type="application/json", status_code=500)
+
+
+class _TtsModelUnavailable(Exception):
+    """A streamed sentence missed the cache while XTTS isn't usable; carries the error response."""
+
+    def __init__(self, response: Response) -> None:
+        super().__init__("tts model unavailable")
+        self.response = response
+
+
+@app.post("/tts/stream")
+async def tts_stream_endpoint(payload: TtsRequest) -> Response:
+    """Sentence-by-sentence XTTS; streams raw 16-bit mono PCM as each sentence finishes."""
+    sentences = split_sentences(payload.text)
+    if not sentences:
+        return Response(content=json.dumps({"error": "empty_text"}), media_type="application/json", status_code=400)
+
+    style, speed, speaker, language = _resolve_tts_voice(payload)
+
+    @traced("tts.stream_sentence")
+    async def sentence_pcm(sentence: str) -> bytes:
+        disk_key = DiskTtsCache.make_key(sentence, style, speaker, language, speed, TTS_MODEL_NAME, fmt="pcm")
+        cached = await asyncio.to_thread(TTS_CACHE.read, disk_key, "pcm")
+        if cached is not None:
+            return cached
+        # Like /tts, cached sentences are served even while XTTS is still loading; only a miss needs the model.
+        unavailable = _model_unavailable(tts_slot)
+        if unavailable is not None:
+            raise _TtsModelUnavailable(unavailable)
+        key = (sentence, style, speaker, language, speed)
+        pcm = await tts_service.synthesize_pcm(key, sentence, speaker, language, speed)
+        try:
+            await asyncio.to_thread(TTS_CACHE.put, disk_key, pcm, "pcm")
+        except OSError as exc:
+            LOG.warning("Failed to write TTS cache entry: %s", exc)
+        return pcm
 
+    def synthesize(sentence: str) -> "asyncio.Task[bytes]":
+        return asyncio.create_task(sentence_pcm(sentence))
 
-@app.post("/stt")
+    # Wait for the first sentence before sending headers, so a busy worker tier or a timeout still gets a proper
+    # status code; later failures can only end the stream early.
+    first = synthesize(sentences[0])
+    try:
+        await asyncio.wait([first])
+    except asyncio.CancelledError:
+        first.cancel()
+        raise
+    error = first.exception()
+    if isinstance(error, _TtsModelUnavailable):
+        return error.response
+    if error is not None:
+        return _tts_failure(error)
+
+    async def pcm_chunks() -> AsyncIterator[bytes]:
+        # Keep one sentence in flight ahead of the one being sent so the pool never idles between chunks.
+        pending = first
+        try:
+            for idx in range(len(sentences)):
+                current = pending
+                if idx + 1 < len(sentences):
+                    pending = synthesize(sentences[idx + 1])
+                yield await current
+        except Exception as exc:  # pragma: no cover - runtime safeguard
+            # Headers are already sent, so the best we can do is end the stream early.
+            logging.error("Streaming TTS failed: %s\n%s", exc, traceback.format_exc())
+        finally:
+            if not pending.done():
+                pending.cancel()
+
+    return StreamingResponse(
+        pcm_chunks(),
+        media_type="audio/pcm",
+        headers={
+            "X-Sample-Rate": str(_tts_sample_rate()),
+            "X-Channels": "1",
+            "X-Sample-Format": "s16le",
+            "X-Sentence-Count": str(len(sentences)),
+        },
+    )
+
+
+def _upload_too_large(size: int) -> Response:
+    LOG.warning("STT upload rejected: %s bytes > %s", size, STT_MAX_UPLOAD_BYTES)
+    return Response(
+        content=json.dumps({"error": "audio_too_large", "max_bytes": STT_MAX_UPLOAD_BYTES}),
+        media_type="application/json",
+        status_code=413,
+    )
+
+
+# Room for the multipart boundaries and the small form fields sent alongside the audio.
+STT_FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+class UploadLimitMiddleware:
+    """Answer 413 for oversized `/stt` bodies before the multipart parser spools them to a temp file.
+
+    A declared `Content-Length` over the limit is refused without reading the body; a chunked body is counted as it
+    streams in and cut off once it passes the limit.
+    """
+
+    def __init__(self, app: Any, paths: Tuple[str, ...], max_bytes: int) -> None:
+        self.app = app
+        self.paths = paths
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        declared = dict(scope["headers"]).get(b"content-length", b"")
+        if declared.isdigit() and int(declared) > self.max_bytes:
+            await _upload_too_large(int(declared))(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+        started = False
+
+        async def limited_receive() -> Dict[str, Any]:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    exceeded = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message: Dict[str, Any]) -> None:
+            nonlocal started
+            if exceeded:
+                return  # the app's own error response (e.g. a 400 from the aborted form parse) is replaced below
+            started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            # The abort surfaces as whatever the body parser wraps it in; anything else is the app's own error.
+            if not exceeded:
+                raise
+        if exceeded and not started:
+            await _upload_too_large(received)(scope, receive, send)
+
+
+app.add_middleware(UploadLimitMiddleware, paths=("/stt",), max_bytes=STT_MAX_UPLOAD_BYTES + STT_FORM_OVERHEAD_BYTES)
+
+
+@app.post("/stt", response_model=None)
 async def transcribe_audio(
     file: UploadFile = File(...),
     session_id: Optional[str] = Form(default=None, alias="sessionId"),
     language: Optional[str] = Form(default=None),
-) -> Dict[str, Any]:
-    """Speech-to-text via local Whisper (faster-whisper)."""
-    if whisper_model is None:
-        return {"error": "whisper_not_loaded"}
+) -> Union[Dict[str, Any], Response]:
+    """Speech-to-text via local Whisper (faster-whisper), run on the STT worker pool."""
+    with span("http.stt", **{"session.id": session_id}):
+        return await _transcribe_upload(file, session_id, language)
+
+
+async def _transcribe_upload(
+    file: UploadFile, session_id: Optional[str], language: Optional[str]
+) -> Union[Dict[str, Any], Response]:
+    unavailable = _model_unavailable(whisper_slot)
+    if unavailable is not None:
+        return unavailable
 
     started = time.perf_counter()
-    suffix = os.path.splitext(file.filename or "audio.webm")[1] or ".webm"
-    payload = await file.read()
-    if not payload:
-        LOG.warning("STT received empty payload (session=%s)", session_id)
-        return {"error": "empty_audio"}
-    with NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp.write(payload)
-        tmp_path = tmp.name
-
-    transcript = ""
-    info_payload: Dict[str, Any] = {}
+    if file.size is not None and file.size > STT_MAX_UPLOAD_BYTES:
+        return _upload_too_large(file.size)
+    if file.size is not None and file.size > MultiPartParser.max_file_size and stt_service.mode == "thread":
+        # Past the multipart parser's spool threshold Starlette has already written this upload to a temp file;
+        # decode from that file instead of copying it into memory.
+        await file.seek(0)
+        audio: Any = file.file
+    else:
+        # Small clips never leave memory: the raw bytes are decoded to float32 PCM on the worker.
+        with span("stt.read_upload"):
+            audio = await file.read(STT_MAX_UPLOAD_BYTES + 1)
+        if len(audio) > STT_MAX_UPLOAD_BYTES:
+            return _upload_too_large(len(audio))
+        if not audio:
+            LOG.warning("STT received empty payload (session=%s)", session_id)
+            return {"error": "empty_audio"}
+
     try:
-        segments, info = whisper_model.transcribe(
-            tmp_path,
-            beam_size=4,
-            language=language or "en",
-            vad_filter=True,
-            condition_on_previous_text=False,
+        with span("stt.transcribe", mode=stt_service.mode) as stage:
+            transcript, info_payload = await stt_service.transcribe(audio, language)
+            stage.set_attribute("replica", info_payload.get("replica"))
+            stage.set_attribute("audio.duration_s", info_payload.get("duration"))
+    except SttSaturated as exc:
+        LOG.warning("STT pool saturated (session=%s): %s", session_id, stt_service.stats())
+        return Response(
+            content=json.dumps({"error": "stt_busy"}),
+            media_type="application/json",
+            status_code=503,
+            headers={"Retry-After": str(exc.retry_after)},
         )
-        texts: List[str] = []
-        for seg in segments:
-            seg_text = seg.text.strip()
-            if seg_text:
-                texts.append(seg_text)
-        transcript = " ".join(texts).strip()
-        info_payload = {"duration": info.duration, "language": info.language, "num_segments": len(texts)}
+    except asyncio.TimeoutError:
+        LOG.warning("STT timed out after %ss (session=%s)", stt_service.timeout, session_id)
+        return {"error": "stt_timeout"}
     except Exception as exc:
         LOG.warning("STT failed: %s", exc)
         return {"error": f"stt_failed: {exc}"}
-    finally:
-        try:
-            os.remove(tmp_path)
-        except OSError:
-            pass
 
     latency_ms = round((time.perf_counter() - started) * 1000, 2)
 
     if session_id:
-        async with get_session() as session:
-            group = None
-            session_row = await session.get(SessionRecord, session_id)
-            if session_row:
-                group = session_row.group_name
-            session.add(
-                TelemetryRecord(
-                    session_id=session_id,
-                    event_type="stt",
-                    latency_ms=latency_ms,
-                    group_name=group,
-                    payload=json.dumps(
-                        {"language": language or info_payload.get("language"), "duration": info_payload.get("duration")}
-                    ),
-                )
-            )
-            await session.commit()
+        await _record_stt_telemetry(
+            session_id,
+            latency_ms,
+            {"language": language or info_payload.get("language"), "duration": info_payload.get("duration")},
+            trace=current_span(),
+        )
 
     return {
         "transcript": transcript,
@@ -1297,27 +2066,346 @@ async def transcribe_audio(
     }
 
 
+@app.get("/stt/stats")
+async def stt_stats() -> Dict[str, Any]:
+    return stt_service.stats()
+
+
+@app.get("/jobs/stats")
+async def jobs_stats() -> Dict[str, Any]:
+    """Per-tier load for autoscaling: open interviews on a gateway, worker utilization per inference tier."""
+    stats: Dict[str, Any] = {"role": SERVICE_ROLE, "transport": JOB_TRANSPORT or "direct"}
+    if SERVICE_ROLE in ("all", "api"):
+        stats["gateway"] = {"websockets": active_interviews}
+    if isinstance(stt_service, RemoteStt):
+        stats["stt"] = stt_service.stats()
+    if isinstance(tts_service, RemoteTts):
+        stats["tts"] = tts_service.stats()
+    if job_server is not None:
+        stats["worker"] = job_server.health()
+    return stats
+
+
+@app.get("/stt/replicas")
+async def stt_replicas() -> Dict[str, Any]:
+    return stt_service.replica_stats()
+
+
+async def _record_stt_telemetry(
+    session_id: str, latency_ms: float, data: Dict[str, Any], trace: Optional[Span] = None
+) -> None:
+    async with get_session() as session:
+        group = None
+        session_row = await session.get(SessionRecord, session_id)
+        if session_row:
+            group = session_row.group_name
+    await record_writer.put(
+        TelemetryRecord(
+            session_id=session_id,
+            event_type="stt",
+            latency_ms=latency_ms,
+            group_name=group,
+            payload=json.dumps(data),
+        )
+    )
+    if trace is not None:
+        await record_trace(session_id, group, trace, "stt")
+
+
+@app.websocket("/ws/stt")
+async def stt_socket(ws: WebSocket) -> None:
+    """
+    Incremental STT. The client sends an optional `start` message, then binary audio chunks, then `stop`;
+    the server answers with `partial` frames while audio arrives, `final` frames per committed utterance,
+    and a `done` frame carrying the full transcript. The socket can be reused for the next answer.
+    """
+    await ws.accept()
+    if _model_unavailable(whisper_slot) is not None:
+        error = "model_loading" if whisper_slot.state in ("pending", "loading") else "whisper_not_loaded"
+        await ws.send_json({"type": "error", "error": error})
+        await ws.close()
+        return
+
+    transcriber: Optional[StreamingTranscriber] = None
+    session_id: Optional[str] = None
+    step_task: Optional["asyncio.Task[None]"] = None
+    stream_started = time.perf_counter()
+
+    def new_transcriber(options: Dict[str, Any]) -> StreamingTranscriber:
+        return StreamingTranscriber(
+            stt_service,
+            language=options.get("language"),
+            audio_format=options.get("format") or "pcm_s16le",
+            sample_rate=int(options.get("sampleRate") or 16000),
+            partial_interval=STT_STREAM_PARTIAL_MS / 1000,
+            min_silence=STT_STREAM_SILENCE_MS / 1000,
+            max_window=STT_STREAM_MAX_WINDOW_S,
+        )
+
+    async def run_step(active: StreamingTranscriber) -> None:
+        try:
+            for frame in await active.step():
+                await ws.send_json(frame)
+        except Exception as exc:  # pragma: no cover - runtime safeguard
+            LOG.warning("Streaming STT step failed: %s", exc)
+
+    try:
+        while True:
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            chunk = message.get("bytes")
+            if chunk is not None:
+                if transcriber is None:
+                    transcriber = new_transcriber({})
+                    stream_started = time.perf_counter()
+                try:
+                    transcriber.add_chunk(chunk)
+                except Exception as exc:
+                    LOG.warning("Streaming STT chunk rejected: %s", exc)
+                    await ws.send_json({"type": "error", "error": f"bad_chunk: {exc}"})
+                    transcriber.close()
+                    transcriber = None
+                    continue
+                if transcriber.bytes_received > STT_MAX_UPLOAD_BYTES:
+                    await ws.send_json({"type": "error", "error": "audio_too_large", "max_bytes": STT_MAX_UPLOAD_BYTES})
+                    transcriber.close()
+                    transcriber = None
+                    continue
+                # One decode in flight per stream; audio that arrives meanwhile is picked up by the next step.
+                if (step_task is None or step_task.done()) and transcriber.should_step():
+                    step_task = asyncio.create_task(run_step(transcriber))
+                continue
+
+            try:
+                data = json.loads(message.get("text") or "{}")
+            except json.JSONDecodeError:
+                await ws.send_json({"type": "error", "error": "invalid_json"})
+                continue
+            msg_type = data.get("type")
+            if msg_type == "start":
+                if step_task is not None:
+                    step_task.cancel()
+                session_id = data.get("sessionId") or session_id
+                if transcriber is not None:
+                    transcriber.close()
+                try:
+                    transcriber = new_transcriber(data)
+                except (TypeError, ValueError) as exc:
+                    await ws.send_json({"type": "error", "error": str(exc)})
+                    transcriber = None
+                    continue
+                stream_started = time.perf_counter()
+            elif msg_type == "stop":
+                if transcriber is None:
+                    await ws.send_json({"type": "done", "transcript": "", "latency_ms": 0.0})
+                    continue
+                stop_received = time.perf_counter()
+                if step_task is not None:
+                    await step_task
+                    step_task = None
+                try:
+                    frames = await transcriber.finish()
+                except SttSaturated as exc:
+                    # Audio is kept, so the client can send `stop` again after `retry_after`.
+                    await ws.send_json({"type": "error", "error": "stt_busy", "retry_after": exc.retry_after})
+                    continue
+                except asyncio.TimeoutError:
+                    LOG.warning("Streaming STT timed out after %ss (session=%s)", stt_service.timeout, session_id)
+                    await ws.send_json({"type": "error", "error": "stt_timeout"})
+                    transcriber = None
+                    continue
+                except Exception as exc:
+                    LOG.warning("Streaming STT failed: %s", exc)
+                    await ws.send_json({"type": "error", "error": f"stt_failed: {exc}"})
+                    transcriber = None
+                    continue
+                for frame in frames:
+                    await ws.send_json(frame)
+                # Time from end-of-audio to the finished transcript: the latency the candidate actually waits.
+                latency_ms = round((time.perf_counter() - stop_received) * 1000, 2)
+                await ws.send_json(
+                    {
+                        "type": "done",
+                        "transcript": transcriber.transcript,
+                        "latency_ms": latency_ms,
+                        "duration": round(transcriber.duration, 3),
+                    }
+                )
+                if session_id:
+                    await _record_stt_telemetry(
+                        session_id,
+                        latency_ms,
+                        {
+                            "language": transcriber.language,
+                            "duration": transcriber.duration,
+                            "streaming": True,
+                            "stream_ms": round((stop_received - stream_started) * 1000, 2),
+                            "decode_calls": transcriber.decode_calls,
+                        },
+                    )
+                transcriber = None
+            elif msg_type == "ping":
+                await ws.send_json({"type": "pong"})
+            else:
+                await ws.send_json({"type": "error", "error": f"unknown_type:{msg_type}"})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if step_task is not None and not step_task.done():
+            step_task.cancel()
+        if transcriber is not None:
+            transcriber.close()
+
+
+async def next_question(ws: WebSocket, state: SessionState) -> Tuple[str, str]:
+    """Pick the next main question (custom queue, then LLM, then the static bank) and return (question, source)."""
+    if state.custom_queue:
+        return state.custom_queue.pop(0), "custom"
+
+    async def forward_delta(delta: str) -> None:
+        await ws.send_json({"type": "question_delta", "turn": state.turn, "style": state.style, "delta": delta})
+
+    with span("llm.question"):
+        question = await llm_generate_question(
+            state.style,
+            state.turn,
+            state.last_question,
+            state.history,
+            state.pack,
+            state.difficulty,
+            on_delta=forward_delta,
+        )
+    if not question:
+        LOG.info("Question fallback: style=%s turn=%s", state.style, state.turn)
+        with span("fallback.question"):
+            return pick_question(state.style, state.turn, state.pack, state.difficulty), "fallback"
+    return question, "llm"
+
+
+def start_question_prefetch(state: SessionState) -> None:
+    """Generate candidate next main questions in the background while the current follow-up is being answered."""
+    cancel_question_prefetch(state)
+    if QUESTION_PREFETCH_CANDIDATES <= 0 or state.custom_queue:
+        return
+    next_turn = state.turn + 1
+    if state.max_questions is not None and next_turn >= state.max_questions:
+        return
+    history = list(state.history)
+    state.prefetch_context = (next_turn, state.style, state.pack, state.difficulty)
+    # A fresh context: the candidates outlive this turn's root span, so each gets a trace of its own.
+    request = (state.style, next_turn, state.last_question, history, state.pack, state.difficulty)
+    state.prefetch = [
+        asyncio.create_task(
+            _prefetch_question(state.session_id, state.group, request), context=contextvars.Context()
+        )
+        for _ in range(QUESTION_PREFETCH_CANDIDATES)
+    ]
+
+
+async def _prefetch_question(session_id: str, group: Optional[str], request: Tuple[Any, ...]) -> Optional[str]:
+    turn = request[1]
+    with span("question.prefetch", session_id=session_id, turn=turn) as root:
+        question = await llm_generate_question(*request)
+    await record_trace(session_id, group, root, "question_prefetch", turn)
+    return question
+
+
+def cancel_question_prefetch(state: SessionState) -> None:
+    for task in state.prefetch:
+        if not task.done():
+            task.cancel()
+    state.prefetch = []
+    state.prefetch_context = None
+
+
+def _rank_prefetched_questions(candidates: List[str], answer: str, history: List[Tuple[str, str]]) -> Optional[str]:
+    """Drop candidates that repeat an asked question; prefer the one that overlaps most with the new answer."""
+
+    def words(text: str) -> set[str]:
+        return set(re.findall(r"\b[a-z']{4,}\b", (text or "").lower()))
+
+    asked = [words(q) for q, _ in history]
+    answer_words = words(answer)
+    best: Optional[str] = None
+    best_score = -1
+    for candidate in candidates:
+        candidate_words = words(candidate)
+        if not candidate_words:
+            continue
+        if any(len(candidate_words & prior) / len(candidate_words) > 0.6 for prior in asked):
+            continue
+        score = len(candidate_words & answer_words)
+        if score > best_score:
+            best, best_score = candidate, score
+    return best
+
+
+async def resolve_next_question(ws: WebSocket, state: SessionState, answer: str) -> Tuple[str, str]:
+    """Use a prefetched candidate for the next main question when it is still valid, else generate one now."""
+    tasks, context = state.prefetch, state.prefetch_context
+    state.prefetch, state.prefetch_context = [], None
+    if not tasks:
+        return await next_question(ws, state)
+
+    started = time.perf_counter()
+    choice: Optional[str] = None
+    candidates: List[str] = []
+    if state.custom_queue or context != (state.turn, state.style, state.pack, state.difficulty):
+        reason = "stale"
+        for task in tasks:
+            task.cancel()
+    else:
+        with span("question.prefetch_wait", candidates=len(tasks)):
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        candidates = [item for item in results if isinstance(item, str) and item]
+        choice = _rank_prefetched_questions(candidates, answer, state.history)
+        reason = "used" if choice else ("rejected" if candidates else "empty")
+    wait_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    if choice:
+        state.prefetch_hits += 1
+    else:
+        state.prefetch_misses += 1
+    await record_writer.put(
+        TelemetryRecord(
+            session_id=state.session_id,
+            event_type="question_prefetch",
+            latency_ms=wait_ms,
+            group_name=state.group,
+            payload=json.dumps(
+                {
+                    "turn": state.turn,
+                    "outcome": "hit" if choice else "miss",
+                    "reason": reason,
+                    "candidates": len(candidates),
+                    "hits": state.prefetch_hits,
+                    "misses": state.prefetch_misses,
+                }
+            ),
+        )
+    )
+
+    if choice:
+        return choice, "llm"
+    return await next_question(ws, state)
+
+
+@traced("send_question")
 async def send_question(
     ws: WebSocket,
     state: SessionState,
     override_question: Optional[str] = None,
     source: Optional[str] = None,
+    prepared: Optional[Tuple[str, str]] = None,
 ) -> None:
     question_source = source or "llm"
     if override_question:
         question = override_question
+    elif prepared is not None:
+        question, question_source = prepared
     else:
-        if state.custom_queue:
-            question_source = "custom"
-            question = state.custom_queue.pop(0)
-        else:
-            question = await llm_generate_question(
-                state.style, state.turn, state.last_question, state.history, state.pack, state.difficulty
-            )
-            if not question:
-                question_source = "fallback"
-                question = pick_question(state.style, state.turn, state.pack, state.difficulty)
-                LOG.info("Question fallback: style=%s turn=%s", state.style, state.turn)
+        question, question_source = await next_question(ws, state)
 
     preface: Optional[str] = None
     if state.history:
@@ -1349,33 +2437,31 @@ async def send_question(
                 "message": question,
             }
         )
-
-    try:
-        async with get_session() as session:
-            session.add(
-                TelemetryRecord(
-                    session_id=state.session_id,
-                    event_type="question",
-                    group_name=state.group,
-                    payload=json.dumps(
-                        {
-                            "turn": state.turn,
-                            "answer_turn": state.turn + 1,
-                            "question": question,
-                            "preface": preface,
-                            "style": state.style.value,
-                            "pack": state.pack,
-                            "difficulty": state.difficulty,
-                            "source": question_source,
-                        }
-                    ),
-                )
-            )
-            await session.commit()
-    except Exception as exc:
-        LOG.warning("Failed to log question telemetry (session=%s): %s", state.session_id, exc)
+        # The answer to this follow-up leads to a new main question; start working on it now.
+        start_question_prefetch(state)
+
+    await record_writer.put(
+        TelemetryRecord(
+            session_id=state.session_id,
+            event_type="question",
+            group_name=state.group,
+            payload=json.dumps(
+                {
+                    "turn": state.turn,
+                    "answer_turn": state.turn + 1,
+                    "question": question,
+                    "preface": preface,
+                    "style": state.style.value,
+                    "pack": state.pack,
+                    "difficulty": state.difficulty,
+                    "source": question_source,
+                }
+            ),
+        )
+    )
 
 
+@traced("send_reaction")
 async def send_reaction(
     ws: WebSocket, state: SessionState, answer: str, question: str, turn: int, metrics: Optional[Dict[str, Any]] = None
 ) -> Tuple[str, List[Dict[str, str]]]:
@@ -1383,7 +2469,17 @@ async def send_reaction(
     tips: Optional[List[Dict[str, str]]] = None
 
     non_answer = _is_non_answer(answer or "")
-    llm_result = await llm_generate_coaching(state.style, question, answer, turn, metrics)
+    # Only stream the follow-up when it will actually be asked next; otherwise the client would show text we discard.
+    final_turn = state.max_questions is not None and state.turn >= state.max_questions
+    on_delta: Optional[DeltaCallback] = None
+    if not non_answer and not state.awaiting_followup and not final_turn:
+
+        async def forward_delta(delta: str) -> None:
+            await ws.send_json({"type": "interviewer_message_delta", "turn": turn, "style": state.style, "delta": delta})
+
+        on_delta = forward_delta
+    with span("llm.coaching", streamed=on_delta is not None):
+        llm_result = await llm_generate_coaching(state.style, question, answer, turn, metrics, on_delta=on_delta)
     if llm_result:
         follow_up, tips = llm_result
 
@@ -1391,10 +2487,12 @@ async def send_reaction(
         follow_up = pick_follow_up(state.style, answer, metrics, pack=state.pack)
 
     if not follow_up:
-        follow_up = pick_follow_up(state.style, answer, metrics, pack=state.pack)
+        with span("fallback.follow_up"):
+            follow_up = pick_follow_up(state.style, answer, metrics, pack=state.pack)
         LOG.info("Follow-up fallback: style=%s turn=%s", state.style, turn)
     if not tips:
-        tips = generate_coaching(state.style, answer, metrics)
+        with span("fallback.tips"):
+            tips = generate_coaching(state.style, answer, metrics)
         LOG.info("Tips fallback: style=%s turn=%s", state.style, turn)
 
     return follow_up or "", tips
@@ -1415,6 +2513,7 @@ async def handle_message(ws: WebSocket, state: SessionState, payload: Dict[str,
         requested_max_questions = payload.get("maxQuestions")
         requested_duration_seconds = payload.get("durationSeconds")
         requested_custom_questions = payload.get("customQuestions")
+        cancel_question_prefetch(state)
         state.turn = 0
         state.last_question = None
         state.history = []
@@ -1438,34 +2537,35 @@ async def handle_message(ws: WebSocket, state: SessionState, payload: Dict[str,
         if requested_style and requested_style in InterviewerStyle._value2member_map_:
             state.style = InterviewerStyle(requested_style)
         state.group = group
-        async with get_session() as session:
-            session.add(
-                SessionRecord(
-                    id=state.session_id,
-                    style=state.style.value,
-                    group_name=group,
-                    consented=state.consented,
-                    accent=state.accent,
-                    notes=state.notes,
+        with span("db.session_insert"):
+            async with get_session() as session:
+                session.add(
+                    SessionRecord(
+                        id=state.session_id,
+                        style=state.style.value,
+                        group_name=group,
+                        consented=state.consented,
+                        accent=state.accent,
+                        notes=state.notes,
+                    )
                 )
-            )
-            session.add(
-                TelemetryRecord(
-                    session_id=state.session_id,
-                    event_type="session_meta",
-                    group_name=group,
-                    payload=json.dumps(
-                        {
-                            "pack": state.pack,
-                            "difficulty": state.difficulty,
-                            "max_questions": state.max_questions,
-                            "duration_seconds": state.duration_seconds,
-                            "custom_questions": state.custom_questions,
-                        }
-                    ),
+                session.add(
+                    TelemetryRecord(
+                        session_id=state.session_id,
+                        event_type="session_meta",
+                        group_name=group,
+                        payload=json.dumps(
+                            {
+                                "pack": state.pack,
+                                "difficulty": state.difficulty,
+                                "max_questions": state.max_questions,
+                                "duration_seconds": state.duration_seconds,
+                                "custom_questions": state.custom_questions,
+                            }
+                        ),
+                    )
                 )
-            )
-            await session.commit()
+                await session.commit()
         await ws.send_json(
             {
                 "type": "session_started",
@@ -1484,10 +2584,44 @@ async def handle_message(ws: WebSocket, state: SessionState, payload: Dict[str,
         await send_question(ws, state)
         return
 
+    if msg_type == "resume_session":
+        resume_id = payload.get("session_id") or payload.get("sessionId")
+        snapshot = await session_store.load(str(resume_id)) if resume_id else None
+        if snapshot is None:
+            await ws.send_json(
+                {"type": "error", "error": "session_not_found", "message": "No resumable session with that id."}
+            )
+            return
+        cancel_question_prefetch(state)
+        state.restore(snapshot)
+        remaining = (
+            max(0, round(state.session_ends_at - time.monotonic())) if state.session_ends_at is not None else None
+        )
+        await ws.send_json(
+            {
+                "type": "session_resumed",
+                "session_id": state.session_id,
+                "style": state.style,
+                "turn": state.turn,
+                "group": state.group,
+                "consent": state.consented,
+                "pack": state.pack,
+                "difficulty": state.difficulty,
+                "maxQuestions": state.max_questions,
+                "durationSeconds": state.duration_seconds,
+                "remainingSeconds": remaining,
+                "question": state.last_question,
+                "awaitingFollowup": state.awaiting_followup,
+                "ended": state.ended,
+            }
+        )
+        return
+
     if msg_type == "switch_style":
         new_style = payload.get("style")
         if new_style and new_style in InterviewerStyle._value2member_map_:
             state.style = InterviewerStyle(new_style)
+            cancel_question_prefetch(state)
             await ws.send_json({"type": "style_switched", "style": state.style})
             if state.max_questions is not None and state.turn >= state.max_questions:
                 await end_session(ws, state, reason="max_questions")
@@ -1518,24 +2652,26 @@ async def handle_message(ws: WebSocket, state: SessionState, payload: Dict[str,
             response = refusal_clarification_response(state.style, prompt_question)
         else:
             source = "llm"
-            response = await llm_generate_clarification(
-                state.style,
-                prompt_question=prompt_question,
-                clarification_question=clarification,
-                turn=state.turn,
-                history=state.history,
-                pack=state.pack,
-                difficulty=state.difficulty,
-            )
-            if not response:
-                source = "fallback"
-                response = fallback_clarification_response(
+            with span("llm.clarification"):
+                response = await llm_generate_clarification(
                     state.style,
                     prompt_question=prompt_question,
                     clarification_question=clarification,
+                    turn=state.turn,
+                    history=state.history,
                     pack=state.pack,
                     difficulty=state.difficulty,
                 )
+            if not response:
+                source = "fallback"
+                with span("fallback.clarification"):
+                    response = fallback_clarification_response(
+                        state.style,
+                        prompt_question=prompt_question,
+                        clarification_question=clarification,
+                        pack=state.pack,
+                        difficulty=state.difficulty,
+                    )
 
         await ws.send_json(
             {
@@ -1546,26 +2682,21 @@ async def handle_message(ws: WebSocket, state: SessionState, payload: Dict[str,
                 "source": source,
             }
         )
-        try:
-            async with get_session() as session:
-                session.add(
-                    TelemetryRecord(
-                        session_id=state.session_id,
-                        event_type="clarification",
-                        group_name=state.group,
-                        payload=json.dumps(
-                            {
-                                "turn": state.turn,
-                                "prompt": prompt_question,
-                                "clarification": clarification,
-                                "source": source,
-                            }
-                        ),
-                    )
-                )
-                await session.commit()
-        except Exception as exc:
-            LOG.warning("Failed to log clarification telemetry (session=%s): %s", state.session_id, exc)
+        await record_writer.put(
+            TelemetryRecord(
+                session_id=state.session_id,
+                event_type="clarification",
+                group_name=state.group,
+                payload=json.dumps(
+                    {
+                        "turn": state.turn,
+                        "prompt": prompt_question,
+                        "clarification": clarification,
+                        "source": source,
+                    }
+                ),
+            )
+        )
         return
 
     if msg_type == "user_answer":
@@ -1574,61 +2705,74 @@ async def handle_message(ws: WebSocket, state: SessionState, payload: Dict[str,
         state.turn += 1
         turn_label = state.turn  # maintain existing turn numbering for the UI/DB
         metrics = payload.get("metrics") if isinstance(payload.get("metrics"), dict) else {}
-        async with get_session() as session:
-            session.add(
-                AnswerRecord(
-                    session_id=state.session_id,
-                    turn=turn_label,
-                    answer=answer,
-                    style=state.style.value,
-                    group_name=state.group,
-                    speaking_rate=metrics.get("speakingRate"),
-                    pause_ratio=metrics.get("pauseRatio"),
-                    gaze=metrics.get("gaze"),
-                    fillers=metrics.get("fillers"),
-                )
+        await record_writer.put(
+            AnswerRecord(
+                session_id=state.session_id,
+                turn=turn_label,
+                answer=answer,
+                style=state.style.value,
+                group_name=state.group,
+                speaking_rate=metrics.get("speakingRate"),
+                pause_ratio=metrics.get("pauseRatio"),
+                gaze=metrics.get("gaze"),
+                fillers=metrics.get("fillers"),
             )
-            await session.commit()
+        )
+
         # keep a small rolling history to guide the next question
         state.history.append((asked_question, answer))
         if len(state.history) > 4:
             state.history = state.history[-4:]
 
-        follow_up, tips = await send_reaction(ws, state, answer, asked_question, turn_label, metrics)
-        if tips:
-            await ws.send_json({"type": "tips", "turn": turn_label, "items": tips})
-            try:
-                async with get_session() as session:
-                    session.add(
-                        TelemetryRecord(
-                            session_id=state.session_id,
-                            event_type="tips",
-                            group_name=state.group,
-                            payload=json.dumps({"turn": turn_label, "items": tips}),
-                        )
+        # An answer to a follow-up is followed by a fresh main question, which doesn't depend on the coaching
+        # output, so resolve it (from the prefetch when possible) alongside the coaching call. Not when the session
+        # ends after this turn, or could run out of time during coaching: the question would start streaming
+        # (`question_delta`) and consume the custom queue without ever being asked.
+        question_limit = state.max_questions is not None and state.turn >= state.max_questions
+        time_running_out = (
+            state.session_ends_at is not None and time.monotonic() + NVIDIA_LLM_TIMEOUT >= state.session_ends_at
+        )
+        question_task: Optional[asyncio.Task[Tuple[str, str]]] = None
+        if state.awaiting_followup and not question_limit and not time_running_out:
+            question_task = asyncio.create_task(resolve_next_question(ws, state, answer))
+        else:
+            cancel_question_prefetch(state)
+        try:
+            follow_up, tips = await send_reaction(ws, state, answer, asked_question, turn_label, metrics)
+            if tips:
+                await ws.send_json({"type": "tips", "turn": turn_label, "items": tips})
+                await record_writer.put(
+                    TelemetryRecord(
+                        session_id=state.session_id,
+                        event_type="tips",
+                        group_name=state.group,
+                        payload=json.dumps({"turn": turn_label, "items": tips}),
                     )
-                    await session.commit()
-            except Exception as exc:
-                LOG.warning("Failed to log tips telemetry (session=%s): %s", state.session_id, exc)
+                )
 
-        if state.max_questions is not None and state.turn >= state.max_questions:
-            await end_session(ws, state, reason="max_questions")
-            return
-        if state.session_ends_at is not None and time.monotonic() >= state.session_ends_at:
-            await end_session(ws, state, reason="time_limit")
-            return
+            if state.max_questions is not None and state.turn >= state.max_questions:
+                await end_session(ws, state, reason="max_questions")
+                return
+            if state.session_ends_at is not None and time.monotonic() >= state.session_ends_at:
+                await end_session(ws, state, reason="time_limit")
+                return
 
-        if state.awaiting_followup:
-            # This answer was for a follow-up; resume normal questioning.
-            state.awaiting_followup = False
-            await send_question(ws, state)
-        else:
-            # This answer was for the main prompt; if we have a follow-up, ask it and wait for the answer before moving on.
-            if follow_up:
-                state.awaiting_followup = True
-                await send_question(ws, state, override_question=follow_up, source="follow_up")
+            if state.awaiting_followup:
+                # This answer was for a follow-up; resume normal questioning.
+                state.awaiting_followup = False
+                prepared = await question_task if question_task is not None else None
+                await send_question(ws, state, prepared=prepared)
             else:
-                await send_question(ws, state)
+                # This answer was for the main prompt; if we have a follow-up, ask it and wait for the answer before moving on.
+                if follow_up:
+                    state.awaiting_followup = True
+                    await send_question(ws, state, override_question=follow_up, source="follow_up")
+                else:
+                    await send_question(ws, state)
+        finally:
+            # Session ended or the socket dropped mid-turn: don't leave the speculative question running.
+            if question_task is not None and not question_task.done():
+                question_task.cancel()
         return
 
     if msg_type == "ping":
@@ -1636,31 +2780,27 @@ async def handle_message(ws: WebSocket, state: SessionState, payload: Dict[str,
         return
 
     if msg_type == "checkin":
-        async with get_session() as session:
-            session.add(
-                CheckInRecord(
-                    session_id=state.session_id,
-                    group_name=payload.get("group") or state.group,
-                    confidence=int(payload.get("confidence", 0)),
-                    stress=int(payload.get("stress", 0)),
-                )
+        await record_writer.put(
+            CheckInRecord(
+                session_id=state.session_id,
+                group_name=payload.get("group") or state.group,
+                confidence=int(payload.get("confidence", 0)),
+                stress=int(payload.get("stress", 0)),
             )
-            await session.commit()
+        )
         await ws.send_json({"type": "checkin_logged"})
         return
 
     if msg_type == "telemetry":
-        async with get_session() as session:
-            session.add(
-                TelemetryRecord(
-                    session_id=state.session_id,
-                    event_type=payload.get("event") or "unknown",
-                    latency_ms=payload.get("latencyMs"),
-                    group_name=state.group,
-                    payload=json.dumps(payload.get("data") or {}),
-                )
+        await record_writer.put(
+            TelemetryRecord(
+                session_id=state.session_id,
+                event_type=payload.get("event") or "unknown",
+                latency_ms=payload.get("latencyMs"),
+                group_name=state.group,
+                payload=json.dumps(payload.get("data") or {}),
             )
-            await session.commit()
+        )
         return
 
     await ws.send_json({"type": "error", "message": f"Unrecognized message type: {msg_type}"})
@@ -1668,7 +2808,9 @@ async def handle_message(ws: WebSocket, state: SessionState, payload: Dict[str,
 
 @app.websocket("/ws/interview")
 async def interview_socket(ws: WebSocket) -> None:
+    global active_interviews
     await ws.accept()
+    active_interviews += 1
     state = SessionState()
     await ws.send_json({"type": "session_ready", "session_id": state.session_id, "style": state.style})
 
@@ -1695,12 +2837,24 @@ async def interview_socket(ws: WebSocket) -> None:
                 await ws.send_json({"type": "error", "message": "Payload must be a JSON object"})
                 continue
 
-            await handle_message(ws, state, payload)
+            msg_type = payload.get("type")
+            label = msg_type if msg_type in WS_MESSAGE_TYPES else "other"
+            with span(f"ws.{label}", **{"session.id": state.session_id, "turn": state.turn}) as root:
+                with WS_MESSAGE_SECONDS.time(msg_type=label):
+                    await handle_message(ws, state, payload)
+                if not state.ended and msg_type in STATEFUL_MESSAGES:
+                    await save_session_state(state)
+                root.set_attribute("session.id", state.session_id)
+            if msg_type in TRACED_MESSAGES:
+                await record_trace(state.session_id, state.group, root, msg_type, state.turn)
             if state.ended:
                 return
             await asyncio.sleep(0)  # yield control
     except WebSocketDisconnect:
         return
+    finally:
+        active_interviews -= 1
+        cancel_question_prefetch(state)
 
 
 class CheckInPayload(BaseModel):
@@ -1712,16 +2866,14 @@ class CheckInPayload(BaseModel):
 
 @app.post("/checkins")
 async def log_checkin(payload: CheckInPayload) -> Dict[str, str]:
-    async with get_session() as session:
-        session.add(
-            CheckInRecord(
-                session_id=payload.session_id,
-                group_name=payload.group,
-                confidence=payload.confidence,
-                stress=payload.stress,
-            )
+    await record_writer.put(
+        CheckInRecord(
+            session_id=payload.session_id,
+            group_name=payload.group,
+            confidence=payload.confidence,
+            stress=payload.stress,
         )
-        await session.commit()
+    )
     return {"status": "ok"}
 
 
@@ -1776,126 +2928,131 @@ async def list_comments(session_id: str) -> Dict[str, Any]:
         return {"items": [c.model_dump() for c in comments]}
 
 
-@app.get("/export/session/{session_id}")
-async def export_session(session_id: str) -> Dict[str, Any]:
-    async with get_session() as session:
-        session_row = await session.get(SessionRecord, session_id)
-        answers = (
-            await session.exec(select(AnswerRecord).where(AnswerRecord.session_id == session_id))
-        ).all()
-        checkins = (
-            await session.exec(select(CheckInRecord).where(CheckInRecord.session_id == session_id))
-        ).all()
-        telemetry = (
-            await session.exec(select(TelemetryRecord).where(TelemetryRecord.session_id == session_id))
-        ).all()
+@app.get("/export/sessions.ndjson")
+async def export_sessions_ndjson(
+    group: Optional[str] = None,
+    style: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    include: str = "answer,checkin,telemetry",
+) -> StreamingResponse:
+    records = [item.strip() for item in include.split(",") if item.strip()]
+    return StreamingResponse(
+        sessions_ndjson(group=group, style=style, since=since, until=until, include=records),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="sessions.ndjson"'},
+    )
 
-        if not session_row:
-            return {"error": "not_found"}
 
-        return {
-            "session": session_row.model_dump(),
-            "answers": [a.model_dump() for a in answers],
-            "checkins": [c.model_dump() for c in checkins],
-            "telemetry": [t.model_dump() for t in telemetry],
-        }
+# Registered before `/export/session/{session_id}`, whose path parameter would otherwise swallow the suffix.
+@app.get("/export/session/{session_id}.ndjson", response_model=None)
+async def export_session_ndjson(session_id: str) -> Union[Dict[str, Any], StreamingResponse]:
+    if not await session_exists(session_id):
+        return {"error": "not_found"}
+    return StreamingResponse(session_ndjson(session_id), media_type="application/x-ndjson")
 
 
-@app.get("/sessions")
-async def list_sessions(limit: int = 20) -> Dict[str, Any]:
-    limit = max(1, min(int(limit), 100))
+@app.get("/export/session/{session_id}", response_model=None)
+async def export_session(session_id: str) -> Union[Dict[str, Any], StreamingResponse]:
+    if not await session_exists(session_id):
+        return {"error": "not_found"}
+    return StreamingResponse(session_document(session_id), media_type="application/json")
 
-    def mean(values: List[Optional[float]]) -> Optional[float]:
-        vals = [v for v in values if v is not None]
-        return sum(vals) / len(vals) if vals else None
 
+@app.get("/sessions")
+async def list_sessions(
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    group: Optional[str] = None,
+    style: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Any:
     async with get_session() as session:
-        sessions = (
-            await session.exec(select(SessionRecord).order_by(SessionRecord.created_at.desc()).limit(limit))
-        ).all()
-
-        items: List[Dict[str, Any]] = []
-        for row in sessions:
-            answers = (
-                await session.exec(select(AnswerRecord).where(AnswerRecord.session_id == row.id))
-            ).all()
-            last_answer_at = max((a.created_at for a in answers), default=None)
-            items.append(
-                {
-                    **row.model_dump(),
-                    "n_answers": len(answers),
-                    "last_turn": max((a.turn for a in answers), default=0),
-                    "last_answer_at": last_answer_at,
-                    "avg_speaking_rate": mean([a.speaking_rate for a in answers]),
-                    "avg_pause_ratio": mean([a.pause_ratio for a in answers]),
-                    "avg_gaze": mean([a.gaze for a in answers]),
-                    "avg_fillers": mean([float(a.fillers) if a.fillers is not None else None for a in answers]),
-                }
+        try:
+            return await list_sessions_page(
+                session, limit=limit, cursor=cursor, group=group, style=style, since=since, until=until
+            )
+        except InvalidCursor as exc:
+            return Response(
+                content=json.dumps({"error": str(exc)}), media_type="application/json", status_code=400
             )
-
-        return {"items": items}
 
 
 @app.get("/metrics/summary")
 async def metrics_summary() -> Dict[str, Any]:
-    async with get_session() as session:
-        stats: Dict[str, Dict[str, Any]] = {}
-        for group in ["control", "treatment"]:
-            answers = (
-                await session.exec(select(AnswerRecord).where(AnswerRecord.group_name == group))
-            ).all()
-            checkins = (
-                await session.exec(select(CheckInRecord).where(CheckInRecord.group_name == group))
-            ).all()
-            telemetry = (
-                await session.exec(
-                    select(TelemetryRecord).where(
-                        TelemetryRecord.event_type == "latency", TelemetryRecord.group_name == group
-                    )
-                )
-            ).all()
-            stt_events = (
-                await session.exec(
-                    select(TelemetryRecord).where(
-                        TelemetryRecord.event_type == "stt", TelemetryRecord.group_name == group
-                    )
-                )
-            ).all()
-
-            def mean(values: List[Optional[float]]) -> Optional[float]:
-                vals = [v for v in values if v is not None]
-                return sum(vals) / len(vals) if vals else None
-
-            stats[group] = {
-                "n_answers": len(answers),
-                "n_checkins": len(checkins),
-                "n_latency": len(telemetry),
-                "n_stt": len(stt_events),
-                "avg_speaking_rate": mean([a.speaking_rate for a in answers]),
-                "avg_pause_ratio": mean([a.pause_ratio for a in answers]),
-                "avg_gaze": mean([a.gaze for a in answers]),
-                "avg_fillers": mean([float(a.fillers) if a.fillers is not None else None for a in answers]),
-                "avg_confidence": mean([float(c.confidence) for c in checkins]),
-                "avg_stress": mean([float(c.stress) for c in checkins]),
-                "avg_latency_ms": mean([t.latency_ms for t in telemetry]),
-                "avg_stt_latency_ms": mean([t.latency_ms for t in stt_events]),
-            }
+    return await metrics_summary_data()
 
-        def delta(key: str) -> Optional[float]:
-            t = stats["treatment"].get(key)
-            c = stats["control"].get(key)
-            if t is None or c is None:
-                return None
-            return t - c
 
-        return {
-            "groups": stats,
-            "delta": {
-                "speaking_rate": delta("avg_speaking_rate"),
-                "pause_ratio": delta("avg_pause_ratio"),
-                "gaze": delta("avg_gaze"),
-                "fillers": delta("avg_fillers"),
-                "confidence": delta("avg_confidence"),
-                "stress": delta("avg_stress"),
-            },
-        }
+@app.get("/metrics")
+async def prometheus_metrics() -> Response:
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+# Diagnostics. Callers must send ADMIN_TOKEN as X-Admin-Token; without a configured token the endpoints are off
+# (a peer address can't be trusted behind a same-host proxy, and a profile pins a thread for minutes).
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+profile_lock = asyncio.Lock()
+
+
+def _admin_denied(request: Request) -> Optional[Response]:
+    if not ADMIN_TOKEN:
+        return Response(content=json.dumps({"error": "admin_disabled"}), media_type="application/json", status_code=404)
+    token = request.headers.get("x-admin-token", "")
+    if hmac.compare_digest(token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+        return None
+    return Response(content=json.dumps({"error": "forbidden"}), media_type="application/json", status_code=403)
+
+
+@app.get("/admin/loop-blocking", response_model=None)
+async def loop_blocking_report(request: Request) -> Union[Dict[str, Any], Response]:
+    """Event-loop stalls above the threshold, grouped by code location (with the worst stall's stack)."""
+    denied = _admin_denied(request)
+    if denied is not None:
+        return denied
+    return loop_detector.report()
+
+
+@app.post("/admin/loop-blocking", response_model=None)
+async def loop_blocking_configure(
+    request: Request, enabled: bool = True, threshold_ms: Optional[float] = None, reset: bool = False
+) -> Union[Dict[str, Any], Response]:
+    """Turn the blocking detector on or off at runtime (no restart needed)."""
+    denied = _admin_denied(request)
+    if denied is not None:
+        return denied
+    if reset:
+        loop_detector.reset()
+    if enabled:
+        if threshold_ms is not None and loop_detector.enabled:
+            loop_detector.stop()
+        loop_detector.start(threshold_ms)
+    else:
+        loop_detector.stop()
+    return loop_detector.report()
+
+
+@app.post("/admin/profile", response_model=None)
+async def sampling_profile(
+    request: Request, seconds: float = 30.0, interval_ms: float = 5.0, threads: str = "loop"
+) -> Response:
+    """Sample stacks for `seconds` and return them as collapsed stacks (flamegraph.pl / speedscope input)."""
+    denied = _admin_denied(request)
+    if denied is not None:
+        return denied
+    if profile_lock.locked():
+        return Response(
+            content=json.dumps({"error": "profile_in_progress"}), media_type="application/json", status_code=409
+        )
+    seconds = max(0.1, min(seconds, PROFILE_MAX_SECONDS))
+    interval = max(0.001, interval_ms / 1000.0)
+    thread_ids = None if threads == "all" else {loop_detector.loop_thread_id or threading.get_ident()}
+    async with profile_lock:
+        # Sampling runs on its own thread, so the loop being profiled keeps serving while we wait.
+        collapsed = await asyncio.to_thread(sample_profile, seconds, interval, thread_ids)
+    filename = f"profile-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.folded"
+    return Response(
+        content=collapsed,
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
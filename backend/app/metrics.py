@@ -0,0 +1,318 @@
+"""
+A/B dashboard aggregates for `/metrics/summary`.
+
+Per-group counts and averages are computed in SQL: one `UNION ALL` of grouped `COUNT`/`SUM` selects, never loading
+rows into Python. With `METRICS_ROLLUP=1` the same (count, sum) pairs are also kept in `MetricRollupRecord`,
+incremented in the write-behind queue's insert transaction, so the summary reads a handful of rollup rows instead
+of scanning the base tables. Rebuild the rollup from scratch with `python -m app.metrics --rebuild`.
+
+The rollup also records, per base table, the highest id it has applied (rows with group `_applied`). At startup
+`ensure_rollup` compares those with the tables' current max ids. If rows were inserted without being rolled up (the
+flag was off for a while, or the table was never built), it rebuilds. Rebuilds lock the rollup table first and
+re-check under the lock, so workers starting together rebuild once, and concurrent write-behind batches are never
+lost. All workers must share the `METRICS_ROLLUP` setting: a rollup-maintaining worker's batch moves the high-water
+mark past rows inserted by a worker that isn't maintaining it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import Float, case, cast, delete, false, func, literal, null, select, text, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from app.db import engine, get_session
+from app.models import AnswerRecord, CheckInRecord, MetricRollupRecord, TelemetryRecord
+
+LOG = logging.getLogger("interview.metrics")
+
+GROUPS = ("control", "treatment")
+# Rollup rows with this group hold the highest applied id per base table (metric = table name) in `value_count`.
+APPLIED_GROUP = "_applied"
+METRICS_ROLLUP = os.getenv("METRICS_ROLLUP", "0").lower() in ("1", "true", "yes")
+
+# Totals keyed by (group, summary key) -> (count, sum); `n_*` keys only use the count.
+Totals = Dict[Tuple[str, str], Tuple[int, float]]
+
+
+class SummarySource:
+    def __init__(
+        self,
+        name: str,
+        model: Type[SQLModel],
+        count_key: str,
+        averages: Dict[str, str],
+        event_type: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.model = model
+        self.count_key = count_key
+        self.averages = averages  # summary key -> column name
+        self.event_type = event_type
+
+    def matches(self, record: SQLModel) -> bool:
+        if not isinstance(record, self.model) or getattr(record, "group_name", None) is None:
+            return False
+        return self.event_type is None or getattr(record, "event_type", None) == self.event_type
+
+
+SOURCES: Sequence[SummarySource] = (
+    SummarySource(
+        "answers",
+        AnswerRecord,
+        "n_answers",
+        {
+            "avg_speaking_rate": "speaking_rate",
+            "avg_pause_ratio": "pause_ratio",
+            "avg_gaze": "gaze",
+            "avg_fillers": "fillers",
+        },
+    ),
+    SummarySource("checkins", CheckInRecord, "n_checkins", {"avg_confidence": "confidence", "avg_stress": "stress"}),
+    SummarySource("latency", TelemetryRecord, "n_latency", {"avg_latency_ms": "latency_ms"}, event_type="latency"),
+    SummarySource("stt", TelemetryRecord, "n_stt", {"avg_stt_latency_ms": "latency_ms"}, event_type="stt"),
+)
+_WIDTH = max(len(source.averages) for source in SOURCES)
+ROLLUP_MODELS: Sequence[Type[SQLModel]] = tuple(dict.fromkeys(source.model for source in SOURCES))
+
+
+def _grouped_select(source: SummarySource, groups: Optional[Sequence[str]]) -> Any:
+    model: Any = source.model
+    columns: List[Any] = [
+        literal(source.name).label("source"),
+        model.group_name.label("group_name"),
+        func.count().label("n"),
+    ]
+    names = list(source.averages.values())
+    for idx in range(_WIDTH):
+        if idx < len(names):
+            column = getattr(model, names[idx])
+            columns += [func.count(column), func.sum(cast(column, Float))]
+        else:
+            # Pad so every branch of the UNION has the same shape.
+            columns += [literal(0), cast(null(), Float)]
+    stmt = select(*columns).group_by(model.group_name)
+    stmt = stmt.where(model.group_name.in_(groups)) if groups else stmt.where(model.group_name.is_not(None))
+    if source.event_type is not None:
+        stmt = stmt.where(model.event_type == source.event_type)
+    return stmt
+
+
+async def compute_totals(session: AsyncSession, groups: Optional[Sequence[str]] = GROUPS) -> Totals:
+    """Scan the base tables once with grouped aggregates."""
+    by_name = {source.name: source for source in SOURCES}
+    query = union_all(*(_grouped_select(source, groups) for source in SOURCES))
+    totals: Totals = {}
+    for row in (await session.execute(query)).all():
+        source = by_name[row[0]]
+        group = row[1]
+        totals[(group, source.count_key)] = (int(row[2]), 0.0)
+        for idx, key in enumerate(source.averages):
+            count, total = row[3 + 2 * idx], row[4 + 2 * idx]
+            totals[(group, key)] = (int(count or 0), float(total or 0.0))
+    return totals
+
+
+async def read_rollup(session: AsyncSession, groups: Sequence[str] = GROUPS) -> Totals:
+    rollup: Any = MetricRollupRecord
+    stmt = select(rollup.group_name, rollup.metric, rollup.value_count, rollup.value_sum).where(
+        rollup.group_name.in_(groups)
+    )
+    rows = (await session.execute(stmt)).all()
+    return {(group, metric): (int(count), float(total)) for group, metric, count, total in rows}
+
+
+def summarize(totals: Totals) -> Dict[str, Any]:
+    """Build the `/metrics/summary` response from (count, sum) totals."""
+    stats: Dict[str, Dict[str, Any]] = {}
+    for group in GROUPS:
+        group_stats: Dict[str, Any] = {}
+        for source in SOURCES:
+            group_stats[source.count_key] = totals.get((group, source.count_key), (0, 0.0))[0]
+        for source in SOURCES:
+            for key in source.averages:
+                count, total = totals.get((group, key), (0, 0.0))
+                group_stats[key] = total / count if count else None
+        stats[group] = group_stats
+
+    def delta(key: str) -> Optional[float]:
+        t = stats["treatment"].get(key)
+        c = stats["control"].get(key)
+        if t is None or c is None:
+            return None
+        return t - c
+
+    return {
+        "groups": stats,
+        "delta": {
+            "speaking_rate": delta("avg_speaking_rate"),
+            "pause_ratio": delta("avg_pause_ratio"),
+            "gaze": delta("avg_gaze"),
+            "fillers": delta("avg_fillers"),
+            "confidence": delta("avg_confidence"),
+            "stress": delta("avg_stress"),
+        },
+    }
+
+
+async def metrics_summary_data() -> Dict[str, Any]:
+    async with get_session() as session:
+        totals = await read_rollup(session) if METRICS_ROLLUP else await compute_totals(session)
+    return summarize(totals)
+
+
+def rollup_deltas(records: Sequence[SQLModel]) -> Totals:
+    """Fold a batch of freshly inserted rows into per-(group, metric) increments."""
+    counts: Dict[Tuple[str, str], int] = defaultdict(int)
+    sums: Dict[Tuple[str, str], float] = defaultdict(float)
+    for record in records:
+        for source in SOURCES:
+            if not source.matches(record):
+                continue
+            group = getattr(record, "group_name")
+            counts[(group, source.count_key)] += 1
+            for key, column in source.averages.items():
+                value = getattr(record, column, None)
+                if value is not None:
+                    counts[(group, key)] += 1
+                    sums[(group, key)] += float(value)
+    return {key: (count, sums.get(key, 0.0)) for key, count in counts.items()}
+
+
+def _upsert_insert() -> Any:
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(MetricRollupRecord)
+
+
+async def _max_ids(session: AsyncSession, models: Sequence[Type[SQLModel]] = ROLLUP_MODELS) -> Dict[str, int]:
+    ids: Dict[str, int] = {}
+    for model in models:
+        table: Any = model.__table__  # type: ignore[attr-defined]
+        ids[table.name] = int((await session.execute(select(func.max(table.c.id)))).scalar() or 0)
+    return ids
+
+
+async def _applied_ids(session: AsyncSession) -> Dict[str, int]:
+    rollup: Any = MetricRollupRecord
+    stmt = select(rollup.metric, rollup.value_count).where(rollup.group_name == APPLIED_GROUP)
+    return {metric: int(value) for metric, value in (await session.execute(stmt)).all()}
+
+
+async def _rollup_stale(session: AsyncSession) -> bool:
+    applied = await _applied_ids(session)
+    return any(max_id > applied.get(name, 0) for name, max_id in (await _max_ids(session)).items())
+
+
+async def apply_rollup(session: AsyncSession, records: Sequence[SQLModel]) -> None:
+    """Increment the rollup for `records` inside the caller's transaction (the caller commits)."""
+    now = datetime.utcnow()
+    table = MetricRollupRecord.__table__
+    # Advance the per-table high-water mark; max(id) here includes this transaction's own inserts.
+    models = [model for model in ROLLUP_MODELS if any(isinstance(record, model) for record in records)]
+    for name, max_id in sorted((await _max_ids(session, models)).items()):
+        stmt = _upsert_insert().values(
+            group_name=APPLIED_GROUP, metric=name, value_count=max_id, value_sum=0.0, updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["group_name", "metric"],
+            set_={
+                "value_count": case(
+                    (stmt.excluded.value_count > table.c.value_count, stmt.excluded.value_count),
+                    else_=table.c.value_count,
+                ),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await session.execute(stmt)
+    deltas = rollup_deltas(records)
+    for (group, metric), (count, total) in sorted(deltas.items()):
+        stmt = _upsert_insert().values(
+            group_name=group, metric=metric, value_count=count, value_sum=total, updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["group_name", "metric"],
+            set_={
+                "value_count": table.c.value_count + stmt.excluded.value_count,
+                "value_sum": table.c.value_sum + stmt.excluded.value_sum,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await session.execute(stmt)
+
+
+async def _lock_rollup(session: AsyncSession) -> None:
+    """Hold off other rebuilds and write-behind batches until this transaction ends."""
+    if engine.dialect.name == "postgresql":
+        await session.execute(text(f"LOCK TABLE {MetricRollupRecord.__tablename__} IN EXCLUSIVE MODE"))
+    else:
+        # SQLite allows one writer: a write that matches nothing still takes the database write lock now.
+        rollup: Any = MetricRollupRecord
+        await session.execute(update(rollup).where(false()).values(value_count=rollup.value_count))
+
+
+async def rebuild_rollup(only_if_stale: bool = False) -> int:
+    """Recompute the rollup from the base tables; returns the number of rollup rows written (-1 if it was current).
+
+    Runs in one transaction that first locks the rollup table, so batches committed before the lock are counted by
+    the scan and batches after it wait and then add their increments on top.
+    """
+    async with get_session() as session:
+        await _lock_rollup(session)
+        if only_if_stale and not await _rollup_stale(session):
+            await session.rollback()
+            return -1
+        await session.execute(delete(MetricRollupRecord))
+        totals = await compute_totals(session, groups=None)
+        applied = await _max_ids(session)
+        now = datetime.utcnow()
+        for (group, metric), (count, total) in totals.items():
+            session.add(
+                MetricRollupRecord(group_name=group, metric=metric, value_count=count, value_sum=total, updated_at=now)
+            )
+        for name, max_id in applied.items():
+            session.add(
+                MetricRollupRecord(group_name=APPLIED_GROUP, metric=name, value_count=max_id, updated_at=now)
+            )
+        await session.commit()
+    return len(totals)
+
+
+async def ensure_rollup() -> None:
+    """Rebuild the rollup if base rows were inserted without being applied (first start, or the flag was off)."""
+    async with get_session() as session:
+        stale = await _rollup_stale(session)
+    if stale:
+        rows = await rebuild_rollup(only_if_stale=True)
+        if rows >= 0:
+            LOG.info("Rebuilt metrics rollup (%s rows)", rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain the /metrics/summary rollup table.")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute the rollup from the base tables.")
+    args = parser.parse_args()
+
+    from app.db import init_db
+
+    async def run() -> None:
+        await init_db()
+        if args.rebuild:
+            print(f"[metrics] rebuilt rollup: {await rebuild_rollup()} rows")
+        async with get_session() as session:
+            print(summarize(await compute_totals(session)))
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
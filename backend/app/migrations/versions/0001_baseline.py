@@ -0,0 +1,89 @@
+"""Baseline schema (the tables `create_all` used to create).
+
+Existing databases already have these tables, so each one is only created when missing; `alembic upgrade head`
+works the same on a fresh database and on one that predates migrations.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _missing(table: str) -> bool:
+    return not sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    if _missing("sessionrecord"):
+        op.create_table(
+            "sessionrecord",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("style", sa.String(), nullable=False),
+            sa.Column("group_name", sa.String(), nullable=True),
+            sa.Column("consented", sa.Boolean(), nullable=False),
+            sa.Column("accent", sa.String(), nullable=True),
+            sa.Column("notes", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+    if _missing("answerrecord"):
+        op.create_table(
+            "answerrecord",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("session_id", sa.String(), sa.ForeignKey("sessionrecord.id"), nullable=False),
+            sa.Column("turn", sa.Integer(), nullable=False),
+            sa.Column("answer", sa.String(), nullable=False),
+            sa.Column("style", sa.String(), nullable=False),
+            sa.Column("group_name", sa.String(), nullable=True),
+            sa.Column("speaking_rate", sa.Float(), nullable=True),
+            sa.Column("pause_ratio", sa.Float(), nullable=True),
+            sa.Column("gaze", sa.Float(), nullable=True),
+            sa.Column("fillers", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+    if _missing("telemetryrecord"):
+        op.create_table(
+            "telemetryrecord",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("session_id", sa.String(), sa.ForeignKey("sessionrecord.id"), nullable=False),
+            sa.Column("event_type", sa.String(), nullable=False),
+            sa.Column("latency_ms", sa.Float(), nullable=True),
+            sa.Column("group_name", sa.String(), nullable=True),
+            sa.Column("payload", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+    if _missing("checkinrecord"):
+        op.create_table(
+            "checkinrecord",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("session_id", sa.String(), sa.ForeignKey("sessionrecord.id"), nullable=False),
+            sa.Column("group_name", sa.String(), nullable=True),
+            sa.Column("confidence", sa.Integer(), nullable=False),
+            sa.Column("stress", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+    if _missing("metricrolluprecord"):
+        op.create_table(
+            "metricrolluprecord",
+            sa.Column("group_name", sa.String(), primary_key=True),
+            sa.Column("metric", sa.String(), primary_key=True),
+            sa.Column("value_count", sa.Integer(), nullable=False),
+            sa.Column("value_sum", sa.Float(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    for table in ("metricrolluprecord", "checkinrecord", "telemetryrecord", "answerrecord", "sessionrecord"):
+        op.drop_table(table)
@@ -0,0 +1,50 @@
+"""Composite indexes for the session, export, comment and metrics read paths.
+
+On Postgres the indexes are built with `CREATE INDEX CONCURRENTLY` outside a transaction, so a live deployment
+keeps accepting writes while they build. A build interrupted half-way leaves an INVALID index behind; drop it and
+re-run the upgrade.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES: List[Tuple[str, str, List[str]]] = [
+    ("ix_session_created_id", "sessionrecord", ["created_at", "id"]),
+    ("ix_session_group_created", "sessionrecord", ["group_name", "created_at"]),
+    ("ix_answer_session_turn", "answerrecord", ["session_id", "turn"]),
+    ("ix_telemetry_session_event_created", "telemetryrecord", ["session_id", "event_type", "created_at"]),
+    ("ix_telemetry_event_group_latency", "telemetryrecord", ["event_type", "group_name", "latency_ms"]),
+    ("ix_checkin_session_created", "checkinrecord", ["session_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,32 @@
+"""Interview state snapshots for resumable sessions (SESSION_STORE=sql).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("interviewstaterecord"):
+        op.create_table(
+            "interviewstaterecord",
+            sa.Column("session_id", sa.String(), primary_key=True),
+            sa.Column("state", sa.LargeBinary(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("interviewstaterecord")
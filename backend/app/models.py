@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Column, Index, LargeBinary
 from sqlmodel import Field, SQLModel
 
+class InterviewerStyle(str, Enum):
+    SUPPORTIVE = "supportive"
+    NEUTRAL = "neutral"
+    COLD = "cold"
+
+
+# Composite indexes mirror the read paths; keep them in sync with app/migrations/versions.
+
 
 class SessionRecord(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_session_created_id", "created_at", "id"),  # /sessions keyset pages
+        Index("ix_session_group_created", "group_name", "created_at"),  # /sessions?group=
+    )
+
     id: str = Field(primary_key=True)
     style: str
     group_name: Optional[str] = Field(default=None)
@@ -17,6 +32,8 @@ class SessionRecord(SQLModel, table=True):
 
 
 class AnswerRecord(SQLModel, table=True):
+    __table_args__ = (Index("ix_answer_session_turn", "session_id", "turn"),)  # export, /sessions aggregates
+
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: str = Field(foreign_key="sessionrecord.id")
     turn: int
@@ -31,6 +48,11 @@ class AnswerRecord(SQLModel, table=True):
 
 
 class TelemetryRecord(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_telemetry_session_event_created", "session_id", "event_type", "created_at"),  # comments, export
+        Index("ix_telemetry_event_group_latency", "event_type", "group_name", "latency_ms"),  # /metrics/summary
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: str = Field(foreign_key="sessionrecord.id")
     event_type: str
@@ -41,9 +63,29 @@ class TelemetryRecord(SQLModel, table=True):
 
 
 class CheckInRecord(SQLModel, table=True):
+    __table_args__ = (Index("ix_checkin_session_created", "session_id", "created_at"),)  # export
+
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: str = Field(foreign_key="sessionrecord.id")
     group_name: Optional[str] = Field(default=None)
     confidence: int
     stress: int
     created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class MetricRollupRecord(SQLModel, table=True):
+    """Running (count, sum) per group and summary metric; maintained only when METRICS_ROLLUP=1."""
+
+    group_name: str = Field(primary_key=True)
+    metric: str = Field(primary_key=True)
+    value_count: int = Field(default=0)
+    value_sum: float = Field(default=0.0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class InterviewStateRecord(SQLModel, table=True):
+    """Latest encoded `SessionState` snapshot per interview (see app/session_store.py); used when SESSION_STORE=sql."""
+
+    session_id: str = Field(primary_key=True)
+    state: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,95 @@
+"""
+Pre-synthesize every static interviewer line into the on-disk TTS cache.
+
+Run offline with `python -m app.prewarm` (or set TTS_PREWARM_ON_STARTUP=1 to run it as a background task).
+Entries already in the cache are skipped, so an interrupted run simply resumes where it stopped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+
+
+async def prewarm_tts_cache(
+    speakers: Optional[List[str]] = None,
+    language: Optional[str] = None,
+    limit: Optional[int] = None,
+    progress_every: int = 25,
+) -> Dict[str, int]:
+    from app import main
+    from app.tts_cache import DiskTtsCache
+
+    if not main.tts_slot.ready:
+        raise RuntimeError("tts model not loaded")
+    env_speakers = [s.strip() for s in os.getenv("TTS_PREWARM_SPEAKERS", "").split(",") if s.strip()]
+    speakers = speakers or env_speakers or [main._default_tts_speaker()]
+    language = language or main.TTS_LANGUAGE
+    jobs = [
+        (text, style.value, speaker)
+        for text, style in main.static_interviewer_lines()
+        for speaker in speakers
+    ]
+    if limit is not None:
+        jobs = jobs[:limit]
+
+    counts = {"total": len(jobs), "cached": 0, "synthesized": 0, "failed": 0}
+    started = time.perf_counter()
+    print(f"[prewarm] {len(jobs)} utterances x speakers={speakers} language={language} model={main.TTS_MODEL_NAME}")
+    for idx, (text, style, speaker) in enumerate(jobs, start=1):
+        speed = main.TTS_STYLE_SPEEDS.get(style, 1.0)
+        disk_key = DiskTtsCache.make_key(text, style, speaker, language, speed, main.TTS_MODEL_NAME)
+        if main.TTS_CACHE.path_for(disk_key).exists():
+            counts["cached"] += 1
+        else:
+            try:
+                # Same runner (and single-flight key) as /tts, so live requests for a line being warmed just join it.
+                audio = await main.tts_service.synthesize(
+                    (text, style, speaker, language, speed), text=text, speaker=speaker, language=language, speed=speed
+                )
+                await asyncio.to_thread(main.TTS_CACHE.put, disk_key, audio)
+                counts["synthesized"] += 1
+            except Exception as exc:  # pragma: no cover - runtime safeguard
+                counts["failed"] += 1
+                print(f"[prewarm] failed ({style}/{speaker}): {text[:60]!r}: {exc}")
+        if idx % progress_every == 0 or idx == len(jobs):
+            elapsed = time.perf_counter() - started
+            print(
+                f"[prewarm] {idx}/{len(jobs)} cached={counts['cached']} synthesized={counts['synthesized']} "
+                f"failed={counts['failed']} elapsed={elapsed:.1f}s"
+            )
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-synthesize static interviewer lines into the TTS cache.")
+    parser.add_argument("--speaker", action="append", dest="speakers", help="Speaker to warm (repeatable).")
+    parser.add_argument("--language", default=None, help="Language code (defaults to TTS_LANGUAGE).")
+    parser.add_argument("--limit", type=int, default=None, help="Only warm the first N utterances.")
+    parser.add_argument("--list", action="store_true", help="Print the utterances and exit without synthesizing.")
+    args = parser.parse_args()
+
+    from app import main as app_main
+
+    if args.list:
+        for text, style in app_main.static_interviewer_lines():
+            print(f"{style.value}\t{text}")
+        return
+
+    async def run() -> None:
+        # Loads XTTS locally, or with a gateway configuration (SERVICE_ROLE=api + JOB_TRANSPORT) waits for workers.
+        await app_main.tts_slot.load()
+        try:
+            await prewarm_tts_cache(args.speakers, args.language, args.limit)
+        finally:
+            app_main.tts_service.shutdown()
+            app_main.tts_runner.shutdown()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Event-loop diagnostics: a blocking detector and an on-demand sampling profiler.
+
+`BlockingDetector` keeps a heartbeat callback ticking on the event loop and a watchdog thread watching it. When the
+heartbeat is late by more than `threshold`, something is holding the loop. The watchdog captures the loop thread's
+stack while it is still stuck and attributes the stall to the innermost frame in this app (or the innermost frame
+overall). Once the loop recovers, the stall's duration is added to that location's count, total and max. Enable it
+with `LOOP_BLOCK_DETECT=1` or at runtime via `POST /admin/loop-blocking`.
+
+`sample_profile` samples thread stacks (`sys._current_frames`) on a background thread for a fixed time and returns
+them in the collapsed-stack format (`frame;frame;frame count`) used by flamegraph.pl, speedscope and inferno.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import sysconfig
+import threading
+import time
+import traceback
+from collections import Counter
+from types import FrameType
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.instrumentation import Counter as MetricCounter
+
+LOG = logging.getLogger("interview.profiling")
+
+LOOP_BLOCK_DETECT = os.getenv("LOOP_BLOCK_DETECT", "0").lower() in ("1", "true", "yes")
+LOOP_BLOCK_THRESHOLD_MS = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100"))
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "120"))
+MAX_STACK_FRAMES = 40
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(APP_DIR)
+STDLIB_DIR = sysconfig.get_paths()["stdlib"]
+
+LOOP_BLOCKS = MetricCounter("interview_event_loop_blocks", "Event-loop stalls longer than the detector threshold.")
+
+
+def _short_path(filename: str) -> str:
+    if filename.startswith(ROOT_DIR + os.sep):
+        return os.path.relpath(filename, ROOT_DIR)
+    idx = filename.rfind("site-packages" + os.sep)
+    if idx >= 0:
+        return filename[idx + len("site-packages") + 1 :]
+    if filename.startswith(STDLIB_DIR + os.sep):
+        return os.path.relpath(filename, STDLIB_DIR)
+    return os.path.basename(filename)
+
+
+def _location(frame: FrameType) -> str:
+    """Innermost frame that belongs to the app, else the innermost frame."""
+    current: Optional[FrameType] = frame
+    while current is not None:
+        if current.f_code.co_filename.startswith(APP_DIR + os.sep):
+            break
+        current = current.f_back
+    target = current or frame
+    return f"{_short_path(target.f_code.co_filename)}:{target.f_lineno} ({target.f_code.co_name})"
+
+
+class BlockingDetector:
+    def __init__(self, threshold_ms: float = LOOP_BLOCK_THRESHOLD_MS) -> None:
+        self.threshold = max(0.005, threshold_ms / 1000.0)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread_id: Optional[int] = None
+        self.enabled = False
+        self.blocks = 0
+        self.max_block_ms = 0.0
+        self._locations: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._last_beat = 0.0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._stop = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+        # Stall being watched: (heartbeat it started after, location, stack).
+        self._episode: Optional[Tuple[float, str, List[str]]] = None
+
+    @property
+    def tick(self) -> float:
+        return min(0.05, self.threshold / 2)
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Remember the loop (and its thread) without starting the detector; the profiler uses this too."""
+        self.loop = loop
+        self.loop_thread_id = threading.get_ident()
+
+    def start(self, threshold_ms: Optional[float] = None) -> None:
+        """Start watching; must be called on the event loop thread."""
+        if threshold_ms is not None:
+            self.threshold = max(0.005, threshold_ms / 1000.0)
+        if self.loop is None:
+            self.attach(asyncio.get_running_loop())
+        if self.enabled:
+            return
+        self.enabled = True
+        self._stop.clear()
+        self._beat()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        print(f"[profiling] event-loop blocking detector on (threshold {self.threshold * 1000:.0f} ms)")
+
+    def stop(self) -> None:
+        self.enabled = False
+        self._stop.set()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+        self._episode = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self.blocks = 0
+            self.max_block_ms = 0.0
+            self._locations.clear()
+
+    def _beat(self) -> None:
+        self._last_beat = time.monotonic()
+        if self.enabled and self.loop is not None:
+            self._handle = self.loop.call_later(self.tick, self._beat)
+
+    def _watch(self) -> None:
+        interval = max(0.002, self.threshold / 4)
+        while not self._stop.wait(interval):
+            beat = self._last_beat
+            late = time.monotonic() - beat - self.tick
+            if self._episode is None:
+                if late > self.threshold:
+                    self._capture(beat)
+            elif beat != self._episode[0]:
+                # The loop ran again; the stall lasted from the missed tick until this heartbeat.
+                self._finish(max(0.0, beat - self._episode[0] - self.tick))
+
+    def _capture(self, beat: float) -> None:
+        frame = sys._current_frames().get(self.loop_thread_id or -1)
+        if frame is None:
+            return
+        stack = traceback.format_stack(frame, limit=MAX_STACK_FRAMES)
+        self._episode = (beat, _location(frame), stack)
+
+    def _finish(self, seconds: float) -> None:
+        assert self._episode is not None
+        _, location, stack = self._episode
+        self._episode = None
+        ms = seconds * 1000
+        with self._lock:
+            self.blocks += 1
+            self.max_block_ms = max(self.max_block_ms, ms)
+            entry = self._locations.setdefault(location, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "stack": []})
+            entry["count"] += 1
+            entry["total_ms"] += ms
+            if ms >= entry["max_ms"]:
+                entry["max_ms"] = ms
+                entry["stack"] = stack
+        LOOP_BLOCKS.inc()
+        LOG.warning("Event loop blocked for %.0f ms at %s", ms, location)
+
+    def report(self, limit: int = 20) -> Dict[str, Any]:
+        with self._lock:
+            ranked = sorted(self._locations.items(), key=lambda kv: -kv[1]["total_ms"])[:limit]
+            locations = [
+                {
+                    "location": location,
+                    "count": entry["count"],
+                    "total_ms": round(entry["total_ms"], 1),
+                    "max_ms": round(entry["max_ms"], 1),
+                    "stack": [line.rstrip() for line in entry["stack"]],
+                }
+                for location, entry in ranked
+            ]
+            return {
+                "enabled": self.enabled,
+                "threshold_ms": round(self.threshold * 1000, 1),
+                "blocks": self.blocks,
+                "max_block_ms": round(self.max_block_ms, 1),
+                "locations": locations,
+            }
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+def sample_profile(seconds: float, interval: float, thread_ids: Optional[Set[int]] = None) -> str:
+    """Sample stacks of `thread_ids` (all threads when None) and return collapsed stacks, one per line."""
+    counts: "Counter[str]" = Counter()
+    me = threading.get_ident()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for tid, frame in sys._current_frames().items():
+            if tid == me or (thread_ids is not None and tid not in thread_ids):
+                continue
+            labels: List[str] = []
+            current: Optional[FrameType] = frame
+            while current is not None:
+                labels.append(_frame_label(current))
+                current = current.f_back
+            labels.append(names.get(tid, f"thread-{tid}"))
+            counts[";".join(reversed(labels)).replace("\n", " ")] += 1
+        time.sleep(interval)
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(counts.items()))
+
+
+detector = BlockingDetector()
@@ -0,0 +1,118 @@
+"""
+Load state for the heavyweight model subsystems (Whisper, XTTS).
+
+Each `ModelSlot` wraps a blocking loader. Loading runs on a worker thread so several models load in parallel
+while the event loop keeps serving `/health`, and concurrent `load()` calls share one attempt. Slots outside the
+process's `SERVICE_ROLE` stay `disabled` and their libraries are never imported. On a gateway whose models live in
+separate inference workers, a `RemoteSlot` stands in and tracks worker health instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+LOG = logging.getLogger("interview.readiness")
+
+
+class ModelSlot:
+    def __init__(self, name: str, loader: Callable[[], bool], enabled: bool = True) -> None:
+        self.name = name
+        self.loader = loader
+        self.enabled = enabled
+        self.state = "pending" if enabled else "disabled"
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self._task: Optional[asyncio.Task[bool]] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready"
+
+    def start(self) -> None:
+        """Kick off loading in the background (no-op if disabled, loading or already loaded)."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._load())
+
+    async def load(self) -> bool:
+        """Load (or wait for the in-flight load) and report whether the model is usable."""
+        if not self.enabled:
+            return False
+        self.start()
+        assert self._task is not None
+        return await asyncio.shield(self._task)
+
+    async def _load(self) -> bool:
+        self.state = "loading"
+        started = time.perf_counter()
+        try:
+            ok = await asyncio.to_thread(self.loader)
+        except Exception as exc:  # pragma: no cover - loaders report their own failures
+            LOG.exception("Loading %s failed", self.name)
+            ok = False
+            self.error = str(exc)
+        self.load_seconds = round(time.perf_counter() - started, 2)
+        self.state = "ready" if ok else "failed"
+        return ok
+
+    def status(self) -> Dict[str, Any]:
+        return {"state": self.state, "error": self.error, "load_seconds": self.load_seconds}
+
+
+class RemoteSlot:
+    """A model served by remote inference workers (split deployment): ready while any worker is healthy."""
+
+    def __init__(self, name: str, transport: Any, retry_interval: float = 2.0) -> None:
+        self.name = name
+        self.transport = transport
+        self.retry_interval = retry_interval
+        self.enabled = True
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def state(self) -> str:
+        if self.transport.ready:
+            return "ready"
+        return "pending" if self._task is None else "unavailable"
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready"
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._connect())
+
+    async def _connect(self) -> None:
+        started = time.perf_counter()
+        while True:
+            try:
+                await self.transport.start()
+                self.error = None
+                break
+            except Exception as exc:  # broker or sockets not up yet
+                self.error = str(exc) or type(exc).__name__
+                await asyncio.sleep(self.retry_interval)
+        while not self.transport.ready:
+            await asyncio.sleep(0.5)
+        self.load_seconds = round(time.perf_counter() - started, 2)
+
+    async def load(self) -> bool:
+        """Wait until at least one worker for this model is healthy."""
+        self.start()
+        assert self._task is not None
+        await asyncio.shield(self._task)
+        return self.ready
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "error": self.error,
+            "load_seconds": self.load_seconds,
+            "remote": self.transport.kind,
+            "healthy_workers": self.transport.stats().get("healthy", 0),
+        }
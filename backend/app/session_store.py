@@ -0,0 +1,151 @@
+"""
+Externalized interview state, so a session survives a dropped socket and can continue on any worker.
+
+The `/ws/interview` loop saves a compact snapshot of `SessionState` once a message that changes it has been fully
+handled, so a stored snapshot never holds a half-finished turn. A client reconnecting with `resume_session` gets the
+snapshot back with one primary-key read. The snapshot is deleted when the session ends; snapshots of abandoned
+sessions are pruned after `SESSION_STORE_TTL_HOURS`. `SESSION_STORE` picks the backend:
+
+- `memory`: a bounded in-process LRU. It handles reconnects to the same worker and needs no database round trip.
+- `sql`: the `InterviewStateRecord` table in the app database (SQLite/Postgres), shared by every worker.
+
+Snapshots are JSON with short keys. Ones larger than `COMPRESS_OVER` bytes are zlib-compressed, and a one-byte
+prefix records which encoding was used.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import delete
+
+from app.db import engine, get_session
+from app.models import InterviewStateRecord
+
+LOG = logging.getLogger("interview.session_store")
+
+SESSION_STORE = os.getenv("SESSION_STORE", "memory").lower()
+SESSION_STORE_MAX = int(os.getenv("SESSION_STORE_MAX", "10000"))
+SESSION_STORE_TTL_HOURS = float(os.getenv("SESSION_STORE_TTL_HOURS", "24"))
+COMPRESS_OVER = 512
+
+Snapshot = Dict[str, Any]
+
+
+def encode_snapshot(snapshot: Snapshot) -> bytes:
+    raw = json.dumps(snapshot, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if len(raw) > COMPRESS_OVER:
+        return b"z" + zlib.compress(raw, 6)
+    return b"j" + raw
+
+
+def decode_snapshot(data: bytes) -> Snapshot:
+    kind, body = data[:1], data[1:]
+    if kind == b"z":
+        body = zlib.decompress(body)
+    elif kind != b"j":
+        raise ValueError(f"unknown snapshot encoding: {kind!r}")
+    return json.loads(body.decode("utf-8"))
+
+
+class SessionStore(ABC):
+    kind = "base"
+
+    @abstractmethod
+    async def load(self, session_id: str) -> Optional[Snapshot]: ...
+
+    @abstractmethod
+    async def save(self, session_id: str, snapshot: Snapshot) -> None: ...
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> None: ...
+
+    @abstractmethod
+    async def prune(self, max_age_seconds: float) -> int:
+        """Drop snapshots not saved for `max_age_seconds`; returns how many were removed."""
+
+
+class MemorySessionStore(SessionStore):
+    kind = "memory"
+
+    def __init__(self, max_sessions: int = SESSION_STORE_MAX) -> None:
+        self.max_sessions = max_sessions
+        # session_id -> (monotonic save time, encoded snapshot), least recently used first.
+        self._items: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    async def load(self, session_id: str) -> Optional[Snapshot]:
+        item = self._items.get(session_id)
+        if item is None:
+            return None
+        self._items.move_to_end(session_id)
+        return decode_snapshot(item[1])
+
+    async def save(self, session_id: str, snapshot: Snapshot) -> None:
+        self._items[session_id] = (time.monotonic(), encode_snapshot(snapshot))
+        self._items.move_to_end(session_id)
+        while len(self._items) > self.max_sessions:
+            self._items.popitem(last=False)
+
+    async def delete(self, session_id: str) -> None:
+        self._items.pop(session_id, None)
+
+    async def prune(self, max_age_seconds: float) -> int:
+        cutoff = time.monotonic() - max_age_seconds
+        stale = [session_id for session_id, (saved, _) in self._items.items() if saved < cutoff]
+        for session_id in stale:
+            del self._items[session_id]
+        return len(stale)
+
+
+class SqlSessionStore(SessionStore):
+    kind = "sql"
+
+    async def load(self, session_id: str) -> Optional[Snapshot]:
+        async with get_session() as session:
+            row = await session.get(InterviewStateRecord, session_id)
+        return decode_snapshot(row.state) if row is not None else None
+
+    async def save(self, session_id: str, snapshot: Snapshot) -> None:
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        now = datetime.utcnow()
+        stmt = dialect_insert(InterviewStateRecord).values(
+            session_id=session_id, state=encode_snapshot(snapshot), updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_={"state": stmt.excluded.state, "updated_at": stmt.excluded.updated_at},
+        )
+        async with get_session() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def delete(self, session_id: str) -> None:
+        async with get_session() as session:
+            await session.execute(delete(InterviewStateRecord).where(InterviewStateRecord.session_id == session_id))
+            await session.commit()
+
+    async def prune(self, max_age_seconds: float) -> int:
+        cutoff = datetime.utcnow() - timedelta(seconds=max_age_seconds)
+        async with get_session() as session:
+            result = await session.execute(delete(InterviewStateRecord).where(InterviewStateRecord.updated_at < cutoff))
+            await session.commit()
+        return int(result.rowcount or 0)
+
+
+def build_session_store(kind: str = SESSION_STORE) -> SessionStore:
+    if kind == "sql":
+        return SqlSessionStore()
+    if kind != "memory":
+        LOG.warning("Unknown SESSION_STORE=%r; using memory", kind)
+    return MemorySessionStore()
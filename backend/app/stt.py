@@ -0,0 +1,434 @@
+"""
+Speech-to-text worker pool.
+
+Whisper inference is CPU/GPU bound, so it runs on a bounded thread or process pool instead of the event
+loop. Requests beyond `workers + max_queue` are rejected with `SttSaturated` so callers can answer 503.
+Uploads can be passed as raw bytes: they are decoded in memory on the worker (no temp file).
+
+With `batch_size > 1`, plain transcriptions are collected for up to `batch_wait` seconds (or until a batch is
+full, or until a worker frees up) and decoded together in one batched CTranslate2 `generate` call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import math
+import multiprocessing
+import time
+from io import BytesIO
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+LOG = logging.getLogger("interview.stt")
+
+AudioInput = Union[str, bytes, BinaryIO, Any]
+SAMPLE_RATE = 16000
+
+# Model loaded by each worker process in "process" mode.
+_worker_model: Any = None
+
+
+def decode_audio_bytes(data: bytes, sampling_rate: int = SAMPLE_RATE) -> Any:
+    """Decode an encoded clip (webm/ogg/wav/...) straight from memory into mono float32 PCM."""
+    from faster_whisper.audio import decode_audio
+
+    return decode_audio(BytesIO(data), sampling_rate=sampling_rate)
+
+
+def transcribe_blocking(
+    model: Any, audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """Run Whisper and fully consume the lazy segment generator (the actual decoding happens while iterating)."""
+    segments, info = _run_whisper(model, audio, language, options)
+    texts: List[str] = []
+    logprobs: List[float] = []
+    for seg in segments:
+        seg_text = seg.text.strip()
+        if seg_text:
+            texts.append(seg_text)
+            logprobs.append(seg.avg_logprob)
+    transcript = " ".join(texts).strip()
+    return transcript, {
+        "duration": info.duration,
+        "language": info.language,
+        "language_probability": info.language_probability,
+        "avg_logprob": round(sum(logprobs) / len(logprobs), 4) if logprobs else None,
+        "num_segments": len(texts),
+    }
+
+
+def transcribe_segments_blocking(
+    model: Any, audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]] = None
+) -> List[Tuple[float, float, str]]:
+    """Like `transcribe_blocking` but keep per-segment (start, end, text) timings, for incremental decoding."""
+    segments, _ = _run_whisper(model, audio, language, options)
+    return [(seg.start, seg.end, seg.text.strip()) for seg in segments if seg.text.strip()]
+
+
+def _run_whisper(model: Any, audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]]) -> Any:
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        audio = decode_audio_bytes(bytes(audio))
+    kwargs: Dict[str, Any] = {
+        "beam_size": 4,
+        "language": language or "en",
+        "vad_filter": True,
+        "condition_on_previous_text": False,
+    }
+    kwargs.update(options or {})
+    return model.transcribe(audio, **kwargs)
+
+
+def _speech_chunks(audio: Any, max_seconds: float = 30.0) -> List[Any]:
+    """VAD the clip and merge consecutive speech spans into pieces that fit one 30 s Whisper window."""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    spans = get_speech_timestamps(audio, VadOptions(max_speech_duration_s=max_seconds))
+    limit = int(max_seconds * SAMPLE_RATE)
+    pieces: List[Tuple[int, int]] = []
+    for span in spans:
+        if pieces and span["end"] - pieces[-1][0] <= limit:
+            pieces[-1] = (pieces[-1][0], span["end"])
+        else:
+            pieces.append((span["start"], span["end"]))
+    return [audio[start:end] for start, end in pieces]
+
+
+def transcribe_batch_blocking(model: Any, items: List[Tuple[AudioInput, Optional[str]]]) -> List[Any]:
+    """
+    Transcribe several clips with batched decoding; returns one `(transcript, info)` or exception per item.
+
+    Each clip is VAD-split into <=30 s pieces and every piece (across all clips) becomes one row of the batch.
+    Pieces are decoded independently, like `condition_on_previous_text=False`, at temperature 0 only.
+    """
+    from faster_whisper.audio import decode_audio, pad_or_trim
+    from faster_whisper.tokenizer import Tokenizer
+    from faster_whisper.transcribe import get_ctranslate2_storage
+
+    results: List[Any] = [None] * len(items)
+    pieces: Dict[str, List[Tuple[int, Any]]] = {}
+    # Decoded PCM per clip, reused by the sequential fallback: a spooled upload can only be read once.
+    decoded: Dict[int, Any] = {}
+    for idx, (audio, language) in enumerate(items):
+        try:
+            if isinstance(audio, (bytes, bytearray, memoryview)):
+                audio = decode_audio_bytes(bytes(audio))
+            elif not hasattr(audio, "shape"):
+                audio = decode_audio(audio, sampling_rate=SAMPLE_RATE)
+            decoded[idx] = audio
+            for piece in _speech_chunks(audio):
+                pieces.setdefault(language or "en", []).append((idx, piece))
+        except Exception as exc:
+            results[idx] = exc
+
+    texts: Dict[int, List[str]] = {idx: [] for idx in decoded}
+    logprobs: Dict[int, List[float]] = {idx: [] for idx in decoded}
+    try:
+        nb_frames = model.feature_extractor.nb_max_frames
+        for language, rows in pieces.items():
+            tokenizer = Tokenizer(model.hf_tokenizer, model.model.is_multilingual, task="transcribe", language=language)
+            prompt = model.get_prompt(tokenizer, [], without_timestamps=True)
+            features = np.stack([pad_or_trim(model.feature_extractor(piece), nb_frames) for _, piece in rows])
+            outputs = model.model.generate(
+                get_ctranslate2_storage(features.astype(np.float32)),
+                [prompt] * len(rows),
+                beam_size=4,
+                max_length=model.max_length,
+                return_scores=True,
+                return_no_speech_prob=True,
+                suppress_blank=True,
+                suppress_tokens=[-1],
+            )
+            for (idx, _), output in zip(rows, outputs):
+                tokens = output.sequences_ids[0]
+                avg_logprob = output.scores[0] * len(tokens) / (len(tokens) + 1)
+                # Same silence rule as WhisperModel.transcribe (no_speech_threshold=0.6, log_prob_threshold=-1).
+                if output.no_speech_prob > 0.6 and avg_logprob < -1.0:
+                    continue
+                text = tokenizer.decode(tokens).strip()
+                if text:
+                    texts[idx].append(text)
+                    logprobs[idx].append(avg_logprob)
+    except Exception as exc:
+        # Don't let one bad batch fail every caller: decode the clips one at a time instead.
+        LOG.warning("Batched transcription of %s clips failed; falling back to sequential: %s", len(items), exc)
+        for idx in texts:
+            try:
+                results[idx] = transcribe_blocking(model, decoded[idx], items[idx][1])
+            except Exception as item_exc:
+                results[idx] = item_exc
+        return results
+
+    for idx, parts in texts.items():
+        scores = logprobs[idx]
+        results[idx] = (
+            " ".join(parts).strip(),
+            {
+                "duration": len(decoded[idx]) / SAMPLE_RATE,
+                "language": items[idx][1] or "en",
+                "language_probability": 1.0,
+                "avg_logprob": round(sum(scores) / len(scores), 4) if scores else None,
+                "num_segments": len(parts),
+            },
+        )
+    return results
+
+
+def _init_process_worker(model_size: str, device: str, compute_type: str) -> None:
+    global _worker_model
+    from faster_whisper import WhisperModel
+
+    _worker_model = WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+def _transcribe_in_process(
+    audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]] = None
+) -> Tuple[str, Dict[str, Any]]:
+    return transcribe_blocking(_worker_model, audio, language, options)
+
+
+def _transcribe_batch_in_process(items: List[Tuple[AudioInput, Optional[str]]]) -> List[Any]:
+    return transcribe_batch_blocking(_worker_model, items)
+
+
+def _transcribe_segments_in_process(
+    audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]] = None
+) -> List[Tuple[float, float, str]]:
+    return transcribe_segments_blocking(_worker_model, audio, language, options)
+
+
+class SttSaturated(Exception):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"stt pool saturated; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class SttPool:
+    def __init__(
+        self,
+        workers: int = 1,
+        max_queue: int = 8,
+        timeout: float = 120.0,
+        mode: str = "thread",
+        batch_size: int = 1,
+        batch_wait: float = 0.03,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self.mode = mode if mode in ("thread", "process") else "thread"
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = max(0.0, batch_wait)
+        self.model: Any = None
+        self._executor: Optional[concurrent.futures.Executor] = None
+        self._pending = 0
+        self._avg_job_seconds: Optional[float] = None
+        self._batch_queue: List[Tuple[AudioInput, Optional[str], "asyncio.Future[Any]"]] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._batches_in_flight = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    @property
+    def ready(self) -> bool:
+        if self._executor is None:
+            return False
+        return self.mode == "process" or self.model is not None
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._pending - self.workers)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def capacity(self) -> int:
+        """Requests admitted (running plus queued) before new ones get `SttSaturated`."""
+        return self.workers * self.batch_size + self.max_queue
+
+    def start(self, model: Any = None, model_args: Optional[Tuple[str, str, str]] = None) -> None:
+        """Thread mode shares `model`; process mode loads one model per worker from `model_args`."""
+        if self.mode == "process":
+            if model_args is None:
+                raise ValueError("process mode requires model_args=(model_size, device, compute_type)")
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_worker,
+                initargs=model_args,
+            )
+        else:
+            self.model = model
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="stt"
+            )
+
+    def shutdown(self) -> None:
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def expected_wait(self) -> float:
+        """Rough seconds a new request would queue before a worker picks it up."""
+        return (self._avg_job_seconds or 0.0) * self._pending / (self.workers * self.batch_size)
+
+    def retry_after(self) -> int:
+        per_job = self._avg_job_seconds or 5.0
+        return max(1, min(60, math.ceil(per_job * (self.queue_depth + 1) / (self.workers * self.batch_size))))
+
+    def _job_finished(self, started: float, future: "concurrent.futures.Future[Any]") -> None:
+        self._pending -= 1
+        if future.cancelled():
+            return
+        elapsed = time.perf_counter() - started
+        self._avg_job_seconds = elapsed if self._avg_job_seconds is None else 0.8 * self._avg_job_seconds + 0.2 * elapsed
+
+    async def transcribe(
+        self, audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        if self.batch_size > 1 and not options:
+            return await self._transcribe_batched(audio, language)
+        return await self._submit(transcribe_blocking, _transcribe_in_process, audio, language, options)
+
+    async def transcribe_segments(
+        self, audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[float, float, str]]:
+        return await self._submit(
+            transcribe_segments_blocking, _transcribe_segments_in_process, audio, language, options
+        )
+
+    async def _submit(self, thread_fn: Callable[..., Any], process_fn: Callable[..., Any], *args: Any) -> Any:
+        if self._executor is None:
+            raise RuntimeError("stt pool not started")
+        if self._pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise SttSaturated(self.retry_after())
+
+        if self.mode == "process":
+            future = self._executor.submit(process_fn, *args)
+        else:
+            future = self._executor.submit(thread_fn, self.model, *args)
+        self._pending += 1
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        # Done callbacks fire on the worker thread; hop back to the loop before touching counters.
+        future.add_done_callback(lambda f: loop.call_soon_threadsafe(self._job_finished, started, f))
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            # A queued job is cancelled; one already running keeps its worker until Whisper returns.
+            self.timeouts += 1
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        self.completed += 1
+        return result
+
+    async def _transcribe_batched(self, audio: AudioInput, language: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+        if self._executor is None:
+            raise RuntimeError("stt pool not started")
+        if self._pending >= self.workers * self.batch_size + self.max_queue:
+            self.rejected += 1
+            raise SttSaturated(self.retry_after())
+
+        waiter: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        entry = (audio, language, waiter)
+        self._batch_queue.append(entry)
+        self._pending += 1
+        self._schedule_batch()
+        try:
+            result = await asyncio.wait_for(waiter, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            if entry in self._batch_queue:
+                self._batch_queue.remove(entry)
+                self._pending -= 1
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        self.completed += 1
+        return result
+
+    def _schedule_batch(self) -> None:
+        if not self._batch_queue or self._batches_in_flight >= self.workers:
+            # Workers busy: keep collecting; the next batch goes out as soon as one finishes.
+            return
+        if len(self._batch_queue) >= self.batch_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = asyncio.get_running_loop().call_later(self.batch_wait, self._flush_batch)
+
+    def _flush_batch(self) -> None:
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if not self._batch_queue or self._batches_in_flight >= self.workers or self._executor is None:
+            return
+        batch = self._batch_queue[: self.batch_size]
+        del self._batch_queue[: self.batch_size]
+        items = [(audio, language) for audio, language, _ in batch]
+        if self.mode == "process":
+            future = self._executor.submit(_transcribe_batch_in_process, items)
+        else:
+            future = self._executor.submit(transcribe_batch_blocking, self.model, items)
+        self._batches_in_flight += 1
+        self.batches += 1
+        self.batched_items += len(batch)
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        future.add_done_callback(lambda f: loop.call_soon_threadsafe(self._batch_finished, batch, started, f))
+
+    def _batch_finished(self, batch: List[Any], started: float, future: "concurrent.futures.Future[Any]") -> None:
+        self._batches_in_flight -= 1
+        self._pending -= len(batch)
+        outcomes: List[Any]
+        if future.cancelled():
+            outcomes = [RuntimeError("stt batch cancelled")] * len(batch)
+        elif future.exception() is not None:
+            outcomes = [future.exception()] * len(batch)
+        else:
+            elapsed = time.perf_counter() - started
+            self._avg_job_seconds = (
+                elapsed if self._avg_job_seconds is None else 0.8 * self._avg_job_seconds + 0.2 * elapsed
+            )
+            outcomes = future.result()
+        for (_, _, waiter), outcome in zip(batch, outcomes):
+            if waiter.done():  # caller timed out
+                continue
+            if isinstance(outcome, BaseException):
+                waiter.set_exception(outcome)
+            else:
+                waiter.set_result(outcome)
+        if self._batch_queue:
+            # These requests already waited behind a busy worker; don't hold them for another window.
+            self._flush_batch()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(self._pending, self.workers),
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "avg_job_ms": round(self._avg_job_seconds * 1000, 2) if self._avg_job_seconds is not None else None,
+            "batch_size": self.batch_size,
+            "batches": self.batches,
+            "avg_batch": round(self.batched_items / self.batches, 2) if self.batches else None,
+        }
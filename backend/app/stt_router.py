@@ -0,0 +1,269 @@
+"""
+Latency-aware routing across several Whisper replicas of different sizes.
+
+`WHISPER_REPLICAS` lists replicas as `size[/compute_type][*count]`, e.g. `small/int8*2,medium`. Replicas are tiered by
+model size. Short clips go to the fastest tier and longer ones to the most accurate tier, unless that tier's expected
+queueing delay exceeds `max_wait`, in which case the least-loaded replica of any tier takes it. A faster-tier result
+with a low average log-probability is re-run on the accurate tier when it has capacity.
+
+Routing needs the clip length, so encoded uploads are decoded before a replica is picked. Admission is checked first
+(requests being decoded count against the replicas' combined queue capacity), and at most as many clips are decoded
+at once as the replicas have workers, so a burst is answered with `SttSaturated` instead of being decoded in full.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.instrumentation import observe_whisper
+from app.stt import SAMPLE_RATE, AudioInput, SttPool, SttSaturated, decode_audio_bytes
+
+LOG = logging.getLogger("interview.stt_router")
+
+MODEL_SIZES = ("tiny", "base", "small", "medium", "large")
+
+
+def model_rank(model_size: str) -> int:
+    name = model_size.lower().rsplit("/", 1)[-1]
+    for rank, size in enumerate(MODEL_SIZES):
+        if size in name:
+            return rank
+    return MODEL_SIZES.index("medium")
+
+
+def parse_replicas(spec: str, default_compute_type: str) -> List[Tuple[str, str]]:
+    """`small/int8*2,medium` -> [("small", "int8"), ("small", "int8"), ("medium", default_compute_type)]."""
+    replicas: List[Tuple[str, str]] = []
+    for raw in (spec or "").split(","):
+        entry = raw.strip()
+        if not entry:
+            continue
+        count = 1
+        match = re.fullmatch(r"(.+?)\*(\d+)", entry)
+        if match:
+            entry, count = match.group(1), int(match.group(2))
+        size, _, compute_type = entry.partition("/")
+        replicas.extend([(size.strip(), compute_type.strip() or default_compute_type)] * max(1, count))
+    return replicas
+
+
+class SttReplica:
+    def __init__(self, name: str, model_size: str, compute_type: str, pool: SttPool) -> None:
+        self.name = name
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.pool = pool
+        self.rank = model_rank(model_size)
+        self.requests = 0
+        self.escalated_in = 0
+        self.escalated_out = 0
+        self._avg_latency: Optional[float] = None
+        self._avg_rtf: Optional[float] = None
+
+    def observe(self, elapsed: float, duration: Optional[float]) -> None:
+        observe_whisper(self.name, elapsed, duration)
+        self.requests += 1
+        self._avg_latency = elapsed if self._avg_latency is None else 0.8 * self._avg_latency + 0.2 * elapsed
+        if duration:
+            rtf = elapsed / duration
+            self._avg_rtf = rtf if self._avg_rtf is None else 0.8 * self._avg_rtf + 0.2 * rtf
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "model": self.model_size,
+            "compute_type": self.compute_type,
+            "tier": self.rank,
+            "ready": self.pool.ready,
+            "requests": self.requests,
+            "escalated_in": self.escalated_in,
+            "escalated_out": self.escalated_out,
+            "avg_latency_ms": round(self._avg_latency * 1000, 2) if self._avg_latency is not None else None,
+            "avg_rtf": round(self._avg_rtf, 4) if self._avg_rtf is not None else None,
+            "expected_wait_ms": round(self.pool.expected_wait() * 1000, 2),
+            **self.pool.stats(),
+        }
+
+
+class SttRouter:
+    def __init__(
+        self,
+        replicas: List[SttReplica],
+        short_clip: float = 20.0,
+        max_wait: float = 3.0,
+        min_avg_logprob: float = -0.8,
+    ) -> None:
+        if not replicas:
+            raise ValueError("at least one STT replica is required")
+        self.replicas = replicas
+        self.short_clip = short_clip
+        self.max_wait = max_wait
+        self.min_avg_logprob = min_avg_logprob
+        self.fast_rank = min(r.rank for r in replicas)
+        self.top_rank = max(r.rank for r in replicas)
+        self.escalations = 0
+        self.rejected = 0
+        self._decoding = 0
+        self._decode_slots = asyncio.Semaphore(sum(r.pool.workers for r in replicas))
+
+    @property
+    def ready(self) -> bool:
+        return any(r.pool.ready for r in self.replicas)
+
+    @property
+    def mode(self) -> str:
+        return self.replicas[0].pool.mode
+
+    @property
+    def timeout(self) -> float:
+        return self.replicas[0].pool.timeout
+
+    def shutdown(self) -> None:
+        for replica in self.replicas:
+            replica.pool.shutdown()
+
+    async def transcribe(
+        self, audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        if len(self.replicas) == 1:
+            # Nothing to route: skip the up-front decode, but keep the replica stats and histograms fed.
+            only = self.replicas[0]
+            started = time.perf_counter()
+            text, info = await only.pool.transcribe(audio, language, options)
+            only.observe(time.perf_counter() - started, info.get("duration"))
+            return text, {**info, "replica": only.name}
+        audio, duration = await self._prepare(audio)
+        # Greedy (partial) decodes are throwaway: always the fast tier.
+        fast_only = bool(options) and options.get("beam_size") == 1
+        replica, (text, info) = await self._dispatch(
+            duration, fast_only, lambda r: r.pool.transcribe(audio, language, options)
+        )
+        info = {**info, "replica": replica.name}
+        if options or replica.rank >= self.top_rank or not self._low_confidence(info):
+            return text, info
+
+        target = self._least_loaded(self.top_rank)
+        if not target.pool.ready or target.pool.expected_wait() > self.max_wait:
+            return text, info
+        try:
+            started = time.perf_counter()
+            better_text, better_info = await target.pool.transcribe(audio, language)
+        except (SttSaturated, asyncio.TimeoutError):
+            return text, info
+        target.observe(time.perf_counter() - started, duration)
+        self.escalations += 1
+        replica.escalated_out += 1
+        target.escalated_in += 1
+        return better_text, {**better_info, "replica": target.name, "escalated_from": replica.name}
+
+    async def transcribe_segments(
+        self, audio: AudioInput, language: Optional[str], options: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[float, float, str]]:
+        if len(self.replicas) == 1:
+            only = self.replicas[0]
+            started = time.perf_counter()
+            segments = await only.pool.transcribe_segments(audio, language, options)
+            # Streaming windows arrive as PCM arrays, so the clip length is known without decoding.
+            duration = len(audio) / SAMPLE_RATE if hasattr(audio, "shape") else None
+            only.observe(time.perf_counter() - started, duration)
+            return segments
+        audio, duration = await self._prepare(audio)
+        _, segments = await self._dispatch(
+            duration, False, lambda r: r.pool.transcribe_segments(audio, language, options)
+        )
+        return segments
+
+    async def _prepare(self, audio: AudioInput) -> Tuple[Any, float]:
+        """Decode up front so the clip length is known before choosing a replica."""
+        if hasattr(audio, "shape"):
+            return audio, len(audio) / SAMPLE_RATE
+        self._admit()
+        self._decoding += 1
+        try:
+            async with self._decode_slots:
+                if isinstance(audio, (bytes, bytearray, memoryview)):
+                    audio = await asyncio.to_thread(decode_audio_bytes, bytes(audio))
+                else:
+                    from faster_whisper.audio import decode_audio
+
+                    audio = await asyncio.to_thread(decode_audio, audio, SAMPLE_RATE)
+        finally:
+            self._decoding -= 1
+        return audio, len(audio) / SAMPLE_RATE
+
+    def _admit(self) -> None:
+        """Refuse before decoding when the replicas couldn't take the clip anyway."""
+        ready = [r for r in self.replicas if r.pool.ready] or self.replicas
+        if sum(r.pool.pending for r in ready) + self._decoding >= sum(r.pool.capacity for r in ready):
+            self.rejected += 1
+            raise SttSaturated(min(r.pool.retry_after() for r in ready))
+
+    async def _dispatch(self, duration: float, fast_only: bool, call: Any) -> Tuple[SttReplica, Any]:
+        first = self._pick(duration, fast_only)
+        order = [first] + sorted(
+            (r for r in self.replicas if r is not first and r.pool.ready), key=lambda r: r.pool.expected_wait()
+        )
+        last_exc: Optional[SttSaturated] = None
+        for replica in order:
+            started = time.perf_counter()
+            try:
+                result = await call(replica)
+            except SttSaturated as exc:
+                # That replica's queue is full; spill to the next least-loaded one.
+                last_exc = exc
+                continue
+            replica.observe(time.perf_counter() - started, duration)
+            return replica, result
+        assert last_exc is not None
+        raise last_exc
+
+    def _pick(self, duration: float, fast_only: bool) -> SttReplica:
+        preferred = self._least_loaded(self.fast_rank if fast_only or duration <= self.short_clip else self.top_rank)
+        if preferred.pool.ready and preferred.pool.expected_wait() <= self.max_wait:
+            return preferred
+        ready = [r for r in self.replicas if r.pool.ready] or self.replicas
+        # Overloaded: take whichever replica frees up first, preferring faster tiers on ties.
+        return min(ready, key=lambda r: (r.pool.expected_wait(), r.rank))
+
+    def _least_loaded(self, rank: int) -> SttReplica:
+        tier = [r for r in self.replicas if r.rank == rank]
+        ready = [r for r in tier if r.pool.ready] or tier
+        return min(ready, key=lambda r: r.pool.expected_wait())
+
+    def _low_confidence(self, info: Dict[str, Any]) -> bool:
+        # Only avg logprob: the language is pinned (`language or "en"`), so language_probability is always 1.0.
+        avg_logprob = info.get("avg_logprob")
+        return avg_logprob is not None and avg_logprob < self.min_avg_logprob
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool-level totals across replicas (same keys as `SttPool.stats`)."""
+        if len(self.replicas) == 1:
+            return self.replicas[0].pool.stats()
+        totals: Dict[str, Any] = {}
+        for replica in self.replicas:
+            for key, value in replica.pool.stats().items():
+                if isinstance(value, int) and not isinstance(value, bool) and key != "batch_size":
+                    totals[key] = totals.get(key, 0) + value
+                else:
+                    totals.setdefault(key, value)
+        totals["avg_job_ms"] = None
+        totals["replicas"] = len(self.replicas)
+        totals["escalations"] = self.escalations
+        totals["rejected"] = totals.get("rejected", 0) + self.rejected
+        return totals
+
+    def replica_stats(self) -> Dict[str, Any]:
+        return {
+            "routing": {
+                "short_clip_s": self.short_clip,
+                "max_wait_ms": round(self.max_wait * 1000, 2),
+                "min_avg_logprob": self.min_avg_logprob,
+                "escalations": self.escalations,
+                "rejected_before_decode": self.rejected,
+            },
+            "replicas": [replica.stats() for replica in self.replicas],
+        }
@@ -0,0 +1,384 @@
+"""
+Incremental speech-to-text for the `/ws/stt` socket.
+
+Audio arrives in small chunks while the candidate is still talking. Silero VAD (bundled with faster-whisper) runs
+on the uncommitted tail of the stream: once speech is followed by `min_silence` seconds of silence, that utterance is
+decoded once with full beam search, emitted as a `final` frame, and its audio is dropped so it is never decoded again.
+While speech is ongoing, a cheap greedy decode of the uncommitted window produces `partial` frames. A window that grows
+past `max_window` slides forward by committing every Whisper segment but the last.
+
+Container formats (MediaRecorder webm/ogg timeslices) are decoded by a `ContainerDecoder`: one PyAV demuxer per
+stream, running on its own thread and fed the chunks as they arrive, so every byte is decoded once. Containers the
+demuxer can't read without seeking (e.g. non-fragmented mp4) fall back to decoding the whole stream once at `finish`.
+Raw PCM at another rate goes through one PyAV resampler per stream, which keeps its filter state across chunks, so the
+window matches what `/stt` decodes from the same recording.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import threading
+from fractions import Fraction
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from app.stt import SAMPLE_RATE, SttPool, SttSaturated, decode_audio_bytes
+from app.stt_router import SttRouter
+
+LOG = logging.getLogger("interview.stt_stream")
+
+PCM_FORMATS = ("pcm_s16le", "pcm_f32le")
+ENCODED_FORMATS = ("webm", "ogg", "mp4", "wav")
+# Accepted raw PCM input rates; a tiny rate would upsample each chunk into gigabytes of audio.
+MIN_SAMPLE_RATE = 8000
+MAX_SAMPLE_RATE = 48000
+# A demuxer that sees no new bytes for this long treats the stream as ended (bounds threads of abandoned streams).
+DECODER_IDLE_TIMEOUT = 60.0
+
+# Greedy, timestamp-free decoding for throwaway partial hypotheses.
+PARTIAL_OPTIONS: Dict[str, Any] = {"beam_size": 1, "vad_filter": False, "without_timestamps": True}
+# Segments handed to Whisper are already VAD-trimmed, so skip its own VAD pass.
+FINAL_OPTIONS: Dict[str, Any] = {"vad_filter": False}
+
+
+class _StreamFeed(io.RawIOBase):
+    """Read side of a growing byte stream: `readinto` blocks until bytes arrive, input is closed, or it idles out."""
+
+    def __init__(self, idle_timeout: float) -> None:
+        super().__init__()
+        self.idle_timeout = idle_timeout
+        self._data = bytearray()
+        self._eof = False
+        self._cond = threading.Condition()
+
+    def readable(self) -> bool:
+        return True
+
+    def feed(self, data: bytes) -> None:
+        with self._cond:
+            self._data.extend(data)
+            self._cond.notify()
+
+    def end(self) -> None:
+        with self._cond:
+            self._eof = True
+            self._cond.notify()
+
+    def readinto(self, buffer: Any) -> int:
+        with self._cond:
+            if not self._data and not self._eof:
+                self._cond.wait_for(lambda: self._data or self._eof, timeout=self.idle_timeout)
+            count = min(len(buffer), len(self._data))
+            buffer[:count] = self._data[:count]
+            del self._data[:count]
+            return count
+
+
+class ContainerDecoder:
+    """Incremental decode of one container stream into 16 kHz mono float32 on a dedicated demuxer thread."""
+
+    def __init__(self, idle_timeout: float = DECODER_IDLE_TIMEOUT) -> None:
+        self._feed = _StreamFeed(idle_timeout)
+        self._lock = threading.Lock()
+        self._pending: List[np.ndarray] = []
+        self._available = 0
+        self._closed = False
+        self.error: Optional[BaseException] = None
+        self.truncated = False
+        self.done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stt-demux", daemon=True)
+        self._thread.start()
+
+    @property
+    def available(self) -> int:
+        """Samples decoded but not yet drained."""
+        return self._available
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.truncated
+
+    def feed(self, data: bytes) -> None:
+        self._feed.feed(data)
+
+    def close(self) -> None:
+        """Signal end of input; the thread decodes what is left and exits."""
+        self._closed = True
+        self._feed.end()
+
+    def drain(self) -> np.ndarray:
+        with self._lock:
+            pending, self._pending, self._available = self._pending, [], 0
+        if not pending:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(pending)
+
+    def _push(self, frame: Any) -> None:
+        samples = frame.to_ndarray().reshape(-1).astype(np.float32) / 32768.0
+        with self._lock:
+            self._pending.append(samples)
+            self._available += len(samples)
+
+    def _run(self) -> None:
+        import av
+
+        try:
+            resampler = av.audio.resampler.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+            with av.open(self._feed, mode="r", metadata_errors="ignore") as container:
+                stream = container.streams.audio[0]
+                for packet in container.demux(stream):
+                    try:
+                        frames = packet.decode()
+                    except av.error.InvalidDataError:
+                        continue  # a damaged packet; skip it like faster-whisper's decoder does
+                    for frame in frames:
+                        for out in resampler.resample(frame):
+                            self._push(out)
+                for out in resampler.resample(None):
+                    self._push(out)
+        except Exception as exc:
+            self.error = exc
+            LOG.info("Incremental container decode stopped: %s", exc)
+        finally:
+            # Ending before the input was closed means the demuxer gave up (or idled out) on a live stream.
+            self.truncated = not self._closed
+            self.done.set()
+
+
+def _frames_to_pcm(frames: List[Any]) -> np.ndarray:
+    """Resampled s16 mono frames -> float32 PCM, scaled like the container path."""
+    if not frames:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate([frame.to_ndarray().reshape(-1) for frame in frames]).astype(np.float32) / 32768.0
+
+
+class StreamingTranscriber:
+    def __init__(
+        self,
+        pool: Union[SttPool, SttRouter],
+        language: Optional[str] = None,
+        audio_format: str = "pcm_s16le",
+        sample_rate: int = SAMPLE_RATE,
+        partial_interval: float = 0.6,
+        min_silence: float = 0.5,
+        max_window: float = 20.0,
+    ) -> None:
+        if audio_format not in PCM_FORMATS + ENCODED_FORMATS:
+            raise ValueError(f"unsupported audio format: {audio_format}")
+        if not MIN_SAMPLE_RATE <= sample_rate <= MAX_SAMPLE_RATE:
+            raise ValueError(f"unsupported sample rate: {sample_rate} (allowed {MIN_SAMPLE_RATE}-{MAX_SAMPLE_RATE})")
+        self.pool = pool
+        self.language = language
+        self.audio_format = audio_format
+        self.sample_rate = sample_rate
+        self.partial_interval = partial_interval
+        self.min_silence = min_silence
+        self.max_window = max_window
+        self.bytes_received = 0
+        self.committed: List[str] = []
+        self.hypothesis = ""
+        self.decode_calls = 0
+        self._buffer = np.zeros(0, dtype=np.float32)  # uncommitted audio at 16 kHz
+        self._offset = 0  # stream samples already committed or discarded before _buffer[0]
+        self._new_samples = 0
+        self._remainder = b""
+        self._encoded = bytearray()
+        self._decoder: Optional[ContainerDecoder] = None
+        self._decoded_samples = 0
+        self._resampler: Any = None
+        self._resampled_in = 0
+        self._vad_options: Any = None
+
+    @property
+    def transcript(self) -> str:
+        return " ".join(self.committed).strip()
+
+    @property
+    def duration(self) -> float:
+        return (self._offset + len(self._buffer)) / SAMPLE_RATE
+
+    def add_chunk(self, data: bytes) -> None:
+        self.bytes_received += len(data)
+        if self.audio_format in ENCODED_FORMATS:
+            # Container chunks (MediaRecorder timeslices) aren't decodable on their own: feed the stream's demuxer,
+            # and keep the bytes in case it can't handle this container and `finish` has to decode them in one go.
+            self._encoded.extend(data)
+            if self._decoder is None:
+                self._decoder = ContainerDecoder()
+            self._decoder.feed(data)
+            return
+        data = self._remainder + data
+        width = 2 if self.audio_format == "pcm_s16le" else 4
+        usable = len(data) - len(data) % width
+        self._remainder = data[usable:]
+        if self.audio_format == "pcm_s16le":
+            samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+        else:
+            samples = np.frombuffer(data[:usable], dtype="<f4").astype(np.float32)
+        self._append(self._resample(samples))
+
+    def should_step(self) -> bool:
+        pending = self._decoder.available if self._decoder is not None else 0
+        return self._new_samples + pending >= int(self.partial_interval * SAMPLE_RATE)
+
+    async def step(self) -> List[Dict[str, Any]]:
+        """Advance the stream: commit finished utterances, otherwise refresh the partial hypothesis."""
+        self._drain_decoder()
+        self._new_samples = 0
+        window = self._buffer
+        if len(window) < int(0.3 * SAMPLE_RATE):
+            return []
+        try:
+            speech = await asyncio.to_thread(self._speech_spans, window)
+            if not speech:
+                # Silence or noise only: discard it, keeping a short tail so a word onset isn't clipped.
+                self._drop(max(0, len(window) - SAMPLE_RATE // 2))
+                self.hypothesis = ""
+                return []
+            closed = [span for span in speech if span["end"] < len(window)]
+            if closed:
+                # Utterances followed by enough silence are done: decode them once and commit them.
+                return await self._commit(window[: closed[-1]["end"]], speech[0]["start"])
+            if len(window) > self.max_window * SAMPLE_RATE:
+                return await self._slide(window)
+            return await self._partial(window[speech[0]["start"] :])
+        except SttSaturated:
+            # Keep the audio; the next step (or finish) retries it.
+            LOG.info("STT pool saturated; skipping streaming step")
+            return []
+
+    async def _partial(self, audio: np.ndarray) -> List[Dict[str, Any]]:
+        self.decode_calls += 1
+        text, _ = await self.pool.transcribe(
+            audio, self.language, {**PARTIAL_OPTIONS, "initial_prompt": self._prompt()}
+        )
+        self.hypothesis = text.strip()
+        full = " ".join(filter(None, [self.transcript, self.hypothesis]))
+        return [{"type": "partial", "text": full, "hypothesis": self.hypothesis}]
+
+    async def finish(self) -> List[Dict[str, Any]]:
+        """Flush everything still uncommitted (called when the client stops recording)."""
+        await self._finish_encoded()
+        if self._resampler is not None:
+            # The resampler holds back a few samples of filter delay; flush them into the last utterance.
+            self._append(_frames_to_pcm(self._resampler.resample(None)))
+        frames: List[Dict[str, Any]] = []
+        window = self._buffer
+        if len(window) >= int(0.2 * SAMPLE_RATE):
+            speech = await asyncio.to_thread(self._speech_spans, window)
+            if speech:
+                frames = await self._commit(window[: speech[-1]["end"]], speech[0]["start"])
+        self._drop(len(self._buffer))
+        self.hypothesis = ""
+        return frames
+
+    async def _commit(self, audio: np.ndarray, start: int = 0) -> List[Dict[str, Any]]:
+        self.decode_calls += 1
+        text, _ = await self.pool.transcribe(
+            audio[start:], self.language, {**FINAL_OPTIONS, "initial_prompt": self._prompt()}
+        )
+        frame_start = (self._offset + start) / SAMPLE_RATE
+        self._drop(len(audio))
+        self.hypothesis = ""
+        text = text.strip()
+        if not text:
+            return []
+        self.committed.append(text)
+        return [self._final_frame(text, frame_start, self._offset / SAMPLE_RATE)]
+
+    async def _slide(self, window: np.ndarray) -> List[Dict[str, Any]]:
+        self.decode_calls += 1
+        segments = await self.pool.transcribe_segments(
+            window, self.language, {**FINAL_OPTIONS, "initial_prompt": self._prompt()}
+        )
+        if len(segments) > 1:
+            # The last segment may still be growing; commit the ones before it.
+            keep_from = int(segments[-2][1] * SAMPLE_RATE)
+            segments = segments[:-1]
+        else:
+            keep_from = len(window)
+        frame_start = self._offset / SAMPLE_RATE
+        self._drop(min(keep_from, len(window)))
+        text = " ".join(seg[2] for seg in segments).strip()
+        if not text:
+            return []
+        self.committed.append(text)
+        return [self._final_frame(text, frame_start, self._offset / SAMPLE_RATE)]
+
+    def _final_frame(self, text: str, start: float, end: float) -> Dict[str, Any]:
+        return {
+            "type": "final",
+            "text": text,
+            "transcript": self.transcript,
+            "start": round(start, 3),
+            "end": round(end, 3),
+        }
+
+    def _prompt(self) -> Optional[str]:
+        # Condition on the tail of what's already committed instead of re-decoding that audio.
+        return self.transcript[-200:] or None
+
+    def _speech_spans(self, audio: np.ndarray) -> List[Dict[str, int]]:
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        if self._vad_options is None:
+            self._vad_options = VadOptions(min_silence_duration_ms=int(self.min_silence * 1000), speech_pad_ms=150)
+        return get_speech_timestamps(audio, self._vad_options)
+
+    def _append(self, samples: np.ndarray) -> None:
+        if len(samples):
+            self._buffer = np.concatenate([self._buffer, samples])
+            self._new_samples += len(samples)
+
+    def _drop(self, count: int) -> None:
+        self._buffer = self._buffer[count:]
+        self._offset += count
+
+    def _resample(self, samples: np.ndarray) -> np.ndarray:
+        if self.sample_rate == SAMPLE_RATE or not len(samples):
+            return samples
+        import av
+
+        if self._resampler is None:
+            # Stateful across chunks: low-pass filtered, no seams at chunk boundaries, no per-chunk rounding drift.
+            self._resampler = av.audio.resampler.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+        frame = av.AudioFrame.from_ndarray(samples.reshape(1, -1), format="flt", layout="mono")
+        frame.sample_rate = self.sample_rate
+        frame.pts = self._resampled_in
+        frame.time_base = Fraction(1, self.sample_rate)
+        self._resampled_in += len(samples)
+        return _frames_to_pcm(self._resampler.resample(frame))
+
+    def close(self) -> None:
+        """Stop the container demuxer of a stream that is abandoned without `finish`."""
+        if self._decoder is not None:
+            self._decoder.close()
+
+    def _drain_decoder(self) -> None:
+        if self._decoder is None:
+            return
+        samples = self._decoder.drain()
+        self._decoded_samples += len(samples)
+        self._append(samples)
+
+    async def _finish_encoded(self) -> None:
+        decoder = self._decoder
+        if decoder is None:
+            return
+        decoder.close()
+        await asyncio.to_thread(decoder.done.wait, DECODER_IDLE_TIMEOUT)
+        if not decoder.failed and decoder.done.is_set():
+            self._drain_decoder()
+            return
+        # The demuxer couldn't follow this container: decode the whole stream once and keep what it never produced.
+        try:
+            decoded = await asyncio.to_thread(decode_audio_bytes, bytes(self._encoded))
+        except Exception as exc:
+            LOG.warning("Container decode failed: %s", exc)
+            return
+        fresh = decoded[self._decoded_samples :]
+        self._decoded_samples = len(decoded)
+        self._append(np.asarray(fresh, dtype=np.float32))
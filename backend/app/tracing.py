@@ -0,0 +1,285 @@
+"""
+Lightweight request/turn tracing with OpenTelemetry-compatible export.
+
+`span(name, **attributes)` opens a span as a child of the current one (tracked in a context variable, so it follows
+`await` and tasks created inside it) and times it. Every finished span adds its duration to its root span's
+per-name breakdown; the `/ws/interview` loop persists that breakdown for each turn as a `trace` telemetry row, so
+`/export/session/{id}` shows where the time went (`llm.coaching`, `fallback.tips`, `db.enqueue`, ...). Concurrent
+children can add up to more than the root duration. Background work that outlives its turn (the next-question
+prefetch) is started in a fresh context and traced under its own root span.
+
+Finished spans are exported in batches as OTLP/JSON (`ExportTraceServiceRequest`, hex ids), selected by
+`TRACE_EXPORT`:
+- `file`: one JSON document per line appended to `TRACE_FILE`, the layout of the OpenTelemetry Collector's file
+  exporter. It can be replayed into any OTLP receiver.
+- `otlp`: POSTed to an OTLP/HTTP JSON endpoint (`TRACE_OTLP_URL`, e.g. a local collector on :4318).
+- unset: spans are only used for the per-turn breakdowns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import os
+import secrets
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+LOG = logging.getLogger("interview.tracing")
+
+TRACE_EXPORT = os.getenv("TRACE_EXPORT", "").lower()
+TRACE_FILE = os.getenv("TRACE_FILE", "traces.jsonl")
+TRACE_OTLP_URL = os.getenv("TRACE_OTLP_URL", "http://localhost:4318/v1/traces")
+TRACE_FLUSH_S = float(os.getenv("TRACE_FLUSH_S", "2"))
+TRACE_BUFFER_MAX = int(os.getenv("TRACE_BUFFER_MAX", "10000"))
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "interview-backend")
+
+# OTLP span kinds / status codes.
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "root",
+        "kind",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "status",
+        "status_message",
+        "breakdown",
+        "_t0",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.root: Span = parent.root if parent is not None else self
+        self.kind = SPAN_KIND_INTERNAL if parent is not None else SPAN_KIND_SERVER
+        self.attributes = {key: value for key, value in attributes.items() if value is not None}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = STATUS_OK
+        self.status_message = ""
+        # Root spans only: total milliseconds per child span name.
+        self.breakdown: Dict[str, float] = {}
+        self._t0 = time.perf_counter_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def end(self) -> None:
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._t0)
+        if self.root is not self:
+            self.root.breakdown[self.name] = self.root.breakdown.get(self.name, 0.0) + self.duration_ms
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else self.start_ns + (time.perf_counter_ns() - self._t0)
+        return (end - self.start_ns) / 1e6
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact timing summary of a finished root span, for persisting with the session."""
+        return {
+            "trace_id": self.trace_id,
+            "total_ms": round(self.duration_ms, 2),
+            "spans": {name: round(ms, 2) for name, ms in sorted(self.breakdown.items(), key=lambda kv: -kv[1])},
+        }
+
+
+_current: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    current = Span(name, _current.get(), attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        if isinstance(exc, asyncio.CancelledError):
+            current.set_attribute("cancelled", True)
+        else:
+            current.status = STATUS_ERROR
+            current.status_message = f"{type(exc).__name__}: {exc}"[:200]
+        raise
+    finally:
+        current.end()
+        _current.reset(token)
+        exporter.export(current)
+
+
+@contextmanager
+def child_span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Like `span`, but only inside an active trace; shared helpers use it so untraced callers stay span-free."""
+    if _current.get() is None:
+        yield None
+        return
+    with span(name, **attributes) as current:
+        yield current
+
+
+T = TypeVar("T")
+
+
+def traced(name: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Run an async function inside `span(name)`."""
+
+    def decorate(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with span(name):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(item: Span) -> Dict[str, Any]:
+    status: Dict[str, Any] = {"code": item.status}
+    if item.status_message:
+        status["message"] = item.status_message
+    encoded: Dict[str, Any] = {
+        "traceId": item.trace_id,
+        "spanId": item.span_id,
+        "name": item.name,
+        "kind": item.kind,
+        "startTimeUnixNano": str(item.start_ns),
+        "endTimeUnixNano": str(item.end_ns or item.start_ns),
+        "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in item.attributes.items()],
+        "status": status,
+    }
+    if item.parent_id:
+        encoded["parentSpanId"] = item.parent_id
+    return encoded
+
+
+def otlp_document(spans: List[Span]) -> Dict[str, Any]:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": TRACE_SERVICE_NAME}}]},
+                "scopeSpans": [{"scope": {"name": "app.tracing"}, "spans": [_otlp_span(item) for item in spans]}],
+            }
+        ]
+    }
+
+
+class SpanExporter:
+    """Buffers finished spans and writes them out every `flush_interval` seconds."""
+
+    def __init__(
+        self, mode: str = TRACE_EXPORT, max_buffer: int = TRACE_BUFFER_MAX, flush_interval: float = TRACE_FLUSH_S
+    ) -> None:
+        self.mode = mode if mode in ("file", "otlp") else ""
+        self.flush_interval = max(0.1, flush_interval)
+        self._buffer: Deque[Span] = deque(maxlen=max(1, max_buffer))
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._client: Any = None
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.mode)
+
+    def export(self, item: Span) -> None:
+        if not self.mode:
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(item)
+
+    def start(self) -> None:
+        if self.mode and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+            target = TRACE_FILE if self.mode == "file" else TRACE_OTLP_URL
+            print(f"[tracing] exporting spans ({self.mode}) to {target}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._buffer:
+            return
+        batch = list(self._buffer)
+        self._buffer.clear()
+        body = json.dumps(otlp_document(batch), separators=(",", ":"))
+        try:
+            if self.mode == "file":
+                await asyncio.to_thread(self._append, body)
+            else:
+                await self._post(body)
+        except Exception as exc:
+            self.failed += len(batch)
+            LOG.warning("Failed to export %s spans: %s", len(batch), exc)
+            return
+        self.exported += len(batch)
+
+    @staticmethod
+    def _append(body: str) -> None:
+        with open(TRACE_FILE, "a", encoding="utf-8") as handle:
+            handle.write(body + "\n")
+
+    async def _post(self, body: str) -> None:
+        import httpx
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=5.0)
+        resp = await self._client.post(TRACE_OTLP_URL, content=body, headers={"Content-Type": "application/json"})
+        resp.raise_for_status()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode or "off",
+            "buffered": len(self._buffer),
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+exporter = SpanExporter()
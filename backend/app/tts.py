@@ -0,0 +1,136 @@
+"""
+Text-to-speech synthesis runner.
+
+XTTS inference runs on a per-device thread pool (bounded by `concurrency_per_device`) instead of the event loop,
+and concurrent requests for the same cache key share one in-flight synthesis (single-flight).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import re
+import time
+from io import BytesIO
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+import soundfile as sf
+
+from app.instrumentation import TTS_SYNTH_SECONDS
+
+LOG = logging.getLogger("interview.tts")
+
+
+def output_sample_rate(model: Any) -> int:
+    return int(getattr(getattr(model, "synthesizer", None), "output_sample_rate", 24000) or 24000)
+
+
+def synthesize_wav(model: Any, text: str, speaker: Optional[str], language: str, speed: float) -> bytes:
+    wav = model.tts(text=text, speaker=speaker, language=language, speed=speed)
+    buf = BytesIO()
+    sf.write(buf, wav, output_sample_rate(model), format="WAV")
+    return buf.getvalue()
+
+
+def synthesize_pcm(model: Any, text: str, speaker: Optional[str], language: str, speed: float) -> bytes:
+    """Synthesize mono 16-bit little-endian PCM at the model's output sample rate."""
+    wav = model.tts(text=text, speaker=speaker, language=language, speed=speed)
+    samples = np.clip(np.asarray(wav, dtype=np.float32), -1.0, 1.0)
+    return (samples * 32767.0).astype("<i2").tobytes()
+
+
+def split_sentences(text: str, min_chars: int = 24) -> List[str]:
+    """Split on sentence punctuation, merging short fragments so prosody doesn't get choppy."""
+    parts = [p.strip() for p in re.split(r"(?<=[.!?…])\s+", (text or "").strip()) if p.strip()]
+    sentences: List[str] = []
+    for part in parts:
+        if sentences and len(sentences[-1]) < min_chars:
+            sentences[-1] = f"{sentences[-1]} {part}"
+        else:
+            sentences.append(part)
+    return sentences
+
+
+class TtsRunner:
+    def __init__(self, concurrency_per_device: int = 1) -> None:
+        self.concurrency_per_device = max(1, concurrency_per_device)
+        self.model: Any = None
+        self.device: str = "cpu"
+        self._executors: Dict[str, concurrent.futures.ThreadPoolExecutor] = {}
+        self._inflight: Dict[Hashable, "asyncio.Task[bytes]"] = {}
+        self.synthesized = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    def start(self, model: Any, device: str) -> None:
+        self.model = model
+        self.device = device
+
+    def shutdown(self) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+
+    def _executor(self, device: str) -> concurrent.futures.ThreadPoolExecutor:
+        executor = self._executors.get(device)
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.concurrency_per_device, thread_name_prefix=f"tts-{device}"
+            )
+            self._executors[device] = executor
+        return executor
+
+    async def _run(
+        self, fn: Callable[..., bytes], text: str, speaker: Optional[str], language: str, speed: float
+    ) -> bytes:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            audio = await loop.run_in_executor(
+                self._executor(self.device), fn, self.model, text, speaker, language, speed
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        TTS_SYNTH_SECONDS.observe(time.perf_counter() - started, format="pcm" if fn is synthesize_pcm else "wav")
+        self.synthesized += 1
+        return audio
+
+    async def synthesize(
+        self, key: Hashable, text: str, speaker: Optional[str], language: str, speed: float
+    ) -> bytes:
+        """Synthesize WAV bytes, joining an identical in-flight request instead of starting a second one."""
+        return await self._single_flight(("wav", key), synthesize_wav, text, speaker, language, speed)
+
+    async def synthesize_pcm(
+        self, key: Hashable, text: str, speaker: Optional[str], language: str, speed: float
+    ) -> bytes:
+        """Synthesize raw PCM for one chunk of a streamed utterance (also single-flight)."""
+        return await self._single_flight(("pcm", key), synthesize_pcm, text, speaker, language, speed)
+
+    async def _single_flight(
+        self, key: Hashable, fn: Callable[..., bytes], text: str, speaker: Optional[str], language: str, speed: float
+    ) -> bytes:
+        if self.model is None:
+            raise RuntimeError("tts model not loaded")
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.create_task(self._run(fn, text, speaker, language, speed))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one client disconnecting doesn't cancel the job other callers are waiting on.
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "device": self.device,
+            "concurrency_per_device": self.concurrency_per_device,
+            "in_flight": len(self._inflight),
+            "synthesized": self.synthesized,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+        }
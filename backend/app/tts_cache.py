@@ -0,0 +1,138 @@
+"""
+Content-addressed on-disk cache for synthesized speech.
+
+Entries are keyed on (text, style, speaker, language, speed, model, format), written atomically (temp file +
+rename) and evicted least-recently-used once the directory exceeds its byte budget. Hits bump the file mtime,
+so every uvicorn worker (and restarts) sharing the directory share one LRU.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.instrumentation import TTS_CACHE_REQUESTS
+
+LOG = logging.getLogger("interview.tts_cache")
+
+
+class DiskTtsCache:
+    def __init__(self, root: str, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(0, max_bytes)
+        self._approx_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    @staticmethod
+    def make_key(
+        text: str, style: str, speaker: Optional[str], language: str, speed: float, model_name: str, fmt: str = "wav"
+    ) -> str:
+        raw = json.dumps([text, style, speaker, language, round(speed, 4), model_name, fmt], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str, fmt: str = "wav") -> Path:
+        return self.root / key[:2] / f"{key}.{fmt}"
+
+    def get(self, key: str, fmt: str = "wav") -> Optional[Path]:
+        path = self.path_for(key, fmt)
+        try:
+            os.utime(path)  # LRU bump; also confirms the entry still exists
+        except OSError:
+            self.misses += 1
+            TTS_CACHE_REQUESTS.inc(result="miss")
+            return None
+        self.hits += 1
+        TTS_CACHE_REQUESTS.inc(result="hit")
+        return path
+
+    def read(self, key: str, fmt: str = "wav") -> Optional[bytes]:
+        """Entry bytes, or None on a miss; an entry evicted by another worker mid-read is a miss too."""
+        path = self.path_for(key, fmt)
+        try:
+            os.utime(path)
+            data = path.read_bytes()
+        except OSError:
+            self.misses += 1
+            TTS_CACHE_REQUESTS.inc(result="miss")
+            return None
+        self.hits += 1
+        TTS_CACHE_REQUESTS.inc(result="hit")
+        return data
+
+    def put(self, key: str, data: bytes, fmt: str = "wav") -> Path:
+        path = self.path_for(key, fmt)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._account(len(data))
+        return path
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries: List[Tuple[float, int, Path]] = []
+        if not self.root.exists():
+            return entries
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.startswith(".tmp-") or not entry.is_file():
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, Path(entry.path)))
+        return entries
+
+    def _account(self, added: int) -> None:
+        with self._lock:
+            if self._approx_bytes is None:
+                self._approx_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._approx_bytes += added
+            if self.max_bytes and self._approx_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Rescan: other workers write to the same directory, so the running total is only an estimate.
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                self.evicted += 1
+            except OSError:
+                pass
+            total -= size
+        self._approx_bytes = total
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "dir": str(self.root),
+            "max_bytes": self.max_bytes,
+            "approx_bytes": self._approx_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+        }
@@ -0,0 +1,174 @@
+"""
+Write-behind queue for append-only rows (telemetry, answers, check-ins).
+
+Handlers enqueue records and return immediately; a background task coalesces them into bulk
+`INSERT ... VALUES` batches flushed by size or time, so sockets don't serialize on the DB write lock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Type
+
+from sqlalchemy import insert
+from sqlmodel import SQLModel
+
+from app.db import get_session
+from app.tracing import child_span, span
+
+LOG = logging.getLogger("interview.writer")
+
+_STOP = object()
+
+# Extra work run inside each insert transaction (e.g. rollup maintenance); sees exactly the rows being committed.
+FlushHook = Callable[[Any, Sequence[SQLModel]], Awaitable[None]]
+
+
+class WriteBehindQueue:
+    def __init__(
+        self,
+        max_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.25,
+        put_timeout: float = 0.05,
+    ) -> None:
+        self.max_size = max(1, max_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.01, flush_interval)
+        self.put_timeout = max(0.0, put_timeout)
+        self._queue: Optional[asyncio.Queue[Any]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self.on_flush: Optional[FlushHook] = None
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush everything still queued and stop the background task."""
+        if self._task is None or self._queue is None:
+            return
+        if not self._task.done():
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
+        self._queue = None
+
+    async def put(self, record: SQLModel) -> bool:
+        """Enqueue a row; waits at most `put_timeout` when full (backpressure), then drops it."""
+        if self._task is None or self._task.done():
+            self.start()
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            # Only a full queue costs time, so only the backpressure wait shows up in turn traces.
+            with child_span("db.enqueue_wait", table=type(record).__name__):
+                try:
+                    await asyncio.wait_for(self._queue.put(record), timeout=self.put_timeout)
+                except asyncio.TimeoutError:
+                    self.dropped += 1
+                    if self.dropped == 1 or self.dropped % 100 == 0:
+                        LOG.warning("Write queue full (max=%s); dropped %s rows so far", self.max_size, self.dropped)
+                    return False
+        self.enqueued += 1
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            if item is _STOP:
+                return
+            batch: List[SQLModel] = [item]
+            stopping = False
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            if stopping:
+                # Drain whatever was queued behind the sentinel before exiting.
+                while not queue.empty():
+                    rest = [queue.get_nowait() for _ in range(min(queue.qsize(), self.batch_size))]
+                    await self._flush([r for r in rest if r is not _STOP])
+                return
+
+    async def _flush(self, batch: List[SQLModel]) -> None:
+        if not batch:
+            return
+        grouped: Dict[Type[SQLModel], List[Dict[str, Any]]] = defaultdict(list)
+        for record in batch:
+            grouped[type(record)].append(_row(record))
+        try:
+            with span("db.flush", rows=len(batch)):
+                async with get_session() as session:
+                    for model, rows in grouped.items():
+                        await session.execute(insert(model), rows)
+                    if self.on_flush is not None:
+                        await self.on_flush(session, batch)
+                    await session.commit()
+            self.written += len(batch)
+            self.batches += 1
+            return
+        except Exception as exc:
+            LOG.warning("Bulk insert of %s rows failed; retrying row by row: %s", len(batch), exc)
+        # Isolate the bad rows (e.g. an FK violation) so one record can't sink the whole batch.
+        for record in batch:
+            try:
+                async with get_session() as session:
+                    await session.execute(insert(type(record)), [_row(record)])
+                    if self.on_flush is not None:
+                        await self.on_flush(session, [record])
+                    await session.commit()
+                self.written += 1
+            except Exception as exc:
+                self.failed += 1
+                LOG.warning("Dropping %s row after insert failure: %s", type(record).__name__, exc)
+
+
+def _row(record: SQLModel) -> Dict[str, Any]:
+    data = record.model_dump()
+    if data.get("id") is None:
+        data.pop("id", None)
+    return data
+
+
+record_writer = WriteBehindQueue(
+    max_size=int(os.getenv("WRITE_QUEUE_MAX", "10000")),
+    batch_size=int(os.getenv("WRITE_BATCH_SIZE", "200")),
+    flush_interval=float(os.getenv("WRITE_FLUSH_MS", "250")) / 1000,
+    put_timeout=float(os.getenv("WRITE_PUT_TIMEOUT_MS", "50")) / 1000,
+)
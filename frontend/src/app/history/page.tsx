@@ -18,6 +18,8 @@ type SessionListItem = {
   avg_fillers?: number | null;
 };
 
+type SessionPage = { items?: SessionListItem[]; next_cursor?: string | null; error?: string };
+
 function formatMaybeNumber(value: number | null | undefined, digits = 0) {
   if (value === null || value === undefined || Number.isNaN(value)) return "—";
   return value.toFixed(digits);
@@ -34,6 +36,8 @@ export default function HistoryPage() {
   const [items, setItems] = useState<SessionListItem[]>([]);
   const [loading, setLoading] = useState<boolean>(true);
   const [error, setError] = useState<string>("");
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState<boolean>(false);
 
   useEffect(() => {
     let cancelled = false;
@@ -42,9 +46,12 @@ export default function HistoryPage() {
       setError("");
       try {
         const res = await fetch(`${HTTP_BASE}/sessions?limit=30`);
-        const json = (await res.json()) as { items?: SessionListItem[]; error?: string };
+        const json = (await res.json()) as SessionPage;
         if (!res.ok || json.error) throw new Error(json.error || "fetch_failed");
-        if (!cancelled) setItems(json.items ?? []);
+        if (!cancelled) {
+          setItems(json.items ?? []);
+          setNextCursor(json.next_cursor ?? null);
+        }
       } catch {
         if (!cancelled) setError("Couldn’t load session history. Make sure the backend is running.");
       } finally {
@@ -57,6 +64,22 @@ export default function HistoryPage() {
     };
   }, []);
 
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const res = await fetch(`${HTTP_BASE}/sessions?limit=30&cursor=${encodeURIComponent(nextCursor)}`);
+      const json = (await res.json()) as SessionPage;
+      if (!res.ok || json.error) throw new Error(json.error || "fetch_failed");
+      setItems((prev) => [...prev, ...(json.items ?? [])]);
+      setNextCursor(json.next_cursor ?? null);
+    } catch {
+      setError("Couldn’t load more sessions. Make sure the backend is running.");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const hasSessions = useMemo(() => items.length > 0, [items.length]);
 
   return (
@@ -138,6 +161,14 @@ export default function HistoryPage() {
                 </div>
               );
             })}
+
+          {!loading && !error && nextCursor && (
+            <div className={styles.buttonRow}>
+              <button className={styles.secondary} type="button" onClick={() => void loadMore()} disabled={loadingMore}>
+                {loadingMore ? "Loading…" : "Load more"}
+              </button>
+            </div>
+          )}
         </div>
       </div>
     </main>
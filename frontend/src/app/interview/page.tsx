@@ -67,6 +67,7 @@ function InterviewInner({ setup }: { setup: InterviewSetup | null }) {
     turn,
     interviewerCue,
     lastClarification,
+    streamingText,
     sessionEnded,
   } = useInterview();
 
@@ -250,7 +251,7 @@ function InterviewInner({ setup }: { setup: InterviewSetup | null }) {
           <div className={styles.statusRow}>
             <div>
               <p className={styles.kicker}>Current prompt</p>
-              <div className={styles.bigPrompt}>{question || "Start when you’re ready."}</div>
+              <div className={styles.bigPrompt}>{streamingText || question || "Start when you’re ready."}</div>
               <p className={styles.helper}>{ttsError ? ttsError : STYLE_HELP[style]}</p>
             </div>
             <div className={styles.buttonRow}>
@@ -39,6 +39,9 @@ export const initialAnalytics: Analytics = {
 
 export const WS_URL = process.env.NEXT_PUBLIC_WS_URL ?? "ws://localhost:8000/ws/interview";
 export const HTTP_BASE = (WS_URL.startsWith("ws") ? WS_URL.replace(/^ws/, "http") : WS_URL).replace(/\/ws\/interview$/, "");
+export const STT_WS_URL = WS_URL.replace(/\/ws\/interview$/, "/ws/stt");
+// Stream recorder chunks to /ws/stt while the candidate talks instead of uploading the clip afterwards.
+export const STREAMING_STT = process.env.NEXT_PUBLIC_STREAMING_STT === "1";
 
 export const STYLE_LABELS: Record<Style, string> = {
   supportive: "Supportive",
@@ -282,6 +285,7 @@ export function useInterview() {
   const [analytics, setAnalytics] = useState<Analytics>(initialAnalytics);
   const [interviewerCue, setInterviewerCue] = useState<InterviewerCue | null>(null);
   const [lastClarification, setLastClarification] = useState<string | null>(null);
+  const [streamingText, setStreamingText] = useState<string>("");
   const [sessionEnded, setSessionEnded] = useState<SessionEnded | null>(null);
   const pendingStart = useRef<{
     style: Style;
@@ -297,6 +301,10 @@ export function useInterview() {
   } | null>(null);
   const latencyRef = useRef<Record<number, number>>({});
   const cueSeqRef = useRef<number>(0);
+  // Live session to resume if the socket drops (cleared once the session ends or can't be resumed).
+  const resumeIdRef = useRef<string | null>(null);
+  const reconnectAttemptsRef = useRef<number>(0);
+  const connectRef = useRef<() => void>(() => {});
 
   const resetState = useCallback(() => {
     setMessages([]);
@@ -307,6 +315,7 @@ export function useInterview() {
     setAnalytics(initialAnalytics);
     setInterviewerCue(null);
     setLastClarification(null);
+    setStreamingText("");
     setSessionId(null);
     setGroup("treatment");
     setSessionEnded(null);
@@ -347,6 +356,8 @@ export function useInterview() {
         );
         setStatus("active");
         pendingStart.current = null;
+      } else if (resumeIdRef.current) {
+        ws.send(JSON.stringify({ type: "resume_session", session_id: resumeIdRef.current }));
       }
     };
 
@@ -379,8 +390,37 @@ export function useInterview() {
           }
           setSessionEnded(null);
           setStatus("active");
+          resumeIdRef.current = readString(data.session_id) ?? null;
+          reconnectAttemptsRef.current = 0;
+          break;
+        case "session_resumed":
+          setSessionId(readString(data.session_id) ?? null);
+          setStyle(readStyle(data.style) ?? "neutral");
+          setTurn(readNumber(data.turn) ?? 0);
+          {
+            const nextGroup = readGroup(data.group);
+            if (nextGroup) setGroup(nextGroup);
+            const resumedQuestion = readString(data.question);
+            if (resumedQuestion) setQuestion(resumedQuestion);
+          }
+          setStreamingText("");
+          reconnectAttemptsRef.current = 0;
+          if (data.ended === true) {
+            resumeIdRef.current = null;
+            setStatus("closed");
+          } else {
+            setStatus("active");
+          }
+          break;
+        case "question_delta":
+        case "interviewer_message_delta":
+          {
+            const delta = readString(data.delta);
+            if (delta) setStreamingText((prev) => prev + delta);
+          }
           break;
         case "question":
+          setStreamingText("");
           setQuestion(readString(data.question) ?? "");
           setQuestionPreface(readString(data.preface) ?? null);
           setStyle(readStyle(data.style) ?? style);
@@ -412,6 +452,8 @@ export function useInterview() {
             const reason = readString(data.reason) ?? "unknown";
             const endedTurn = readNumber(data.turn) ?? 0;
             setSessionEnded({ reason, message, turn: endedTurn });
+            resumeIdRef.current = null;
+            setStreamingText("");
             if (message) {
               setMessages((prev) => [
                 ...prev,
@@ -443,6 +485,7 @@ export function useInterview() {
           }
           break;
         case "interviewer_message":
+          setStreamingText("");
           setMessages((prev) => [
             ...prev,
             {
@@ -474,6 +517,7 @@ export function useInterview() {
         case "pong":
           break;
         case "error":
+          if (readString(data.error) === "session_not_found") resumeIdRef.current = null;
           setStatus("error");
           break;
         default:
@@ -486,15 +530,29 @@ export function useInterview() {
     };
 
     ws.onclose = () => {
+      if (resumeIdRef.current && reconnectAttemptsRef.current < 5) {
+        // Dropped mid-interview (e.g. a mobile network switch): reconnect and resume with backoff.
+        reconnectAttemptsRef.current += 1;
+        setStatus("connecting");
+        window.setTimeout(() => connectRef.current(), 500 * 2 ** (reconnectAttemptsRef.current - 1));
+        return;
+      }
       setStatus("closed");
     };
 
     setSocket(ws);
   }, [sendTelemetry, style]);
 
+  useEffect(() => {
+    connectRef.current = connect;
+  }, [connect]);
+
   useEffect(() => {
     return () => {
-      socket?.close();
+      if (!socket) return;
+      // Closing on purpose (unmount or replacing the socket): don't trigger the resume logic.
+      socket.onclose = null;
+      socket.close();
     };
   }, [socket]);
 
@@ -522,6 +580,7 @@ export function useInterview() {
       setSessionId(null);
       setInterviewerCue(null);
       setLastClarification(null);
+      setStreamingText("");
       setSessionEnded(null);
       if (socket && socket.readyState === WebSocket.OPEN) {
         socket.send(
@@ -560,6 +619,7 @@ export function useInterview() {
   );
 
   const stop = useCallback(() => {
+    resumeIdRef.current = null;
     socket?.close();
     resetState();
     setStatus("closed");
@@ -638,6 +698,7 @@ export function useInterview() {
     sendTelemetry,
     interviewerCue,
     lastClarification,
+    streamingText,
     sessionEnded,
   };
 }
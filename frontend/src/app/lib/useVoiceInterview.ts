@@ -7,6 +7,8 @@ import {
   InterviewerCue,
   MIN_RECORDING_MS,
   SILENCE_TIMEOUT_MS,
+  STREAMING_STT,
+  STT_WS_URL,
   SessionStatus,
   Style,
   initialAnalytics,
@@ -16,6 +18,14 @@ type SpeakDone = (() => void) | undefined;
 
 type VoiceSendMode = "answer" | "clarification";
 
+type SttStream = {
+  socket: WebSocket;
+  pending: Blob[];
+  failed: boolean;
+  done: boolean;
+  fallbackBlob: Blob | null;
+};
+
 export type LiveNudge = {
   kind: "pace" | "ramble" | "center";
   message: string;
@@ -218,6 +228,22 @@ export function useVoiceInterview({
     [analytics.gaze, sensorMetrics],
   );
 
+  const handleTranscript = useCallback(
+    (transcript: string) => {
+      setDraft(transcript);
+      if (autoSendVoice && transcript.trim()) {
+        if (recordingModeRef.current === "clarification" && sendClarification) {
+          sendClarification(transcript);
+        } else {
+          const finalMetrics = buildMetrics(transcript);
+          setAnalytics(finalMetrics);
+          sendAnswer(transcript, finalMetrics);
+        }
+      }
+    },
+    [autoSendVoice, buildMetrics, sendAnswer, sendClarification, setAnalytics],
+  );
+
   const sendToStt = useCallback(
     async (blob: Blob) => {
       setSttPending(true);
@@ -235,24 +261,64 @@ export function useVoiceInterview({
         if (!res.ok || json.error) {
           throw new Error(json.error || "Transcription failed");
         }
-        const transcript = (json.transcript as string) || "";
-        setDraft(transcript);
-        if (autoSendVoice && transcript.trim()) {
-          if (recordingModeRef.current === "clarification" && sendClarification) {
-            sendClarification(transcript);
-          } else {
-            const finalMetrics = buildMetrics(transcript);
-            setAnalytics(finalMetrics);
-            sendAnswer(transcript, finalMetrics);
-          }
-        }
+        handleTranscript((json.transcript as string) || "");
       } catch {
         setSttError("Transcription failed. Try again.");
       } finally {
         setSttPending(false);
       }
     },
-    [autoSendVoice, buildMetrics, sendAnswer, sendClarification, sessionId, setAnalytics],
+    [handleTranscript, sessionId],
+  );
+
+  const openSttStream = useCallback(
+    (mimeType: string): SttStream => {
+      const format = mimeType.includes("ogg") ? "ogg" : mimeType.includes("mp4") ? "mp4" : "webm";
+      const stream: SttStream = {
+        socket: new WebSocket(STT_WS_URL),
+        pending: [],
+        failed: false,
+        done: false,
+        fallbackBlob: null,
+      };
+      const fallBack = () => {
+        if (stream.done || stream.failed) return;
+        stream.failed = true;
+        // Streaming broke mid-answer: upload the full recording the old way.
+        if (stream.fallbackBlob) void sendToStt(stream.fallbackBlob);
+      };
+      stream.socket.onopen = () => {
+        stream.socket.send(JSON.stringify({ type: "start", format, sessionId }));
+        stream.pending.forEach((chunk) => stream.socket.send(chunk));
+        stream.pending = [];
+        if (stream.fallbackBlob) stream.socket.send(JSON.stringify({ type: "stop" }));
+      };
+      stream.socket.onmessage = (event) => {
+        let data: Record<string, unknown>;
+        try {
+          data = JSON.parse(String(event.data));
+        } catch {
+          return;
+        }
+        if (data.type === "partial" && typeof data.text === "string") {
+          setDraft(data.text);
+        } else if (data.type === "final" && typeof data.transcript === "string") {
+          setDraft(data.transcript);
+        } else if (data.type === "done") {
+          stream.done = true;
+          setSttPending(false);
+          stream.socket.close();
+          handleTranscript(typeof data.transcript === "string" ? data.transcript : "");
+        } else if (data.type === "error") {
+          fallBack();
+          stream.socket.close();
+        }
+      };
+      stream.socket.onerror = fallBack;
+      stream.socket.onclose = fallBack;
+      return stream;
+    },
+    [handleTranscript, sendToStt, sessionId],
   );
 
   const stopRecording = useCallback(() => {
@@ -304,21 +370,37 @@ export function useVoiceInterview({
 
       const recorder = new MediaRecorder(audioOnlyStream, mimeType ? { mimeType } : undefined);
       audioChunksRef.current = [];
+      const sttStream = STREAMING_STT ? openSttStream(recorder.mimeType || mimeType || "audio/webm") : null;
       recorder.ondataavailable = (event) => {
         if (event.data.size > 0) {
           audioChunksRef.current.push(event.data);
+          if (sttStream && !sttStream.failed) {
+            if (sttStream.socket.readyState === WebSocket.OPEN) sttStream.socket.send(event.data);
+            else sttStream.pending.push(event.data);
+          }
         }
       };
       recorder.onstop = () => {
         const blob = new Blob(audioChunksRef.current, { type: recorder.mimeType || "audio/webm" });
         audioChunksRef.current = [];
         if (ownsSourceStream) sourceStream.getTracks().forEach((track) => track.stop());
-        if (blob.size > 0) {
-          void sendToStt(blob);
+        if (blob.size === 0) {
+          sttStream?.socket.close();
+          return;
+        }
+        if (sttStream && !sttStream.failed) {
+          // Most of the answer is already transcribed; "stop" just flushes the tail.
+          sttStream.fallbackBlob = blob;
+          setSttPending(true);
+          setSttError("");
+          if (sttStream.socket.readyState === WebSocket.OPEN) sttStream.socket.send(JSON.stringify({ type: "stop" }));
+          return;
         }
+        void sendToStt(blob);
       };
       recorderRef.current = recorder;
-      recorder.start();
+      // Timeslices let chunks reach /ws/stt while the candidate is still talking.
+      recorder.start(sttStream ? 250 : undefined);
       recordStartRef.current = performance.now();
       lastVoiceRef.current = recordStartRef.current;
       setRecording(true);
@@ -345,7 +427,7 @@ export function useVoiceInterview({
       setSttError(message);
       setRecording(false);
     }
-  }, [mediaStream, recording, sendToStt, sttPending]);
+  }, [mediaStream, openSttStream, recording, sendToStt, sttPending]);
 
   useEffect(() => {
     if (status !== "active") {